@@ -1,6 +1,10 @@
+import hashlib
+import json
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Optional, Tuple, List
 
+from board_registry import intern_board
 from models.models import Board  # bei dir: models/models.py
 
 
@@ -34,6 +38,26 @@ def compute_capabilities(state: "AppState", role: str) -> Capabilities:
     return caps
 
 
+# Felder, die per Snapshot an Clients synchronisiert werden (Reihenfolge = Wire-Format)
+SYNC_FIELDS = (
+    "screen",
+    "selected",
+    "max_players",
+    "players",
+    "active_player_index",
+    "question_turn_owner_index",
+    "question_answerer_index",
+    "question_answer_revealed",
+    "buzzer_open",
+    "buzzed_queue",
+    "estimates",
+    "estimates_locked",
+    "estimates_revealed",
+    "question_asset_index",
+)
+_TRACKED_FIELDS = frozenset(SYNC_FIELDS) | {"board"}
+
+
 @dataclass
 class AppState:
     screen: str = "lobby"
@@ -52,6 +76,33 @@ class AppState:
     estimates_locked: list = field(default_factory=list)   # player_ids die eingeloggt haben
     estimates_revealed: list = field(default_factory=list) # player_ids deren Antwort aufgedeckt ist
     question_asset_index: int = 0  # welches Asset aktuell angezeigt wird
+    buzz_round: int = 0  # zählt geöffnete Buzzer/neue Fragen (nur serverseitig, nicht synchronisiert)
+
+    # (board, content_hash) – Hash wird pro Board-Objekt nur einmal berechnet
+    _board_hash_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # Seit dem letzten delta_snapshot() geänderte Felder (anfangs alle)
+    _dirty: set = field(default_factory=lambda: set(_TRACKED_FIELDS), init=False, repr=False, compare=False)
+    # Seit dem letzten take_view_delta() geänderte Felder (für die Ansicht dieser Session)
+    _view_dirty: set = field(default_factory=lambda: set(_TRACKED_FIELDS), init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in _TRACKED_FIELDS and "_view_dirty" in self.__dict__:
+            self._dirty.add(name)
+            self._view_dirty.add(name)
+
+    def mark_dirty(self, *names: str):
+        """Markiert Felder als geändert, die in-place mutiert wurden
+        (z.B. ``players[i].score``, ``estimates[pid]``, ``tile.used`` → "board")."""
+        self._dirty.update(names)
+        self._view_dirty.update(names)
+
+    def take_view_delta(self) -> frozenset:
+        """Namen der seit dem letzten Aufruf geänderten Felder; setzt die Markierung zurück.
+        Unabhängig von delta_snapshot(): Broadcast und Ansicht verbrauchen getrennt."""
+        delta = frozenset(self._view_dirty)
+        self._view_dirty = set()
+        return delta
 
     def remove_player(self, player_id: str):
         """Entfernt einen Spieler anhand seiner player_id."""
@@ -60,6 +111,7 @@ class AppState:
     def add_player(self, player_id: str, name: str) -> bool:
         """Fügt einen Spieler hinzu oder reconnectet ihn (anhand player_id oder Name).
         Gibt True zurück wenn es ein Reconnect war."""
+        self.mark_dirty("players")
         for p in self.players:
             if p.player_id == player_id:
                 p.name = name
@@ -79,26 +131,32 @@ class AppState:
             return
 
         if len(self.players) < self.max_players:
+            self.mark_dirty("players")
             start = len(self.players)
             for i in range(start, self.max_players):
                 self.players.append(Player(name=f"Spieler {i+1}"))
         elif len(self.players) > self.max_players:
             self.players = self.players[: self.max_players]
 
-        # active index absichern
+        # active index absichern; sicherstellen, dass genau einer "dran" ist
         if self.players:
-            self.active_player_index = max(0, min(self.active_player_index, len(self.players) - 1))
-            # sicherstellen, dass genau einer "dran" ist
             self.set_turn(self.active_player_index)
 
     def set_turn(self, index: int):
-        """Setzt den aktiven Spieler."""
+        """Setzt den aktiven Spieler. Markiert nur dirty, was sich wirklich ändert
+        (ensure_players läuft bei jedem View-Aufbau)."""
         if not self.players:
             return
         index = max(0, min(index, len(self.players) - 1))
-        self.active_player_index = index
+        if self.active_player_index != index:
+            self.active_player_index = index
+        changed = False
         for i, p in enumerate(self.players):
-            p.is_turn = (i == index)
+            if p.is_turn != (i == index):
+                p.is_turn = (i == index)
+                changed = True
+        if changed:
+            self.mark_dirty("players")
 
     def advance_turn(self, step: int = 1):
         """Wechselt zum nächsten Spieler (ringförmig)."""
@@ -128,11 +186,13 @@ class AppState:
         self.estimates_locked = []
         self.estimates_revealed = []
         self.question_asset_index = 0
+        self.buzz_round += 1
 
     def open_buzzer(self):
         """Host öffnet Buzzers für alle außer dem aktuellen Answerer."""
         self.buzzer_open = True
         self.buzzed_queue = []
+        self.buzz_round += 1
 
     def set_answerer(self, index: int):
         """Setzt den aktuell antwortenden Spieler (temporär)."""
@@ -154,6 +214,7 @@ class AppState:
         if board is None:
             return None
         return {
+            "title": board.title,
             "categories": [
                 {
                     "title": c.title,
@@ -172,7 +233,8 @@ class AppState:
                     ],
                 }
                 for c in board.categories
-            ]
+            ],
+            "asset_meta": board.asset_meta,
         }
 
     @staticmethod
@@ -199,7 +261,66 @@ class AppState:
                     )
                 )
             categories.append(Category(title=str(c.get("title", "")), tiles=tiles))
-        return Board(categories=categories)
+        return Board(categories=categories, title=str(data.get("title", "")),
+                     asset_meta={path: dict(meta) for path, meta in (data.get("asset_meta") or {}).items()})
+
+    @staticmethod
+    def _board_content_hash(board: Board) -> str:
+        """Hash über den Board-Inhalt ohne used-Flags (identifiziert das Board, nicht den Spielstand)."""
+        content = {
+            "title": board.title,
+            "categories": [
+                {
+                    "title": c.title,
+                    "tiles": [
+                        [t.value, t.question.type, t.question.prompt, t.question.answer, t.question.assets]
+                        for t in c.tiles
+                    ],
+                }
+                for c in board.categories
+            ],
+            "asset_meta": board.asset_meta,
+        }
+        raw = json.dumps(content, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def board_hash(self) -> Optional[str]:
+        """Content-Hash des aktuellen Boards (gecacht pro Board-Objekt)."""
+        if self.board is None:
+            return None
+        cached = self._board_hash_cache
+        if cached is not None and cached[0] is self.board:
+            return cached[1]
+        h = self._board_content_hash(self.board)
+        self._board_hash_cache = (self.board, h)
+        return h
+
+    @staticmethod
+    def _used_mask(board: Board) -> str:
+        """used-Flags als Hex-Bitmaske; Bit i = i-tes Tile (Kategorie für Kategorie)."""
+        mask = 0
+        bit = 0
+        for c in board.categories:
+            for t in c.tiles:
+                if t.used:
+                    mask |= 1 << bit
+                bit += 1
+        return format(mask, "x")
+
+    @staticmethod
+    def _apply_used_mask(board: Board, mask_hex: str) -> None:
+        mask = int(mask_hex or "0", 16)
+        bit = 0
+        for c in board.categories:
+            for t in c.tiles:
+                t.used = bool(mask >> bit & 1)
+                bit += 1
+
+    def board_progress(self) -> Optional[dict]:
+        """Kompakter Spielstand des Boards: {"hash": content_hash, "used": hex_bitmask}."""
+        if self.board is None:
+            return None
+        return {"hash": self.board_hash(), "used": self._used_mask(self.board)}
 
     @staticmethod
     def _players_to_list(players: List[Player]) -> list[dict]:
@@ -221,38 +342,87 @@ class AppState:
             )
         return out
 
+    def _serialize_field(self, name: str):
+        if name == "players":
+            return self._players_to_list(self.players)
+        if name == "estimates":
+            return dict(self.estimates)
+        if name in ("buzzed_queue", "estimates_locked", "estimates_revealed"):
+            return list(getattr(self, name))
+        return getattr(self, name)
+
     def snapshot(self, include_board: bool = True) -> dict:
         """Serialisierbarer Zustand für Multiplayer-Sync.
-        include_board=False sendet nur State-Deltas (kein Board) — spart Bandbreite
-        bei Events die das Board nicht verändern. Der Lobby-Store bekommt immer
-        include_board=True als Safety-Net für Reconnects."""
-        snap: dict = {
-            "screen": self.screen,
-            "selected": self.selected,
-            "max_players": self.max_players,
-            "players": self._players_to_list(self.players),
-            "active_player_index": self.active_player_index,
-            "question_turn_owner_index": self.question_turn_owner_index,
-            "question_answerer_index": self.question_answerer_index,
-            "question_answer_revealed": self.question_answer_revealed,
-            "buzzer_open": self.buzzer_open,
-            "buzzed_queue": list(self.buzzed_queue),
-            "estimates": dict(self.estimates),
-            "estimates_locked": list(self.estimates_locked),
-            "estimates_revealed": list(self.estimates_revealed),
-            "question_asset_index": self.question_asset_index,
-        }
+        include_board=False sendet nur State-Deltas (kein Board) — spart Bandbreite.
+        Benutzte Tiles reisen trotzdem mit, als "board_progress" (Content-Hash +
+        used-Bitmaske), sodass Clients ihr Board in-place aktualisieren können.
+        Der Lobby-Store bekommt immer include_board=True als Safety-Net für Reconnects."""
+        snap: dict = {name: self._serialize_field(name) for name in SYNC_FIELDS}
         if include_board:
             snap["board"] = self._board_to_dict(self.board)
+        progress = self.board_progress()
+        if progress is not None:
+            snap["board_progress"] = progress
         return snap
 
-    def apply_snapshot(self, snap: dict) -> None:
-        """Übernimmt einen Snapshot (vom Host) in den lokalen State."""
+    def delta_snapshot(self, include_board: bool = False) -> dict:
+        """Wie snapshot(), enthält aber nur die seit dem letzten Aufruf geänderten Felder.
+        Setzt die Dirty-Markierungen zurück. Ein geändertes Board wird als
+        board_progress übertragen, das volle Board nur mit include_board=True."""
+        dirty = self._dirty
+        self._dirty = set()
+        snap: dict = {name: self._serialize_field(name) for name in SYNC_FIELDS if name in dirty}
+        if include_board:
+            snap["board"] = self._board_to_dict(self.board)
+        if include_board or "board" in dirty:
+            progress = self.board_progress()
+            if progress is not None:
+                snap["board_progress"] = progress
+            elif not include_board:
+                snap["board"] = None
+        return snap
+
+    def fields_snapshot(self, names) -> dict:
+        """Snapshot nur der Felder ``names`` (z.B. aus take_view_delta()). Ein
+        geändertes Board reist wie bei delta_snapshot() als board_progress."""
+        snap: dict = {name: self._serialize_field(name) for name in SYNC_FIELDS if name in names}
+        if "board" in names:
+            progress = self.board_progress()
+            if progress is not None:
+                snap["board_progress"] = progress
+            else:
+                snap["board"] = None
+        return snap
+
+    def apply_snapshot(self, snap: dict) -> bool:
+        """Übernimmt einen Snapshot (vom Host) in den lokalen State.
+        ``snap`` darf read-only sein (frozen Pubsub-Payload); es wird immer kopiert.
+        Gibt False zurück, wenn "board_progress" nicht zum lokalen Board passt
+        (Hash weicht ab oder kein Board) — der Client braucht dann das volle Board."""
+        board_in_sync = True
+
         if "screen" in snap:
             self.screen = snap["screen"]
 
         if "board" in snap:
-            self.board = self._board_from_dict(snap.get("board"))
+            board_data = snap.get("board")
+            progress = snap.get("board_progress")
+            content_hash = progress.get("hash") if progress else None
+            if board_data and content_hash:
+                # Geteiltes Template pro Content-Hash; die Session bekommt nur eigene Tiles
+                self.board = intern_board(content_hash, lambda: self._board_from_dict(board_data))
+                # Hash vom Host übernehmen statt ihn lokal neu zu berechnen
+                self._board_hash_cache = (self.board, content_hash)
+            else:
+                self.board = self._board_from_dict(board_data)
+
+        progress = snap.get("board_progress")
+        if progress:
+            if self.board is not None and progress.get("hash") == self.board_hash():
+                self._apply_used_mask(self.board, progress.get("used", "0"))
+                self.mark_dirty("board")
+            else:
+                board_in_sync = False
 
         if "selected" in snap:
             self.selected = snap.get("selected")
@@ -299,8 +469,8 @@ class AppState:
             except Exception:
                 self.buzzed_queue = []
 
-        if "estimates" in snap and isinstance(snap["estimates"], dict):
-            self.estimates = snap["estimates"]
+        if "estimates" in snap and isinstance(snap["estimates"], Mapping):
+            self.estimates = dict(snap["estimates"])
 
         if "estimates_locked" in snap and snap["estimates_locked"] is not None:
             self.estimates_locked = list(snap["estimates_locked"])
@@ -312,4 +482,6 @@ class AppState:
             try:
                 self.question_asset_index = int(snap["question_asset_index"])
             except Exception:
-                self.question_asset_index = 0
\ No newline at end of file
+                self.question_asset_index = 0
+
+        return board_in_sync
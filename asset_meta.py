@@ -0,0 +1,171 @@
+"""Metadaten von Board-Assets, nur mit der Standardbibliothek ermittelt.
+
+- Bilder (PNG/JPEG): Breite und Höhe aus dem Datei-Header.
+- MP3: Dauer und mittlere Bitrate durch Scannen der Frame-Header (MPEG 1/2/2.5,
+  Layer I–III; ID3v2 am Anfang und ID3v1 am Ende werden übersprungen).
+- Alle Dateien: Größe in Bytes und SHA-256 des Inhalts.
+
+Die Funktionen hier lesen nur Dateien; Caching und Sidecar-Datei liegen in
+``board_loader``.
+"""
+from __future__ import annotations
+
+import hashlib
+import struct
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional
+
+IMAGE_SUFFIXES = frozenset({".png", ".jpg", ".jpeg"})
+AUDIO_SUFFIXES = frozenset({".mp3"})
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Bitraten (kbit/s) je (MPEG-1?, Layer); Index 0 = "free", 15 = ungültig
+_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Abtastraten je Versions-Bits (0 = MPEG 2.5, 2 = MPEG 2, 3 = MPEG 1)
+_SAMPLE_RATES = {0: (11025, 12000, 8000), 2: (22050, 24000, 16000), 3: (44100, 48000, 32000)}
+
+
+class Mp3Frame(NamedTuple):
+    offset: int
+    length: int
+    samples: int
+    sample_rate: int
+    bitrate_kbps: int
+    mpeg1: bool
+    layer: int
+    channels: int
+
+
+def parse_frame_header(data: bytes, offset: int) -> Optional[Mp3Frame]:
+    """Parst den 4-Byte-Frame-Header an ``offset``; None, wenn dort keiner beginnt."""
+    if offset + 4 > len(data):
+        return None
+    b1, b2, b3 = data[offset + 1], data[offset + 2], data[offset + 3]
+    if data[offset] != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+    version = (b1 >> 3) & 0x03
+    layer = 4 - ((b1 >> 1) & 0x03)
+    bitrate_idx = b2 >> 4
+    rate_idx = (b2 >> 2) & 0x03
+    if version == 1 or layer == 4 or bitrate_idx in (0, 15) or rate_idx == 3:
+        return None
+    mpeg1 = version == 3
+    bitrate = _BITRATES[(mpeg1, layer)][bitrate_idx]
+    sample_rate = _SAMPLE_RATES[version][rate_idx]
+    padding = (b2 >> 1) & 0x01
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate * 1000 // sample_rate + padding) * 4
+    else:
+        samples = 1152 if (layer == 2 or mpeg1) else 576
+        length = (samples // 8) * bitrate * 1000 // sample_rate + padding
+    channels = 1 if (b3 >> 6) == 3 else 2
+    return Mp3Frame(offset, length, samples, sample_rate, bitrate, mpeg1, layer, channels)
+
+
+def _id3v2_size(data: bytes) -> int:
+    """Länge eines ID3v2-Tags am Dateianfang (inkl. Header/Footer), sonst 0."""
+    if len(data) < 10 or data[:3] != b"ID3":
+        return 0
+    size = (data[6] & 0x7F) << 21 | (data[7] & 0x7F) << 14 | (data[8] & 0x7F) << 7 | (data[9] & 0x7F)
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _is_info_frame(data: bytes, frame: Mp3Frame) -> bool:
+    """Xing/Info- bzw. VBRI-Frame eines Encoders: enthält kein Audio."""
+    side_info = (32 if frame.channels == 2 else 17) if frame.mpeg1 else (17 if frame.channels == 2 else 9)
+    at = frame.offset + 4 + side_info
+    return data[at:at + 4] in (b"Xing", b"Info") or data[frame.offset + 36:frame.offset + 40] == b"VBRI"
+
+
+def iter_mp3_frames(data: bytes) -> Iterator[Mp3Frame]:
+    """Alle Audio-Frames der Datei. Nach Müll wird bis zum nächsten Header
+    resynchronisiert, der von einem weiteren gültigen Header gefolgt wird;
+    ein Xing/Info-Frame am Anfang zählt nicht als Audio."""
+    end = len(data) - 128 if data[-128:-125] == b"TAG" else len(data)
+    pos = _id3v2_size(data)
+    first = True
+    while pos + 4 <= end:
+        frame = parse_frame_header(data, pos)
+        if frame is not None and frame.length > 4 and pos + frame.length <= end:
+            nxt = pos + frame.length
+            # Am Dateiende gibt es keinen Folge-Header; sonst muss er passen
+            if nxt + 4 > end or parse_frame_header(data, nxt) is not None:
+                if not (first and frame.layer == 3 and _is_info_frame(data, frame)):
+                    yield frame
+                first = False
+                pos = nxt
+                continue
+        pos = data.find(b"\xff", pos + 1, end)
+        if pos < 0:
+            return
+
+
+def probe_mp3(data: bytes) -> Optional[dict]:
+    """Dauer (ms), mittlere Bitrate (kbit/s), Abtastrate und Frame-Anzahl."""
+    frames = samples = audio_bytes = 0
+    sample_rate = 0
+    for frame in iter_mp3_frames(data):
+        frames += 1
+        samples += frame.samples
+        audio_bytes += frame.length
+        sample_rate = sample_rate or frame.sample_rate
+    if not frames:
+        return None
+    duration_ms = samples * 1000 // sample_rate
+    return {
+        "duration_ms": duration_ms,
+        "bitrate_kbps": round(audio_bytes * 8 / duration_ms) if duration_ms else 0,
+        "sample_rate": sample_rate,
+        "frames": frames,
+    }
+
+
+def probe_image(data: bytes) -> Optional[tuple[int, int]]:
+    """(Breite, Höhe) aus dem PNG- bzw. JPEG-Header; None bei anderen Formaten."""
+    if data[:8] == _PNG_SIGNATURE and data[12:16] == b"IHDR":
+        return struct.unpack(">II", data[16:24])
+    if data[:2] == b"\xff\xd8":
+        pos = 2
+        while pos + 9 <= len(data):
+            if data[pos] != 0xFF:
+                pos += 1
+                continue
+            marker = data[pos + 1]
+            if marker == 0xFF:          # Füll-Byte
+                pos += 1
+                continue
+            if marker in (0x01, 0xD8) or 0xD0 <= marker <= 0xD7:
+                pos += 2                # Marker ohne Länge
+                continue
+            # SOF0..SOF15 außer DHT (C4), JPG (C8), DAC (CC)
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                h, w = struct.unpack(">HH", data[pos + 5:pos + 9])
+                return w, h
+            (seg_len,) = struct.unpack(">H", data[pos + 2:pos + 4])
+            pos += 2 + seg_len
+    return None
+
+
+def probe_file(path: Path) -> dict:
+    """Metadaten einer Asset-Datei: size, sha256 und je nach Typ width/height
+    bzw. duration_ms/bitrate_kbps/sample_rate/frames."""
+    data = Path(path).read_bytes()
+    meta: dict = {"size": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+    suffix = Path(path).suffix.lower()
+    if suffix in IMAGE_SUFFIXES:
+        dims = probe_image(data)
+        if dims:
+            meta["width"], meta["height"] = dims
+    elif suffix in AUDIO_SUFFIXES:
+        meta.update(probe_mp3(data) or {})
+    return meta
@@ -0,0 +1,72 @@
+"""Blockierende Datei-I/O aus der Event-Loop auslagern.
+
+Flet führt synchrone Event-Handler direkt auf der Event-Loop aus. Ein Host, der
+auf einer langsamen Platte oder einem Netzlaufwerk ein Board speichert, hält
+damit alle Lobbys des Prozesses an. Die Funktionen hier laufen in einem
+prozessweiten, begrenzten Thread-Pool; die Views ``await``-en sie.
+
+    board = await async_io.load_board(board_id)
+    ok = await async_io.run_io(_save_board, board_id, ...)
+
+``load_board`` erledigt auch alles, was die Frage-Ansicht an Dateien bräuchte:
+Asset-Sidecar prüfen/schreiben (board_loader) und Peaks nachschlagen
+(waveform_peaks). Beim Rendern liest die View nur ``Board.asset_meta``.
+Bewusst ausgenommen: ``AudioService.load_sounds`` prüft einmal pro Session per
+``exists()``, welche der drei mitgelieferten Effekt-Dateien da sind — lokale
+App-Assets, kein Board-Verzeichnis.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, TypeVar
+
+import board_loader
+import waveform_peaks
+from models.models import Board
+
+T = TypeVar("T")
+
+IO_WORKERS = int(os.environ.get("JEOPARDY_IO_WORKERS", "4"))
+
+_executor = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="jeopardy-io")
+
+
+async def run_io(fn: Callable[..., T], *args, **kwargs) -> T:
+    """Führt ``fn(*args, **kwargs)`` im I/O-Pool aus; Exceptions kommen beim await an."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(fn, *args, **kwargs))
+
+
+def _load_board(board_id: str) -> Board:
+    board = board_loader.load_board(board_id)
+    waveform_peaks.attach_peaks(board)
+    return board
+
+
+async def load_board(board_id: str) -> Board:
+    """Board samt Asset-Metadaten und Peaks; die Views lesen danach nur noch Dicts."""
+    return await run_io(_load_board, board_id)
+
+
+async def list_boards() -> list[tuple[str, str, bool]]:
+    return await run_io(board_loader.list_boards)
+
+
+async def write_bytes(path: Path, data: bytes) -> None:
+    """Schreibt ``data`` nach ``path``; das Verzeichnis wird bei Bedarf angelegt."""
+    def _write():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    await run_io(_write)
+
+
+async def copy_file(src: str | Path, dest: Path) -> None:
+    def _copy():
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src, dest)
+    await run_io(_copy)
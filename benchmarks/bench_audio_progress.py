@@ -0,0 +1,116 @@
+"""
+Benchmark: WebSocket-Frames pro Sekunde und zuhörendem Client beim Frage-Audio.
+
+Ein 30-Sekunden-Clip, Position alle 100 ms (wie die Progress-Schleife):
+- bisher: alle 24 Balken neu einfärben, ``waveform_row.update()`` und
+  ``time_text.update()`` pro Tick,
+- Loop-Fallback: ``WaveformProgress.show_fraction`` pusht nur geänderte Balken,
+  der Zeittext nur, wenn sich der String ändert,
+- animiert: ein Start-Event, der Client animiert; eine Pause, Ende.
+
+Ein Frame ist ein ``update()`` mit nicht-leerem Patch (leere Patches schickt
+Flet nicht). Bytes wie im Socket-Server per MessagePack.
+
+Verwendung:
+    python -m benchmarks.bench_audio_progress
+"""
+import flet as ft
+import msgpack
+from flet.controls.base_control import BaseControl
+from flet.controls.object_patch import ObjectPatch
+from flet.messaging.protocol import configure_encode_object_for_msgpack
+
+from views.components.waveform import WaveformProgress
+
+CLIP_MS = 30_000
+TICK_MS = 100
+HEIGHTS = [8 + (i * 37) % 44 for i in range(24)]
+
+_encode = configure_encode_object_for_msgpack(BaseControl)
+
+
+class _Wire:
+    """Zählt Diff-Durchläufe, gesendete Frames und Bytes wie Session.patch_control."""
+
+    def __init__(self):
+        self.diffs = self.frames = self.bytes = 0
+
+    def mount(self, root: ft.Control) -> None:
+        patch, _, _ = ObjectPatch.from_diff(None, root, control_cls=BaseControl)
+        msgpack.packb(patch.to_message(), default=_encode)
+
+    def push(self, *controls: ft.Control) -> None:
+        for c in controls:
+            self.diffs += 1
+            patch = ObjectPatch.from_diff(c, c, control_cls=BaseControl)[0].to_message()
+            if len(patch) > 1:
+                self.frames += 1
+                self.bytes += len(msgpack.packb(patch, default=_encode))
+
+
+def _fmt(ms: int) -> str:
+    s = ms // 1000
+    return f"{s // 60}:{s % 60:02d}"
+
+
+def run_old() -> _Wire:
+    wire = _Wire()
+    bars = [ft.Container(width=5, height=h, bgcolor="outline", border_radius=2) for h in HEIGHTS]
+    row = ft.Row(controls=bars, spacing=3)
+    time_text = ft.Text("0:00 / --:--")
+    wire.mount(ft.Column(controls=[row, time_text]))
+    for pos in range(0, CLIP_MS + 1, TICK_MS):
+        filled = int(pos / CLIP_MS * len(bars))
+        for j, bar in enumerate(bars):
+            bar.bgcolor = "primary" if j < filled else "outline"
+        time_text.value = f"{_fmt(pos)} / {_fmt(CLIP_MS)}"
+        wire.push(row, time_text)
+    return wire
+
+
+def run_loop() -> _Wire:
+    wire = _Wire()
+    waveform = WaveformProgress(HEIGHTS, push=wire.push)
+    time_text = ft.Text("0:00 / --:--")
+    wire.mount(ft.Column(controls=[waveform, time_text]))
+    for pos in range(0, CLIP_MS + 1, TICK_MS):
+        waveform.show_fraction(pos / CLIP_MS)
+        value = f"{_fmt(pos)} / {_fmt(CLIP_MS)}"
+        if time_text.value != value:
+            time_text.value = value
+            wire.push(time_text)
+    waveform.reset()
+    return wire
+
+
+def run_animated() -> _Wire:
+    wire = _Wire()
+    waveform = WaveformProgress(HEIGHTS, push=wire.push)
+    time_text = ft.Text("0:00 / --:--")
+    wire.mount(ft.Column(controls=[waveform, time_text]))
+    waveform.animate_from(0, CLIP_MS)
+    time_text.value = f"▶ {_fmt(CLIP_MS)}"
+    wire.push(time_text)
+    # Pause bei 12 s, Resume, Ende
+    waveform.hold_at(12_000, CLIP_MS)
+    time_text.value = f"{_fmt(12_000)} / {_fmt(CLIP_MS)}"
+    wire.push(time_text)
+    waveform.animate_from(12_000, CLIP_MS)
+    waveform.reset()
+    time_text.value = f"0:00 / {_fmt(CLIP_MS)}"
+    wire.push(time_text)
+    return wire
+
+
+def main():
+    seconds = CLIP_MS / 1000
+    print(f"Clip {seconds:.0f} s, Tick {TICK_MS} ms, 24 Balken — pro zuhörendem Client\n")
+    print(f"{'Modus':<14} {'Diffs':>7} {'Frames':>7} {'Frames/s':>9} {'Bytes':>8} {'B/s':>7}")
+    for name, run in (("bisher", run_old), ("Loop-Fallback", run_loop), ("animiert", run_animated)):
+        w = run()
+        print(f"{name:<14} {w.diffs:>7} {w.frames:>7} {w.frames / seconds:>9.2f} "
+              f"{w.bytes:>8} {w.bytes / seconds:>7.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark: Speicherbedarf der Boards aller Sessions im Prozess.
+
+Simuliert LOBBIES Lobbies mit je SESSIONS Sessions (Host + Spieler). Jede Session
+bekommt den Snapshot als eigenen JSON-String (wie über Pubsub) und baut daraus
+ihr Board. Verglichen wird der alte Weg (eigener Objekt-Graph pro Session via
+``AppState._board_from_dict``) mit geteilten Templates aus ``board_registry``.
+
+Verwendung:
+    python -m benchmarks.bench_board_memory
+"""
+import gc
+import json
+import tracemalloc
+
+from app_state import AppState
+from board_registry import clear_templates
+from models.models import Board, Category, Question, Tile
+
+LOBBIES = 100
+SESSIONS = 9
+DISTINCT_BOARDS = [100, 10]  # 100 = jede Lobby eigenes Board, 10 = beliebte Boards
+
+
+def make_board(seed: int, cols: int = 6, rows: int = 5) -> Board:
+    filler = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 3
+    return Board(
+        title=f"Board {seed}",
+        categories=[
+            Category(
+                title=f"Kategorie {seed}-{c}",
+                tiles=[
+                    Tile(
+                        value=(r + 1) * 100,
+                        question=Question(
+                            prompt=f"Frage {seed}-{c}-{r}: {filler}",
+                            answer=f"Antwort {seed}-{c}-{r}: {filler[:60]}",
+                            type="image",
+                            assets=[f"/srv/boards/b{seed}/images/{c}_{r}.png"],
+                        ),
+                    )
+                    for r in range(rows)
+                ],
+            )
+            for c in range(cols)
+        ],
+    )
+
+
+def _payloads(distinct: int) -> list[str]:
+    out = []
+    for seed in range(distinct):
+        host = AppState()
+        host.board = make_board(seed)
+        out.append(json.dumps(host.snapshot(include_board=True)))
+    return out
+
+
+def measure(distinct: int, interned: bool) -> int:
+    payloads = _payloads(distinct)
+    clear_templates()
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+
+    sessions = []
+    for lobby in range(LOBBIES):
+        payload = payloads[lobby % distinct]
+        for _ in range(SESSIONS):
+            snap = json.loads(payload)  # jede Session dekodiert selbst
+            if interned:
+                s = AppState()
+                s.apply_snapshot(snap)
+                sessions.append(s.board)
+            else:
+                sessions.append(AppState._board_from_dict(snap["board"]))
+            del snap
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    return used
+
+
+def main():
+    print(f"{LOBBIES} Lobbies × {SESSIONS} Sessions, Board 6×5\n")
+    print(f"{'Boards':>7} {'vorher MB':>10} {'nachher MB':>11} {'Ersparnis':>10}")
+    for distinct in DISTINCT_BOARDS:
+        before = measure(distinct, interned=False)
+        after = measure(distinct, interned=True)
+        print(f"{distinct:>7} {before / 1e6:>10.2f} {after / 1e6:>11.2f} {1 - after / before:>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
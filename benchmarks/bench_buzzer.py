@@ -0,0 +1,130 @@
+"""
+Benchmark: Buzzer-Latenz (Klick → Host-Entscheidung) und Fairness.
+
+8 simulierte Spieler buzzern pro Runde innerhalb von JITTER_MS. Die Klicks laufen
+wie in Flet in Executor-Threads, die Host-Inbox über den echten ``PubSubHub`` mit
+Executor. Verglichen wird der alte Weg (erster Handler, der ``_buzz_lock`` bekommt,
+gewinnt) mit ``buzzer.BuzzArbiter`` bei verschiedenen Arbitrierungsfenstern.
+
+Mit ``load`` laufen parallel Handler anderer Lobbies (0–3 ms CPU) im selben
+Executor, wie in einem vollen Prozess.
+
+Latenz = Entscheidung − frühester Klick. Fair = Gewinner ist der früheste Klick.
+
+Verwendung:
+    python -m benchmarks.bench_buzzer
+"""
+import asyncio
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from flet.pubsub.pubsub_client import PubSubClient
+from flet.pubsub.pubsub_hub import PubSubHub
+
+from buzzer import BuzzArbiter
+from lobby_messages import PlayerBuzz, parse
+from lobby_pubsub import LobbyChannel, decode
+
+PLAYERS = 8
+ROUNDS = 300
+JITTER_MS = 2.0
+WINDOWS_MS = [0, 3, 10]
+LOAD_JOBS = 24
+
+
+def _busy(ms: float):
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+def _percentile(values: list[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+async def _run(mode: str, window_s: float = 0.0, load: bool = False) -> tuple[list[float], float]:
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=PLAYERS)
+    hub = PubSubHub(loop=loop, executor=executor)
+    clicks = ThreadPoolExecutor(max_workers=PLAYERS)
+    lock = threading.Lock()
+    rnd = {"open": True, "winner": None, "decided_ns": 0, "done": None}
+
+    def _decided(winner: str, decided_ns: int):
+        rnd["winner"], rnd["decided_ns"] = winner, decided_ns
+        loop.call_soon_threadsafe(rnd["done"].set)
+
+    arbiter = BuzzArbiter(
+        lambda fn, *args: asyncio.run_coroutine_threadsafe(fn(*args), loop),
+        lambda d: _decided(d.winner, d.decided_ns),
+        window_s,
+    )
+
+    def on_host(message):
+        msg = parse("player_buzz", decode(message).payload)
+        if mode == "arbiter":
+            if rnd["open"]:
+                arbiter.submit(msg.player_id, msg.t_ns)
+            return
+        with lock:
+            if rnd["open"]:
+                rnd["open"] = False
+                _decided(msg.player_id, time.monotonic_ns())
+
+    host = LobbyChannel(PubSubClient(hub, "host"), on_host)
+    host.join("L1", host=True)
+    players = []
+    for i in range(PLAYERS):
+        ch = LobbyChannel(PubSubClient(hub, f"p{i}"), lambda _m: None)
+        ch.join("L1")
+        players.append(ch)
+
+    latencies, fair = [], 0
+    for _ in range(ROUNDS):
+        rnd.update(open=True, winner=None, done=asyncio.Event())
+        stamps: dict[str, int] = {}
+
+        def click(i: int):
+            t = time.monotonic_ns()
+            stamps[f"p{i}"] = t
+            players[i].send_to_host(PlayerBuzz(player_id=f"p{i}", t_ns=t).to_message("L1"))
+
+        if load:
+            for _ in range(LOAD_JOBS):
+                loop.call_later(random.uniform(0, JITTER_MS) / 1000, loop.run_in_executor,
+                                executor, _busy, random.uniform(0, 3))
+        for i in range(PLAYERS):
+            loop.call_later(random.uniform(0, JITTER_MS) / 1000, loop.run_in_executor, clicks, click, i)
+        await rnd["done"].wait()
+        rnd["open"] = False
+        await asyncio.sleep(JITTER_MS / 1000 + window_s + 0.005)  # Nachzügler abwarten
+        if load:
+            await asyncio.sleep(0.03)
+
+        earliest = min(stamps, key=stamps.get)
+        latencies.append((rnd["decided_ns"] - stamps[earliest]) / 1e6)
+        fair += rnd["winner"] == earliest
+    clicks.shutdown()
+    executor.shutdown()
+    return latencies, fair / ROUNDS
+
+
+def main():
+    print(f"{PLAYERS} Spieler, {ROUNDS} Runden, Klicks innerhalb {JITTER_MS} ms\n")
+    runs = [("lock", "alt (_buzz_lock)", 0.0)]
+    runs += [("arbiter", f"Arbiter {w} ms", w / 1000) for w in WINDOWS_MS]
+    for load in (False, True):
+        print("mit Last anderer Lobbies" if load else "Prozess im Leerlauf")
+        print(f"{'Pfad':>16} {'p50 ms':>8} {'p99 ms':>8} {'fair':>6}")
+        for mode, label, window_s in runs:
+            lat, fair = asyncio.run(_run(mode, window_s, load))
+            print(f"{label:>16} {statistics.median(lat):>8.2f} {_percentile(lat, 0.99):>8.2f} {fair:>6.0%}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
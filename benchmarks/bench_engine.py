@@ -0,0 +1,86 @@
+"""
+Benchmark: Durchsatz der headless GameEngine ohne UI.
+
+LOBBIES Lobbies mit je PLAYERS Spielern, alles über den echten ``PubSubHub``
+mit Executor (wie im Server). Jeder Spieler tritt bei und schickt ESTIMATES
+Live-Schätzungen; gemessen wird die Zeit, bis alle Intents angewendet sind.
+
+Verwendung:
+    python -m benchmarks.bench_engine
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from flet.pubsub.pubsub_client import PubSubClient
+from flet.pubsub.pubsub_hub import PubSubHub
+
+from app_state import AppState
+from game_engine import ESTIMATE, REFRESH, GameEngine, loop_runner
+from lobby_messages import PlayerEstimate, PlayerJoin
+from lobby_pubsub import LobbyChannel
+from lobby_store import LOBBIES
+from models.models import build_dummy_board
+
+PLAYERS = 8
+ESTIMATES = 50
+LOBBY_COUNTS = [1, 10, 50, 100]
+
+
+async def _run(lobbies: int) -> float:
+    loop = asyncio.get_running_loop()
+    hub = PubSubHub(loop=loop, executor=ThreadPoolExecutor(max_workers=16))
+    run_task = loop_runner(loop)
+    expected = lobbies * PLAYERS * (1 + ESTIMATES)
+    applied = [0]
+    done = asyncio.Event()
+
+    def on_event(event: str, _snap: dict):
+        if event not in (ESTIMATE, REFRESH):
+            return
+        applied[0] += 1
+        if applied[0] == expected:
+            loop.call_soon_threadsafe(done.set)
+
+    engines = []
+    for l in range(lobbies):
+        state = AppState()
+        state.board = build_dummy_board()
+        engine = GameEngine(f"B{l}", state, PubSubClient(hub, f"engine{l}"), run_task)
+        engine.add_listener(on_event)
+        engines.append(engine)
+
+    players = []
+    for l in range(lobbies):
+        for p in range(PLAYERS):
+            ch = LobbyChannel(PubSubClient(hub, f"s{l}-{p}"), lambda _m: None)
+            ch.join(f"B{l}")
+            players.append((f"B{l}", f"p{p}", ch))
+
+    t0 = time.perf_counter()
+    for lobby_id, pid, ch in players:
+        ch.send_to_host(PlayerJoin(player_id=pid, name=pid).to_message(lobby_id))
+    for i in range(ESTIMATES):
+        for lobby_id, pid, ch in players:
+            ch.send_to_host(PlayerEstimate(player_id=pid, answer=str(i)).to_message(lobby_id))
+        await asyncio.sleep(0)
+    await asyncio.wait_for(done.wait(), timeout=120)
+    elapsed = time.perf_counter() - t0
+
+    for engine in engines:
+        engine.stop()
+        LOBBIES.pop(engine.lobby_id, None)
+    return elapsed
+
+
+def main():
+    print(f"{PLAYERS} Spieler pro Lobby, je 1 Join + {ESTIMATES} Schätzungen\n")
+    print(f"{'Lobbies':>8} {'Intents':>9} {'gesamt ms':>10} {'Intents/s':>11}")
+    for lobbies in LOBBY_COUNTS:
+        intents = lobbies * PLAYERS * (1 + ESTIMATES)
+        elapsed = asyncio.run(_run(lobbies))
+        print(f"{lobbies:>8} {intents:>9} {elapsed * 1000:>10.0f} {intents / elapsed:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: Event-Loop-Lag, während mehrere Hosts gleichzeitig Boards speichern.
+
+Ein Ticker schläft in einer Schleife TICK_MS und misst, wie viel später er
+aufwacht (= wie lange die Loop blockiert war, z.B. für Buzzes anderer Lobbys).
+Parallel speichern HOSTS Hosts je SAVES-mal ein 10×10-Board über
+``_save_board``; SLOW_DISK_MS simuliert pro Speichern ein langsames Laufwerk
+bzw. Netzlaufwerk (blockierender ``time.sleep`` neben dem echten Schreiben).
+
+- synchron: ``_save_board`` direkt im Handler (bisher),
+- I/O-Pool: ``await async_io.run_io(_save_board, ...)``.
+
+Verwendung:
+    python -m benchmarks.bench_io_lag
+"""
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import async_io
+import board_loader
+import views.board_editor as board_editor
+from views.board_editor import _CatData, _QData, _save_board
+
+TICK_MS = 5
+HOSTS_COUNTS = [1, 4, 16]
+SAVES = 5
+SLOW_DISK_MS = 20
+
+
+def _cats() -> list[_CatData]:
+    return [
+        _CatData(title=f"Kategorie {c}", questions=[
+            _QData(value=(q + 1) * 100, prompt=f"Frage {c}/{q} " * 20, answer=f"Antwort {c}/{q}")
+            for q in range(10)
+        ])
+        for c in range(10)
+    ]
+
+
+def _slow_save(*args) -> bool:
+    result = _save_board(*args)
+    time.sleep(SLOW_DISK_MS / 1000)
+    return result
+
+
+async def _ticker(stop: asyncio.Event, lags: list[float]) -> None:
+    while not stop.is_set():
+        t = time.perf_counter()
+        await asyncio.sleep(TICK_MS / 1000)
+        lags.append((time.perf_counter() - t) * 1000 - TICK_MS)
+
+
+async def _host(i: int, cats, offload: bool) -> None:
+    for _ in range(SAVES):
+        args = (f"bench{i}", f"Board {i}", cats, 10, 10)
+        if offload:
+            await async_io.run_io(_slow_save, *args)
+        else:
+            _slow_save(*args)
+        await asyncio.sleep(0)  # Handler-Ende: die Loop kommt wieder dran
+
+
+async def _run(hosts: int, offload: bool) -> tuple[list[float], float]:
+    cats = _cats()
+    stop = asyncio.Event()
+    lags: list[float] = []
+    ticker = asyncio.create_task(_ticker(stop, lags))
+    await asyncio.sleep(0.05)
+    t = time.perf_counter()
+    await asyncio.gather(*(_host(i, cats, offload) for i in range(hosts)))
+    elapsed = time.perf_counter() - t
+    stop.set()
+    await ticker
+    return lags, elapsed
+
+
+def main():
+    print(f"Tick {TICK_MS} ms, {SAVES} Saves pro Host, +{SLOW_DISK_MS} ms langsames Laufwerk, "
+          f"I/O-Pool {async_io.IO_WORKERS} Threads\n")
+    print(f"{'Hosts':>5} {'Modus':<9} {'Lag p50':>8} {'p99':>8} {'max':>8} {'Dauer':>8}")
+    with tempfile.TemporaryDirectory() as tmp, \
+            patch.object(board_loader, "BOARDS_DIR", Path(tmp)), \
+            patch.object(board_editor, "BOARDS_DIR", Path(tmp)):
+        for hosts in HOSTS_COUNTS:
+            for name, offload in (("synchron", False), ("I/O-Pool", True)):
+                lags, elapsed = asyncio.run(_run(hosts, offload))
+                lags.sort()
+                p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+                print(f"{hosts:>5} {name:<9} {statistics.median(lags):>6.1f}ms {p99:>6.1f}ms "
+                      f"{lags[-1]:>6.1f}ms {elapsed:>6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
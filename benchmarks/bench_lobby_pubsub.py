@@ -0,0 +1,95 @@
+"""
+Benchmark: Fan-out-Kosten pro Nachricht bei wachsender Lobby-Anzahl.
+
+Vergleicht das alte Muster (``send_all`` an alle Sessions, jede Session macht
+``json.loads`` und verwirft fremde Lobbies) mit Lobby-Topics über
+``lobby_pubsub.LobbyChannel`` und mit der Host-Inbox für Spieler-Intents.
+Benutzt den echten Flet-``PubSubHub`` ohne Executor, d.h. Handler laufen synchron
+und die Messung enthält den kompletten Fan-out.
+
+Verwendung:
+    python -m benchmarks.bench_lobby_pubsub
+"""
+import asyncio
+import json
+import time
+
+from flet.pubsub.pubsub_client import PubSubClient
+from flet.pubsub.pubsub_hub import PubSubHub
+
+from lobby_pubsub import LobbyChannel, decode
+
+SESSIONS_PER_LOBBY = 8
+LOBBY_COUNTS = [1, 10, 50, 100, 200]
+MESSAGES = 2000
+
+
+def _make_hub() -> PubSubHub:
+    return PubSubHub(loop=asyncio.new_event_loop())
+
+
+def bench_send_all(lobbies: int) -> float:
+    """Altes Muster: globales Abo + clientseitiger lobby_id-Filter."""
+    hub = _make_hub()
+    handled = [0]
+
+    def make_handler(my_lobby: str):
+        def _on_pubsub(message: str):
+            msg = json.loads(message)
+            if msg.get("lobby_id") != my_lobby:
+                return
+            handled[0] += 1
+        return _on_pubsub
+
+    for l in range(lobbies):
+        for s in range(SESSIONS_PER_LOBBY):
+            hub.subscribe(f"s{l}-{s}", make_handler(f"L{l}"))
+
+    sender = PubSubClient(hub, "s0-0")
+    payload = json.dumps({"type": "player_buzz", "lobby_id": "L0", "player_id": "p1"})
+    t0 = time.perf_counter()
+    for _ in range(MESSAGES):
+        sender.send_all(payload)
+    return (time.perf_counter() - t0) / MESSAGES
+
+
+def bench_topics(lobbies: int, to_host: bool = False) -> float:
+    """Neues Muster: jede Session abonniert nur ihr Lobby-Topic, der Host (Session 0)
+    zusätzlich seine Inbox. ``to_host=True`` schickt den Buzz nur an die Inbox."""
+    hub = _make_hub()
+    handled = [0]
+
+    def _on_pubsub(message):
+        decode(message)
+        handled[0] += 1
+
+    channels = []
+    for l in range(lobbies):
+        for s in range(SESSIONS_PER_LOBBY):
+            ch = LobbyChannel(PubSubClient(hub, f"s{l}-{s}"), _on_pubsub)
+            ch.join(f"L{l}", host=s == 0)
+            channels.append(ch)
+
+    sender = channels[1]
+    send = sender.send_to_host if to_host else sender.send
+    msg = {"type": "player_buzz", "lobby_id": "L0", "player_id": "p1"}
+    t0 = time.perf_counter()
+    for _ in range(MESSAGES):
+        send(msg)
+    return (time.perf_counter() - t0) / MESSAGES
+
+
+def main():
+    print(f"{SESSIONS_PER_LOBBY} Sessions pro Lobby, {MESSAGES} Nachrichten pro Messung\n")
+    print(f"{'Lobbies':>8} {'Sessions':>9} {'send_all µs/msg':>16} {'topic µs/msg':>13} "
+          f"{'Inbox µs/msg':>13} {'Faktor':>7}")
+    for lobbies in LOBBY_COUNTS:
+        old = bench_send_all(lobbies)
+        new = bench_topics(lobbies)
+        inbox = bench_topics(lobbies, to_host=True)
+        print(f"{lobbies:>8} {lobbies * SESSIONS_PER_LOBBY:>9} "
+              f"{old * 1e6:>16.1f} {new * 1e6:>13.1f} {inbox * 1e6:>13.1f} {old / inbox:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: Dekodier-CPU pro Broadcast bei wachsender Session-Zahl.
+
+Alt: Host sendet ``json.dumps(msg)``, jede Session macht ``json.loads`` (inkl.
+Board). Neu: ``LobbyChannel`` verpackt die Nachricht einmal in einen frozen
+``LobbyEnvelope``, alle Sessions lesen dasselbe Objekt.
+
+Verwendung:
+    python -m benchmarks.bench_pubsub_decode
+"""
+import asyncio
+import json
+import time
+
+from flet.pubsub.pubsub_client import PubSubClient
+from flet.pubsub.pubsub_hub import PubSubHub
+
+from app_state import AppState
+from lobby_pubsub import LobbyChannel, decode, lobby_topic
+from benchmarks.bench_board_memory import make_board
+
+SESSION_COUNTS = [8, 32, 128, 512]
+BROADCASTS = 200
+
+
+def _message() -> dict:
+    host = AppState()
+    host.board = make_board(1)
+    host.ensure_players()
+    return {"type": "lobby_state", "lobby_id": "L1", "version": 1,
+            "data": host.snapshot(include_board=True)}
+
+
+def bench_json(sessions: int, msg: dict) -> float:
+    hub = PubSubHub(loop=asyncio.new_event_loop())
+
+    def _on_pubsub(_topic, message: str):
+        data = json.loads(message)
+        data.get("data")
+
+    for s in range(sessions):
+        hub.subscribe_topic(f"s{s}", lobby_topic("L1"), _on_pubsub)
+    sender = PubSubClient(hub, "s0")
+    t0 = time.perf_counter()
+    for _ in range(BROADCASTS):
+        sender.send_all_on_topic(lobby_topic("L1"), json.dumps(msg))
+    return (time.perf_counter() - t0) / BROADCASTS
+
+
+def bench_envelope(sessions: int, msg: dict) -> float:
+    hub = PubSubHub(loop=asyncio.new_event_loop())
+
+    def _on_pubsub(message):
+        env = decode(message)
+        env.payload.get("data")
+
+    channels = []
+    for s in range(sessions):
+        ch = LobbyChannel(PubSubClient(hub, f"s{s}"), _on_pubsub)
+        ch.join("L1")
+        channels.append(ch)
+    t0 = time.perf_counter()
+    for _ in range(BROADCASTS):
+        channels[0].send(msg)
+    return (time.perf_counter() - t0) / BROADCASTS
+
+
+def main():
+    msg = _message()
+    print(f"lobby_state mit Board 6×5 ({len(json.dumps(msg))} Bytes JSON), {BROADCASTS} Broadcasts\n")
+    print(f"{'Sessions':>9} {'json µs/Broadcast':>18} {'Envelope µs/Broadcast':>22}")
+    for sessions in SESSION_COUNTS:
+        old = bench_json(sessions, msg)
+        new = bench_envelope(sessions, msg)
+        print(f"{sessions:>9} {old * 1e6:>18.0f} {new * 1e6:>22.0f}")
+
+
+if __name__ == "__main__":
+    main()
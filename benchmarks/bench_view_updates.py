@@ -0,0 +1,193 @@
+"""
+Benchmark: WebSocket-Bytes und neu angelegte Controls pro Event —
+Neuaufbau vs. data["apply"] / data["recompute"].
+
+Für jedes Event wird der Screen einmal wie bisher komplett neu gebaut
+(``page.views.clear()`` + neuer Baum) und einmal per ``apply(delta)`` in-place
+nachgezogen. Gemessen wird der Patch, den Flet an den Browser schicken würde:
+``ObjectPatch.from_diff`` + MessagePack-Encoding wie im Socket-Server.
+
+Flet diffed bei jedem Button ein leeres ``_internals`` mit, auch wenn sich nichts
+geändert hat (Host-Board ~3,8 KB, Host-Grid 10×10 ~12,5 KB). Dieses Grundrauschen
+wird vor dem Event gemessen und von den ``apply``-Bytes abgezogen; der Neuaufbau
+ersetzt den Teilbaum komplett und enthält es nicht.
+
+Die Views brauchen nur ``session.store``, ``width`` und ``run_task`` der Page;
+dafür reicht hier ein schlanker Ersatz ohne Verbindung.
+
+Verwendung:
+    python -m benchmarks.bench_view_updates
+"""
+from types import SimpleNamespace
+
+import flet as ft
+import msgpack
+from flet.controls.base_control import BaseControl
+from flet.controls.object_patch import ObjectPatch
+from flet.messaging.protocol import configure_encode_object_for_msgpack
+
+from app_state import AppState
+from models.models import build_dummy_board
+from views.board import board_view
+from views.board_grid import board_grid_view
+from views.lobby import lobby_view
+from views.question import question_view
+
+_encode = configure_encode_object_for_msgpack(BaseControl)
+
+
+class _Store(dict):
+    def set(self, key, value):
+        self[key] = value
+
+
+def _page(role: str):
+    store = _Store(role=role, lobby_id="BENCH", player_id="p0")
+    return SimpleNamespace(
+        session=SimpleNamespace(store=store), width=1400,
+        run_task=lambda *_a, **_k: None, update=lambda *_a: None,
+        on_resize=None, on_keyboard_event=None,
+    )
+
+
+def _noop_bytes(root) -> int:
+    """Patch-Bytes ohne jede Änderung (Flets ``_internals``-Diff der Buttons)."""
+    return _patch_bytes(root, root)[0]
+
+
+def _patch_bytes(prev, root) -> tuple[int, int]:
+    """Bytes und neu angelegte Controls des Patches prev -> root."""
+    patch, added, _removed = ObjectPatch.from_diff(prev, root, control_cls=BaseControl)
+    return len(msgpack.packb(patch.to_message(), default=_encode)), len(added)
+
+
+def _state(screen: str, q_type: str = "text") -> AppState:
+    state = AppState()
+    state.board = build_dummy_board()
+    for i in range(4):
+        state.add_player(f"p{i}", f"Spieler {i + 1}")
+    state.set_turn(0)
+    state.screen = screen
+    if screen == "question":
+        state.selected = (2, 3)
+        state.board.categories[2].tiles[3].question.type = q_type
+        state.start_question_round()
+    return state
+
+
+def _build(page, state: AppState) -> ft.Control:
+    noop = lambda *_a, **_k: None
+    if state.screen == "lobby":
+        return lobby_view(page, state, noop, submit=noop)
+    if state.screen == "board":
+        return board_view(page, state, noop, noop)
+    return question_view(page, state, noop, noop)
+
+
+# Events: (Name, Rolle, Screen, Fragetyp, Mutation)
+def _tile_used(s):
+    s.board.categories[0].tiles[0].used = True
+    s.mark_dirty("board")
+
+
+def _score(s):
+    s.players[1].score += 200
+    s.mark_dirty("players")
+
+
+def _buzz(s):
+    s.buzzed_queue = [2]
+    s.set_answerer(2)
+    s.buzzer_open = False
+
+
+def _lock(s):
+    s.estimates["p1"] = "1850"
+    s.estimates_locked = ["p1"]
+
+
+def _join(s):
+    s.add_player("p9", "Neu")
+
+
+EVENTS = [
+    ("Tile benutzt", "player", "board", "text", _tile_used),
+    ("Turn gewechselt", "host", "board", "text", lambda s: s.set_turn(2)),
+    ("Punkte geändert", "host", "board", "text", _score),
+    ("Punkte geändert", "player", "board", "text", _score),
+    ("Antwort aufgedeckt", "player", "question", "text", lambda s: setattr(s, "question_answer_revealed", True)),
+    ("Buzz entschieden", "host", "question", "text", _buzz),
+    ("Schätzung eingeloggt", "host", "question", "estimate", _lock),
+    ("Spieler beigetreten", "host", "lobby", "text", _join),
+]
+
+
+def _measure(role, screen, q_type, mutate, incremental: bool) -> tuple[int, int]:
+    page = _page(role)
+    state = _state(screen, q_type)
+    if screen == "lobby":
+        state.players = state.players[:2]
+    root = ft.Column(controls=[_build(page, state)])
+    _patch_bytes(None, root)  # Erstaufbau, danach kennt der "Client" den Baum
+    state.take_view_delta()
+
+    mutate(state)
+    if incremental:
+        noise = _noop_bytes(root)
+        assert root.controls[0].data["apply"](state.take_view_delta())
+        size, added = _patch_bytes(root, root)
+        return size - noise, added
+    root.controls = [_build(page, state)]
+    return _patch_bytes(root, root)
+
+
+def _grid_measure(role: str, event: str, incremental: bool) -> tuple[int, int]:
+    """Board-Grid 10×10 allein: Tile benutzen bzw. Fenster verbreitern."""
+    page = _page(role)
+    state = AppState()
+    state.board = build_dummy_board(cols=10)
+    extra = build_dummy_board(cols=10)  # Dummy-Boards haben max. 5 Zeilen → verdoppeln
+    for cat, more in zip(state.board.categories, extra.categories):
+        cat.tiles.extend(more.tiles)
+    root = ft.Column(controls=[board_grid_view(page, state, can_pick_tile=role == "host")])
+    _patch_bytes(None, root)
+    state.take_view_delta()
+    noise = _noop_bytes(root) if incremental else 0
+
+    if event == "used":
+        _tile_used(state)
+        if incremental:
+            assert root.controls[0].data["apply"](state.take_view_delta())
+    else:
+        page.width = 2600
+        if incremental:
+            root.controls[0].data["recompute"](page.width, 16)
+    if not incremental:
+        # bisher: jedes Event baute den kompletten Grid-Baum neu
+        root.controls = [board_grid_view(page, state, can_pick_tile=role == "host")]
+    size, added = _patch_bytes(root, root)
+    return size - noise, added
+
+
+def main():
+    print(f"{'Event':<22} {'Rolle':<7} {'Rebuild B':>10} {'apply B':>9} {'Faktor':>7} "
+          f"{'Controls alt':>13} {'neu':>5}")
+    for name, role, screen, q_type, mutate in EVENTS:
+        full, full_added = _measure(role, screen, q_type, mutate, incremental=False)
+        inc, inc_added = _measure(role, screen, q_type, mutate, incremental=True)
+        print(f"{name:<22} {role:<7} {full:>10} {inc:>9} {full / max(1, inc):>6.1f}x "
+              f"{full_added:>13} {inc_added:>5}")
+
+    print("\nBoard-Grid 10×10 allein\n")
+    print(f"{'Event':<22} {'Rolle':<7} {'Rebuild B':>10} {'apply B':>9} {'Faktor':>7} "
+          f"{'Controls alt':>13} {'neu':>5}")
+    for name, event in (("Tile benutzt", "used"), ("Resize", "resize")):
+        for role in ("host", "player"):
+            full, full_added = _grid_measure(role, event, incremental=False)
+            inc, inc_added = _grid_measure(role, event, incremental=True)
+            print(f"{name:<22} {role:<7} {full:>10} {inc:>9} {full / max(1, inc):>6.1f}x "
+                  f"{full_added:>13} {inc_added:>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Simulation: Buzzer-Fairness bei unterschiedlicher Netzwerklatenz.
+
+4 Spieler im LAN (~3 ms one-way) gegen 4 Spieler über Mobilfunk/Tunnel
+(50–150 ms one-way, also 100–300 ms mehr RTT). Alle reagieren gleich schnell
+(Reaktionszeit ~ N(350 ms, 60 ms)); fair wäre also je 50 % Siege pro Gruppe.
+
+Verglichen wird
+- Eingangsreihenfolge (bisheriges Verhalten),
+- Korrektur um die geschätzte Uplink-Latenz aus ``clock_sync`` (8 Pings pro
+  Spieler, Minimum-Filter, Korrektur ≤ schnellster Spieler + MAX_SPREAD_NS),
+  Arbitrierungsfenster um die Latenzspreizung verlängert.
+
+Im zweiten Durchlauf verzögert Spieler ``m3`` seine Ping-Antworten um 400 ms
+(Manipulationsversuch); sein Vorteil ist durch die begrenzte Spreizung gedeckelt.
+
+Verwendung:
+    python -m benchmarks.sim_buzz_fairness
+"""
+import random
+
+import clock_sync
+from buzzer import BUZZ_WINDOW_S
+
+ROUNDS = 20_000
+MS = 1_000_000
+CHEATER = "m3"
+CHEAT_DELAY_NS = 400 * MS
+
+
+def _players(rnd: random.Random) -> dict[str, int]:
+    """player_id -> Basis-Latenz one-way (ns)."""
+    players = {f"l{i}": 3 * MS for i in range(4)}
+    players.update({f"m{i}": int(rnd.uniform(50, 150) * MS) for i in range(4)})
+    return players
+
+
+def _jitter(rnd: random.Random, base_ns: int) -> int:
+    """Netzwerk-Jitter: exponentiell, proportional zur Basis-Latenz."""
+    return int(rnd.expovariate(1 / (0.15 * base_ns + 0.5 * MS)))
+
+
+def simulate(cheater: bool):
+    rnd = random.Random(7)
+    players = _players(rnd)
+
+    for pid, one_way in players.items():
+        clock_sync.forget(pid)
+        clock_sync.track(pid)
+        for _ in range(8):
+            rtt = 2 * one_way + _jitter(rnd, one_way) + _jitter(rnd, one_way)
+            if cheater and pid == CHEATER:
+                rtt += CHEAT_DELAY_NS
+            clock_sync.record_rtt(pid, rtt)
+
+    window = int(BUZZ_WINDOW_S * 1e9) + clock_sync.latency_spread_ns(players)
+    wins = {"arrival": {}, "corrected": {}}
+    correct = {"arrival": 0, "corrected": 0}
+
+    for _ in range(ROUNDS):
+        clicks = {pid: int(rnd.gauss(350, 60) * MS) for pid in players}
+        arrivals = {pid: clicks[pid] + players[pid] + _jitter(rnd, players[pid]) for pid in players}
+        first_click = min(clicks, key=clicks.get)
+
+        by_arrival = min(arrivals, key=arrivals.get)
+        first_arrival = arrivals[by_arrival]
+        in_window = [pid for pid in players if arrivals[pid] <= first_arrival + window]
+        by_corrected = min(in_window, key=lambda pid: clock_sync.corrected_stamp(pid, arrivals[pid], players))
+
+        for mode, winner in (("arrival", by_arrival), ("corrected", by_corrected)):
+            wins[mode][winner] = wins[mode].get(winner, 0) + 1
+            correct[mode] += winner == first_click
+
+    print(f"{'Mit' if cheater else 'Ohne'} Manipulation: {ROUNDS} Runden, 4× LAN vs. 4× Mobil, "
+          f"Fenster {window / MS:.0f} ms (Basis {BUZZ_WINDOW_S * 1000:.0f} ms + Spreizung)\n")
+    print(f"{'Spieler':>8} {'one-way ms':>11} {'Korrektur ms':>13} {'Siege alt':>10} {'Siege neu':>10}")
+    for pid, one_way in players.items():
+        corr = clock_sync.correction_ns(pid, players)
+        label = f"{pid}*" if cheater and pid == CHEATER else pid
+        print(f"{label:>8} {one_way / MS:>11.0f} {corr / MS:>13.0f} "
+              f"{wins['arrival'].get(pid, 0) / ROUNDS:>10.1%} {wins['corrected'].get(pid, 0) / ROUNDS:>10.1%}")
+
+    def group(mode: str, prefix: str) -> float:
+        return sum(n for pid, n in wins[mode].items() if pid.startswith(prefix)) / ROUNDS
+
+    print(f"\n{'':>8} {'LAN gesamt':>11} {'Mobil gesamt':>13} {'richtiger Gewinner':>19}")
+    for mode, label in (("arrival", "alt"), ("corrected", "neu")):
+        print(f"{label:>8} {group(mode, 'l'):>11.1%} {group(mode, 'm'):>13.1%} {correct[mode] / ROUNDS:>19.1%}")
+    if cheater:
+        print(f"\n* {CHEATER} verzögert Ping-Antworten um {CHEAT_DELAY_NS / MS:.0f} ms; "
+              f"Korrektur gedeckelt bei schnellstem Spieler + {clock_sync.MAX_SPREAD_NS / MS:.0f} ms")
+    print()
+
+
+def main():
+    simulate(cheater=False)
+    simulate(cheater=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,48 +1,305 @@
 import json
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
-from models.models import Board, Category, Tile, Question
+from asset_meta import AUDIO_SUFFIXES, IMAGE_SUFFIXES, probe_file
+from models.models import Board, Category, Tile, Question, fresh_copy
 
 BOARDS_DIR = Path(os.environ.get("JEOPARDY_BOARDS_DIR", Path(__file__).parent / "boards"))
 
+# Prozessweiter Cache geparster Boards: json_path -> ((mtime_ns, size), Template, Bytes).
+# Templates werden nie verändert; jedes Spiel bekommt per fresh_copy() eigene used-Flags.
+_BOARD_CACHE_MAX_BYTES = int(os.environ.get("JEOPARDY_BOARD_CACHE_MB", "64")) * 1024 * 1024
+_BOARD_CACHE: "OrderedDict[str, tuple[tuple[int, int], Board, int]]" = OrderedDict()
+_BOARD_CACHE_BYTES = [0]
+_board_cache_lock = threading.Lock()
+
+
+CATALOG_FILE = ".catalog.json"
+_CATALOG_VERSION = 1
+# Im Prozess gehaltener Katalog: (boards_dir, {board_id: Metadaten})
+_CATALOG: list = [None, {}]
+_catalog_lock = threading.Lock()
+
+ASSET_META_FILE = ".assets.json"
+_ASSET_META_VERSION = 1
+# Felder, die Board.asset_meta für die Views mitnimmt (Hash, mtime etc. bleiben im Sidecar)
+RENDER_META_KEYS = ("width", "height", "duration_ms")
+# Im Prozess gehaltene Asset-Metadaten: aufgelöstes Board-Verzeichnis -> {rel. Pfad: Metadaten}
+_ASSET_META: dict[str, dict[str, dict]] = {}
+_asset_meta_lock = threading.Lock()
+
 
 def list_boards() -> list[tuple[str, str, bool]]:
     """Gibt eine sortierte Liste von (board_id, title, wip) aller gültigen Boards zurück."""
-    result = []
+    return [
+        (board_id, meta["title"], meta["wip"])
+        for board_id, meta in board_catalog().items()
+        if not meta.get("invalid")
+    ]
+
+
+def board_catalog() -> dict[str, dict]:
+    """Metadaten aller Boards (title, wip, num_categories, num_questions, asset_count),
+    sortiert nach board_id. Der Katalog wird in boards/.catalog.json persistiert;
+    pro Aufruf werden nur Boards neu gelesen, deren board.json sich geändert hat
+    (mtime/Größe). Ungültige Boards stehen mit "invalid": True drin."""
     if not BOARDS_DIR.exists():
-        return result
-    for entry in sorted(BOARDS_DIR.iterdir()):
-        if not entry.is_dir():
-            continue
-        json_path = entry / "board.json"
-        if not json_path.exists():
-            continue
+        return {}
+    with _catalog_lock:
+        if _CATALOG[0] != BOARDS_DIR:
+            _CATALOG[0] = BOARDS_DIR
+            _CATALOG[1] = _read_catalog_file()
+        known: dict[str, dict] = _CATALOG[1]
+
+        fresh: dict[str, dict] = {}
+        changed = False
+        for entry in os.scandir(BOARDS_DIR):
+            if not entry.is_dir():
+                continue
+            json_path = Path(entry.path) / "board.json"
+            try:
+                st = json_path.stat()
+            except FileNotFoundError:
+                continue
+            meta = known.get(entry.name)
+            if meta is None or meta.get("mtime_ns") != st.st_mtime_ns or meta.get("size") != st.st_size:
+                meta = _read_board_meta(entry.name, json_path)
+                meta["mtime_ns"] = st.st_mtime_ns
+                meta["size"] = st.st_size
+                changed = True
+            fresh[entry.name] = meta
+
+        if changed or fresh.keys() != known.keys():
+            _CATALOG[1] = fresh
+            _write_catalog_file(fresh)
+        return {board_id: fresh[board_id] for board_id in sorted(fresh)}
+
+
+def _read_board_meta(board_id: str, json_path: Path) -> dict:
+    try:
+        data = json.loads(json_path.read_text(encoding="utf-8"))
+        categories = data.get("categories", [])
+        asset_count = 0
+        for c in categories:
+            for t in c.get("tiles", []):
+                q = t.get("question", {})
+                raw_assets = q.get("assets")
+                if raw_assets is None:
+                    raw_assets = [q.get("asset")]
+                asset_count += sum(1 for a in raw_assets if a)
+        return {
+            "title": data.get("title", board_id),
+            "wip": bool(data.get("wip", False)),
+            "num_categories": len(categories),
+            "num_questions": max((len(c.get("tiles", [])) for c in categories), default=0),
+            "asset_count": asset_count,
+        }
+    except Exception:
+        return {"invalid": True}
+
+
+def _read_catalog_file() -> dict:
+    try:
+        raw = json.loads((BOARDS_DIR / CATALOG_FILE).read_text(encoding="utf-8"))
+        if raw.get("version") == _CATALOG_VERSION and isinstance(raw.get("boards"), dict):
+            return raw["boards"]
+    except Exception:
+        pass
+    return {}
+
+
+def _write_catalog_file(boards: dict) -> None:
+    write_json_atomic(BOARDS_DIR / CATALOG_FILE, {"version": _CATALOG_VERSION, "boards": boards})
+
+
+def write_json_atomic(path: Path, payload: dict) -> None:
+    """Schreibt JSON atomar (tmp + replace); Fehler (z.B. read-only) werden ignoriert."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
         try:
-            data = json.loads(json_path.read_text(encoding="utf-8"))
-            title = data.get("title", entry.name)
-            wip = bool(data.get("wip", False))
-            result.append((entry.name, title, wip))
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def board_asset_meta(board_id: str) -> dict[str, dict]:
+    """Metadaten aller Bild- und Audio-Assets eines Boards, nach Pfad relativ zum
+    Board-Verzeichnis (z.B. "sounds/x.mp3"). Persistiert in boards/<id>/.assets.json;
+    neu vermessen werden nur Dateien, deren mtime/Größe sich geändert hat."""
+    board_dir = (BOARDS_DIR / board_id).resolve()
+    if not board_dir.is_dir():
+        return {}
+    with _asset_meta_lock:
+        known = _asset_meta_entries(board_dir)
+        fresh: dict[str, dict] = {}
+        changed = False
+        for root, dirs, files in os.walk(board_dir):
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            for name in files:
+                if Path(name).suffix.lower() not in IMAGE_SUFFIXES | AUDIO_SUFFIXES:
+                    continue
+                path = Path(root) / name
+                rel = path.relative_to(board_dir).as_posix()
+                meta = known.get(rel)
+                if meta is None or not _asset_meta_current(meta, path):
+                    meta = _probe_asset(path)
+                    if meta is None:
+                        continue
+                    changed = True
+                fresh[rel] = meta
+        if changed or fresh.keys() != known.keys():
+            _store_asset_meta(board_dir, fresh)
+        return dict(fresh)
+
+
+def asset_meta(asset_path: str) -> dict | None:
+    """Metadaten eines aufgelösten Asset-Pfads (wie in Question.assets), None wenn
+    die Datei fehlt. Ein stat() prüft den Eintrag; vermessen wird nur bei Änderung."""
+    path = Path(asset_path)
+    try:
+        rel = path.relative_to(BOARDS_DIR.resolve())
+    except ValueError:
+        return None
+    if len(rel.parts) < 2:
+        return None
+    board_dir = BOARDS_DIR.resolve() / rel.parts[0]
+    rel_in_board = Path(*rel.parts[1:]).as_posix()
+    with _asset_meta_lock:
+        entries = _asset_meta_entries(board_dir)
+        meta = entries.get(rel_in_board)
+        if meta is not None and _asset_meta_current(meta, path):
+            return meta
+        meta = _probe_asset(path)
+        if meta is None:
+            return None
+        _store_asset_meta(board_dir, {**entries, rel_in_board: meta})
+        return meta
+
+
+def _asset_meta_entries(board_dir: Path) -> dict[str, dict]:
+    """Einträge aus dem Prozess-Cache, sonst aus der Sidecar-Datei (Lock gehalten)."""
+    entries = _ASSET_META.get(str(board_dir))
+    if entries is None:
+        entries = {}
+        try:
+            raw = json.loads((board_dir / ASSET_META_FILE).read_text(encoding="utf-8"))
+            if raw.get("version") == _ASSET_META_VERSION and isinstance(raw.get("assets"), dict):
+                entries = raw["assets"]
         except Exception:
             pass
-    return result
+        _ASSET_META[str(board_dir)] = entries
+    return entries
+
+
+def _store_asset_meta(board_dir: Path, entries: dict[str, dict]) -> None:
+    _ASSET_META[str(board_dir)] = entries
+    write_json_atomic(board_dir / ASSET_META_FILE, {"version": _ASSET_META_VERSION, "assets": entries})
+
+
+def _asset_meta_current(meta: dict, path: Path) -> bool:
+    try:
+        st = path.stat()
+    except OSError:
+        return False
+    return meta.get("mtime_ns") == st.st_mtime_ns and meta.get("size") == st.st_size
+
+
+def _probe_asset(path: Path) -> dict | None:
+    try:
+        st = path.stat()
+        meta = probe_file(path)
+    except OSError:
+        return None
+    meta["mtime_ns"] = st.st_mtime_ns
+    return meta
 
 
 def load_board(board_id: str) -> Board:
     """Lädt ein Board anhand seiner ID aus dem boards-Verzeichnis.
+    Geparste Boards werden prozessweit gecacht (invalidiert über mtime + Größe von
+    board.json); jeder Aufruf liefert eine eigene Kopie mit frischen used-Flags.
+    ``asset_meta`` wird beim Parsen aus dem Sidecar übernommen (geänderte Dateien
+    werden dabei vermessen und in einem Schreibvorgang gespeichert) und mit dem
+    Template gecacht — die Views machen keine I/O, Cache-Treffer auch nicht.
     Wirft ValueError wenn das Board nicht gefunden oder ungültig ist."""
     board_dir = BOARDS_DIR / board_id
     if not board_dir.is_dir():
         raise ValueError(f"Board-Verzeichnis nicht gefunden: {board_id!r}")
     json_path = board_dir / "board.json"
-    if not json_path.exists():
-        raise ValueError(f"board.json fehlt für Board: {board_id!r}")
+    try:
+        st = json_path.stat()
+    except FileNotFoundError:
+        raise ValueError(f"board.json fehlt für Board: {board_id!r}") from None
+
+    key = str(json_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _board_cache_lock:
+        entry = _BOARD_CACHE.get(key)
+        template = entry[1] if entry is not None and entry[0] == stamp else None
+        if template is not None:
+            _BOARD_CACHE.move_to_end(key)
+
+    if template is None:
+        template = _parse_board(board_id, board_dir, json_path)
+        # Einmal pro Template (gleicher Stempel wie der Cache), nicht pro Spiel
+        template.asset_meta = _render_meta(template, board_id)
+        _cache_board(key, stamp, template, st.st_size)
+    return fresh_copy(template)
+
+
+def _render_meta(board: Board, board_id: str) -> dict[str, dict]:
+    """Asset-Metadaten des Boards für die Views, nach aufgelöstem Asset-Pfad."""
+    board_dir = (BOARDS_DIR / board_id).resolve()
+    # Sidecar aktualisieren (nur geänderte Dateien werden vermessen)
+    known = board_asset_meta(board_id)
+    render: dict[str, dict] = {}
+    for cat in board.categories:
+        for tile in cat.tiles:
+            for asset in tile.question.assets:
+                try:
+                    meta = known.get(Path(asset).relative_to(board_dir).as_posix())
+                except ValueError:
+                    continue
+                if meta is not None:
+                    render[asset] = {k: meta[k] for k in RENDER_META_KEYS if k in meta}
+    return render
 
+
+def _cache_board(key: str, stamp: tuple[int, int], template: Board, size: int) -> None:
+    """Legt ein Template im LRU-Cache ab; Dateigröße dient als Näherung für den Speicherbedarf."""
+    with _board_cache_lock:
+        old = _BOARD_CACHE.pop(key, None)
+        if old is not None:
+            _BOARD_CACHE_BYTES[0] -= old[2]
+        if size > _BOARD_CACHE_MAX_BYTES:
+            return
+        _BOARD_CACHE[key] = (stamp, template, size)
+        _BOARD_CACHE_BYTES[0] += size
+        while _BOARD_CACHE_BYTES[0] > _BOARD_CACHE_MAX_BYTES:
+            _, (_, _, evicted) = _BOARD_CACHE.popitem(last=False)
+            _BOARD_CACHE_BYTES[0] -= evicted
+
+
+def clear_board_cache() -> None:
+    with _board_cache_lock:
+        _BOARD_CACHE.clear()
+        _BOARD_CACHE_BYTES[0] = 0
+
+
+def _parse_board(board_id: str, board_dir: Path, json_path: Path) -> Board:
     try:
         data = json.loads(json_path.read_text(encoding="utf-8"))
     except json.JSONDecodeError as e:
         raise ValueError(f"Ungültiges JSON in board.json ({board_id!r}): {e}") from e
 
+    boards_root = BOARDS_DIR.resolve()
+
     categories = []
     for cat_data in data.get("categories", []):
         tiles = []
@@ -57,7 +314,7 @@ def load_board(board_id: str) -> Board:
             for asset in raw_assets:
                 if asset:
                     resolved = (board_dir / asset).resolve()
-                    if resolved.is_relative_to(BOARDS_DIR.resolve()):
+                    if resolved.is_relative_to(boards_root):
                         resolved_assets.append(str(resolved))
             tiles.append(Tile(
                 value=int(tile_data.get("value", 0)),
@@ -0,0 +1,47 @@
+"""Prozessweite Registry geteilter Board-Templates (Flyweight).
+
+Alle Sessions einer Lobby (und alle Lobbies mit demselben Board) bekommen dasselbe
+Board per Snapshot. Statt dass jede Session einen eigenen Objekt-Graphen mit allen
+Fragen aufbaut, wird das Board pro Content-Hash einmal als Template angelegt; die
+Sessions halten nur noch eigene Tiles (used-Flags) und teilen sich die Fragen.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from models.models import Board, fresh_copy
+
+_MAX_TEMPLATES = int(os.environ.get("JEOPARDY_BOARD_TEMPLATES", "128"))
+_TEMPLATES: "OrderedDict[str, Board]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def intern_board(content_hash: str, build: Callable[[], Board]) -> Board:
+    """Gibt eine Session-Kopie des Templates für ``content_hash`` zurück.
+    ``build`` wird nur aufgerufen, wenn das Template noch nicht existiert.
+    Das Template selbst wird nie verändert (used-Flags leben in der Kopie)."""
+    with _lock:
+        template = _TEMPLATES.get(content_hash)
+        if template is not None:
+            _TEMPLATES.move_to_end(content_hash)
+            return fresh_copy(template)
+
+    template = fresh_copy(build())
+    with _lock:
+        template = _TEMPLATES.setdefault(content_hash, template)
+        _TEMPLATES.move_to_end(content_hash)
+        while len(_TEMPLATES) > _MAX_TEMPLATES:
+            _TEMPLATES.popitem(last=False)
+    return fresh_copy(template)
+
+
+def template_count() -> int:
+    return len(_TEMPLATES)
+
+
+def clear_templates() -> None:
+    with _lock:
+        _TEMPLATES.clear()
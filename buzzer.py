@@ -0,0 +1,138 @@
+"""Buzzer-Arbitrierung pro Lobby.
+
+Buzzes werden beim Eintreffen mit ``time.monotonic_ns()`` gestempelt und in eine
+Deque gelegt — ohne Game-State anzufassen. Der erste Buzz einer Runde öffnet ein
+kurzes Arbitrierungsfenster; danach wird einmal nach Zeitstempel sortiert und das
+Ergebnis (:class:`BuzzDecision`) an ``on_decide`` übergeben. Die Reihenfolge hängt
+damit von der Ankunftszeit ab, nicht davon, welcher Executor-Thread zuerst läuft.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+# Muss nur die Umsortierung durch Pubsub-Executor-Threads abdecken (bench_buzzer:
+# 0 ms → 84 % fair, ab 3 ms ~100 % bei +4 ms p50; 10 ms bringt nichts mehr, kostet
+# aber +11 ms). Unterschiedliche Spieler-Latenzen deckt extra_wait ab.
+BUZZ_WINDOW_S = float(os.environ.get("JEOPARDY_BUZZ_WINDOW_MS", "3")) / 1000
+# Mitgeschickte Stempel, die älter sind, gelten als unplausibel (→ Empfangszeit)
+_MAX_STAMP_AGE_NS = 1_000_000_000
+
+
+@dataclass(frozen=True)
+class Buzz:
+    player_id: str
+    t_ns: int           # Zeitstempel für die Reihenfolge
+    received_ns: int    # Eingang beim Arbiter
+
+
+@dataclass(frozen=True)
+class BuzzDecision:
+    """Ergebnis einer Runde: player_ids in Buzz-Reihenfolge, früheste zuerst."""
+    order: tuple[str, ...]
+    first_ns: int
+    decided_ns: int
+
+    @property
+    def winner(self) -> str:
+        return self.order[0]
+
+
+def arrival_stamp(t_ns: Optional[int], now_ns: int) -> int:
+    """Übernimmt einen in der sendenden Session gesetzten Stempel, wenn er plausibel
+    ist (nicht in der Zukunft, nicht älter als 1 s); sonst gilt die Empfangszeit."""
+    if isinstance(t_ns, int) and 0 < now_ns - t_ns <= _MAX_STAMP_AGE_NS:
+        return t_ns
+    return now_ns
+
+
+class BuzzArbiter:
+    """Sammelt Buzzes einer Lobby und entscheidet sie nach ``window_s``.
+
+    ``run_task`` startet eine Coroutine-Funktion auf der Event-Loop
+    (``page.run_task``). ``correct(player_id, t_ns)`` kann den Stempel um die
+    Latenz des Spielers bereinigen (siehe ``clock_sync.corrected_stamp``);
+    ``extra_wait()`` verlängert das Fenster dann um die Latenzspreizung der Lobby,
+    damit Buzzes langsamer Verbindungen noch rechtzeitig eintreffen.
+    ``submit`` ist thread-safe und blockiert nicht.
+    """
+
+    def __init__(
+        self,
+        run_task: Callable,
+        on_decide: Callable[[BuzzDecision], None],
+        window_s: float = BUZZ_WINDOW_S,
+        correct: Optional[Callable[[str, int], int]] = None,
+        extra_wait: Optional[Callable[[], float]] = None,
+    ):
+        self._run_task = run_task
+        self._on_decide = on_decide
+        self._correct = correct
+        self._extra_wait = extra_wait
+        self.window_s = window_s
+        self._buzzes: deque[Buzz] = deque()
+        self._lock = threading.Lock()
+        self._armed = False
+        self._round = 0     # erhöht durch reset(); veraltete Timer entscheiden nichts
+
+    def submit(self, player_id: str, t_ns: Optional[int] = None) -> None:
+        now = time.monotonic_ns()
+        stamp = arrival_stamp(t_ns, now)
+        if self._correct is not None:
+            stamp = self._correct(player_id, stamp)
+        buzz = Buzz(player_id, stamp, now)
+        with self._lock:
+            self._buzzes.append(buzz)
+            if self._armed:
+                return
+            self._armed = True
+            round_ = self._round
+        try:
+            self._run_task(self._decide_later, round_)
+        except Exception:
+            self.decide_now()
+
+    async def _decide_later(self, round_: int) -> None:
+        wait = self.window_s
+        if self._extra_wait is not None:
+            wait += self._extra_wait()
+        await asyncio.sleep(wait)
+        self._decide(round_)
+
+    def decide_now(self) -> Optional[BuzzDecision]:
+        """Entscheidet die laufende Runde sofort (None wenn nichts ansteht)."""
+        return self._decide(None)
+
+    def _decide(self, round_: Optional[int]) -> Optional[BuzzDecision]:
+        with self._lock:
+            if round_ is not None and round_ != self._round:
+                return None  # Runde wurde per reset() verworfen
+            buzzes = list(self._buzzes)
+            self._buzzes.clear()
+            self._armed = False
+        if not buzzes:
+            return None
+        order: list[str] = []
+        for b in sorted(buzzes, key=lambda b: (b.t_ns, b.received_ns)):
+            if b.player_id not in order:
+                order.append(b.player_id)
+        decision = BuzzDecision(
+            order=tuple(order),
+            first_ns=min(b.t_ns for b in buzzes),
+            decided_ns=time.monotonic_ns(),
+        )
+        self._on_decide(decision)
+        return decision
+
+    def reset(self) -> None:
+        """Verwirft Buzzes der laufenden Runde samt laufendem Fenster (Buzzer neu
+        geöffnet, neue Frage); der nächste Buzz startet eine frische Runde."""
+        with self._lock:
+            self._buzzes.clear()
+            self._armed = False
+            self._round += 1
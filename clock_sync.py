@@ -0,0 +1,146 @@
+"""Latenzschätzung pro Spieler für eine faire Buzzer-Reihenfolge.
+
+Flet führt die App-Logik auf dem Server aus; im Browser läuft kein eigener Code,
+der Klicks mit einer Client-Uhr stempeln könnte. Gemessen wird deshalb NTP-artig
+die Round-Trip-Zeit jeder Spieler-Session (Server → Client → Server über die
+bestehende WebSocket-Verbindung). Die halbe RTT schätzt, wie lange ein Klick
+vom Gerät bis zum Server braucht; um diesen Wert wird der Eingangs-Stempel eines
+Buzzes vorverlegt.
+
+Gegen Manipulation (künstlich verzögerte Antworten → größere Korrektur):
+- geschätzt wird aus dem *Minimum* der letzten Samples, einzelne Ausreißer zählen nicht
+- die Korrektur liegt höchstens ``MAX_SPREAD_NS`` über der des schnellsten
+  gemessenen Spielers der Lobby und nie über ``MAX_CORRECTION_NS``
+
+Nur die Differenz der Korrekturen entscheidet über die Reihenfolge; eine feste
+Obergrenze von 150 ms ließ einen Spieler, der Pings um 400 ms verzögert, 54 % der
+Runden gewinnen (fair: 12,5 %, siehe ``benchmarks.sim_buzz_fairness``). Mit 60 ms
+Spreizung sind es 15 %; ehrliche Lobbies behalten 80 % richtige Gewinner
+(ohne Korrektur: 58 %).
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional
+
+PING_INTERVAL_S = float(os.environ.get("JEOPARDY_PING_INTERVAL_S", "5"))
+MAX_CORRECTION_NS = int(float(os.environ.get("JEOPARDY_BUZZ_MAX_CORRECTION_MS", "150")) * 1_000_000)
+MAX_SPREAD_NS = int(float(os.environ.get("JEOPARDY_BUZZ_MAX_SPREAD_MS", "60")) * 1_000_000)
+_SAMPLES = 8
+
+
+class LatencyEstimate:
+    """Rollierende RTT-Schätzung einer Session (Minimum-Filter über die letzten Samples)."""
+
+    def __init__(self, size: int = _SAMPLES):
+        self._rtts: deque[int] = deque(maxlen=size)
+
+    def add(self, rtt_ns: int) -> None:
+        if rtt_ns > 0:
+            self._rtts.append(rtt_ns)
+
+    @property
+    def samples(self) -> int:
+        return len(self._rtts)
+
+    @property
+    def rtt_ns(self) -> Optional[int]:
+        return min(self._rtts) if self._rtts else None
+
+    @property
+    def jitter_ns(self) -> int:
+        return max(self._rtts) - min(self._rtts) if self._rtts else 0
+
+    @property
+    def one_way_ns(self) -> int:
+        rtt = self.rtt_ns
+        return rtt // 2 if rtt else 0
+
+
+# Prozessweite Schätzungen: player_id -> LatencyEstimate
+_ESTIMATES: dict[str, LatencyEstimate] = {}
+# Per forget() abgemeldete Spieler je Lobby: späte Samples (Ping noch unterwegs)
+# zählen nicht. Fällt mit drop_lobby() weg, wenn die Engine der Lobby stoppt.
+_FORGOTTEN: dict[str, set[str]] = {}
+_lock = threading.Lock()
+
+
+def record_rtt(player_id: str, rtt_ns: int, lobby_id: str = "") -> None:
+    with _lock:
+        if player_id in _FORGOTTEN.get(lobby_id, ()):
+            return
+        est = _ESTIMATES.get(player_id)
+        if est is None:
+            est = _ESTIMATES[player_id] = LatencyEstimate()
+        est.add(rtt_ns)
+
+
+def get_estimate(player_id: str) -> Optional[LatencyEstimate]:
+    return _ESTIMATES.get(player_id)
+
+
+def forget(player_id: str, lobby_id: str = "") -> None:
+    """Spieler hat die Lobby verlassen: Schätzung verwerfen, weitere Samples ignorieren."""
+    with _lock:
+        _ESTIMATES.pop(player_id, None)
+        _FORGOTTEN.setdefault(lobby_id, set()).add(player_id)
+
+
+def track(player_id: str, lobby_id: str = "") -> None:
+    """Spieler ist (wieder) beigetreten: Samples werden wieder angenommen."""
+    with _lock:
+        forgotten = _FORGOTTEN.get(lobby_id)
+        if forgotten is not None:
+            forgotten.discard(player_id)
+            if not forgotten:
+                del _FORGOTTEN[lobby_id]
+
+
+def drop_lobby(lobby_id: str, player_ids=()) -> None:
+    """Lobby beendet: Abmeldungen und Schätzungen ihrer Spieler verwerfen."""
+    with _lock:
+        _FORGOTTEN.pop(lobby_id, None)
+        for player_id in player_ids:
+            _ESTIMATES.pop(player_id, None)
+
+
+def correction_ns(
+    player_id: str,
+    player_ids=(),
+    max_correction_ns: int = MAX_CORRECTION_NS,
+    max_spread_ns: int = MAX_SPREAD_NS,
+) -> int:
+    """Geschätzte Uplink-Latenz des Spielers, höchstens ``max_spread_ns`` über der
+    des schnellsten gemessenen Spielers aus ``player_ids`` und höchstens
+    ``max_correction_ns``. Ungemessene Spieler werden nicht korrigiert."""
+    est = _ESTIMATES.get(player_id)
+    if est is None:
+        return 0
+    own = est.one_way_ns
+    floor = min((e.one_way_ns for pid in player_ids if (e := _ESTIMATES.get(pid))), default=own)
+    return min(own, floor + max_spread_ns, max_correction_ns)
+
+
+def corrected_stamp(player_id: str, t_ns: int, player_ids=(), **limits) -> int:
+    """Eingangs-Stempel eines Buzzes, vorverlegt um die begrenzte Uplink-Latenz
+    des Spielers (siehe :func:`correction_ns`); ``player_ids`` = Spieler der Lobby."""
+    return t_ns - correction_ns(player_id, player_ids, **limits)
+
+
+def latency_spread_ns(player_ids, **limits) -> int:
+    """Differenz zwischen größter und kleinster (begrenzter) Korrektur der Spieler.
+    So lange muss die Buzz-Arbitrierung mindestens warten, damit ein früher Klick
+    über eine langsame Verbindung nicht zu spät kommt."""
+    player_ids = list(player_ids)
+    corrections = [correction_ns(pid, player_ids, **limits) for pid in player_ids]
+    return max(corrections) - min(corrections) if corrections else 0
+
+
+async def measure_rtt(ping: Callable[[], Awaitable]) -> int:
+    """Misst einen Round-Trip über ``ping`` (z.B. ``page.get_device_info``)."""
+    t0 = time.monotonic_ns()
+    await ping()
+    return time.monotonic_ns() - t0
@@ -0,0 +1,86 @@
+"""Zusammenfassen von Aufrufen innerhalb eines kurzen Zeitfensters.
+
+Ein :class:`Coalescer` sammelt Anforderungen (z.B. mehrere ``broadcast_state()``
+in einem Handler) und führt die eigentliche Arbeit einmal pro Fenster aus.
+Mit ``window_s=0`` passiert das in der nächsten Event-Loop-Iteration.
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+from typing import Any, Callable, Optional
+
+
+def merge_latest(_old: Any, new: Any) -> Any:
+    """Standard-Merge: der zuletzt angeforderte Wert gewinnt."""
+    return new
+
+
+class Coalescer:
+    """Führt ``flush(value)`` höchstens einmal pro Fenster aus.
+
+    ``run_task`` startet eine Coroutine-Funktion auf der Event-Loop
+    (``page.run_task``). ``merge(old, new)`` kombiniert die Werte aller
+    Anforderungen eines Fensters, z.B. ``operator.or_`` für "stärkstes
+    include_board gewinnt". ``flush`` darf synchron oder async sein.
+    Thread-safe: ``request`` darf aus Executor-Threads aufgerufen werden.
+    """
+
+    def __init__(
+        self,
+        run_task: Callable,
+        flush: Callable[[Any], Any],
+        window_s: float = 0.0,
+        merge: Callable[[Any, Any], Any] = merge_latest,
+    ):
+        self._run_task = run_task
+        self._flush = flush
+        self.window_s = window_s
+        self._merge = merge
+        self._lock = threading.Lock()
+        self._pending = False
+        self._value: Optional[Any] = None
+
+    def request(self, value: Any = None) -> None:
+        """Merkt eine Anforderung vor; plant den Flush, falls noch keiner ansteht."""
+        with self._lock:
+            if self._pending:
+                self._value = self._merge(self._value, value)
+                return
+            self._pending = True
+            self._value = value
+        try:
+            self._run_task(self._flush_later)
+        except Exception:
+            # Keine Event-Loop erreichbar (z.B. Session getrennt) → sofort ausführen
+            self.flush_now()
+
+    def _take(self) -> tuple[bool, Any]:
+        with self._lock:
+            pending, value = self._pending, self._value
+            self._pending = False
+            self._value = None
+        return pending, value
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.window_s)
+        pending, value = self._take()
+        if not pending:
+            return  # bereits per flush_now() erledigt
+        result = self._flush(value)
+        if inspect.isawaitable(result):
+            await result
+
+    def cancel(self) -> None:
+        """Verwirft eine anstehende Anforderung (z.B. weil sie überholt ist)."""
+        self._take()
+
+    def flush_now(self) -> None:
+        """Führt einen anstehenden Flush sofort aus (synchron)."""
+        pending, value = self._take()
+        if not pending:
+            return
+        result = self._flush(value)
+        if inspect.isawaitable(result):
+            result.close()  # async-Flush braucht die Loop; ohne sie verwerfen
@@ -0,0 +1,295 @@
+"""Serverseitige Spiel-Engine pro Lobby, unabhängig von der Host-Session.
+
+Bisher hat die Browser-Session des Hosts alle Spieler-Intents angewendet: war der
+Tab langsam, im Hintergrund oder gerade am Reconnecten, stand die ganze Lobby.
+Die :class:`GameEngine` besitzt den ``AppState`` der Lobby, abonniert selbst die
+Host-Inbox, wendet Intents über ihren :class:`LobbyActor` an und veröffentlicht
+State-Deltas auf dem Lobby-Topic. Sie braucht dafür nur den Pubsub-Hub und die
+Event-Loop des Servers — keine Page.
+
+Die Host-Session ist nur noch eine Ansicht: Sie reicht eigene UI-Aktionen per
+:meth:`GameEngine.submit` als Kommando an den Actor und führt eine eigene Kopie
+des States über die Snapshots nach, die die Engine ihren Listenern mitgibt. Den
+State der Engine selbst ändert niemand außer dem Actor.
+"""
+from __future__ import annotations
+
+import asyncio
+import operator
+import os
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from app_state import AppState
+from buzzer import BuzzArbiter, BuzzDecision
+from clock_sync import corrected_stamp, drop_lobby, forget, latency_spread_ns, track
+from coalesce import Coalescer
+from lobby_actor import LobbyActor
+from lobby_messages import (
+    Dispatcher, LobbyStateMessage, PlayerBuzz, PlayerEstimate, PlayerEstimateLock,
+    PlayerJoin, PlayerLeave, PlaySound,
+)
+from lobby_pubsub import LobbyChannel, decode
+from lobby_store import get_lobby, update_lobby
+
+# Fenster, in dem mehrere broadcast()-Aufrufe zu einer Nachricht zusammengefasst
+# werden. 0 = einmal pro Event-Loop-Iteration.
+BROADCAST_WINDOW_S = float(os.environ.get("JEOPARDY_BROADCAST_WINDOW_MS", "0")) / 1000
+
+# Ohne Host-Ansicht (Tab geschlossen, Session abgelaufen) wird die Engine nach
+# dieser Zeit gestoppt; ein späterer Reconnect stellt sie aus dem Lobby-Store wieder her.
+ENGINE_IDLE_S = float(os.environ.get("JEOPARDY_ENGINE_IDLE_S", "600"))
+
+# Events an die Listener (Host-Ansicht)
+REFRESH = "refresh"      # State geändert, Ansicht neu aufbauen
+ESTIMATE = "estimate"    # Live-Schätzung geändert (Rebuild darf gebündelt werden)
+BUZZ = "buzz"            # Buzz-Runde entschieden
+
+
+class GameEngine:
+    """Besitzt den State einer Lobby und wendet alle Spieler-Intents an.
+
+    ``pubsub`` ist ein ``PubSubClient`` auf dem Hub des Servers, ``run_task``
+    startet eine Coroutine-Funktion auf der Server-Loop.
+    """
+
+    def __init__(self, lobby_id: str, state: AppState, pubsub, run_task: Callable):
+        self.lobby_id = lobby_id
+        self.state = state
+        self._run_task = run_task
+        self._listeners: list[Callable[[str, dict], None]] = []
+        self.intents = 0
+        self.idle_timeout_s = ENGINE_IDLE_S
+        self._orphaned_at = time.monotonic()
+        self._stopped = False
+
+        self._actor = LobbyActor(lobby_id, run_task)
+        self._broadcaster = Coalescer(run_task, self._flush, BROADCAST_WINDOW_S, merge=operator.or_)
+        # Buzz-Stempel werden um die gemessene Latenz des Spielers bereinigt (clock_sync)
+        self._arbiter = BuzzArbiter(
+            run_task, lambda decision: self._actor.submit(self._apply_buzz_decision, decision),
+            correct=lambda player_id, t_ns: corrected_stamp(player_id, t_ns, self._player_ids()),
+            extra_wait=lambda: latency_spread_ns(self._player_ids()) / 1e9,
+        )
+
+        self._dispatcher = Dispatcher()
+        on = self._dispatcher.on
+        on(PlayerJoin, roles=("host",))(self._intent(self._on_player_join))
+        on(PlayerLeave, roles=("host",))(self._intent(self._on_player_leave))
+        on(PlayerEstimate, roles=("host",))(self._intent(self._on_player_estimate))
+        on(PlayerEstimateLock, roles=("host",))(self._intent(self._on_player_estimate_lock))
+        on(PlayerBuzz, roles=("host",))(self._on_player_buzz)
+
+        self._channel = LobbyChannel(pubsub, self._on_message)
+        self._channel.join(lobby_id, host=True)
+
+    def _player_ids(self) -> list[str]:
+        return [p.player_id for p in self.state.players if p.player_id]
+
+    # -- Listener (Host-Ansicht) ------------------------------------------------
+
+    def add_listener(self, fn: Callable[[str, dict], None]) -> None:
+        """``fn(event, snap)``: ``snap`` enthält die seit dem letzten Event geänderten
+        Felder (siehe ``AppState.fields_snapshot``) und darf nicht verändert werden."""
+        if fn not in self._listeners:
+            self._listeners.append(fn)
+
+    def remove_listener(self, fn: Callable[[str, dict], None]) -> None:
+        """Meldet eine Host-Ansicht ab. Bleibt die Engine ohne Ansicht, wird sie
+        nach ``idle_timeout_s`` gestoppt, sofern bis dahin kein Host zurückkommt."""
+        if fn in self._listeners:
+            self._listeners.remove(fn)
+        if self._listeners or self._stopped:
+            return
+        self._orphaned_at = time.monotonic()
+        try:
+            self._run_task(self._stop_when_orphaned)
+        except Exception:
+            pass  # keine Loop mehr (Server fährt herunter)
+
+    async def _stop_when_orphaned(self) -> None:
+        await asyncio.sleep(self.idle_timeout_s)
+        if self._listeners or self._stopped:
+            return
+        if time.monotonic() - self._orphaned_at < self.idle_timeout_s:
+            return  # zwischendurch wieder angemeldet und erneut verlassen
+        with _registry_lock:
+            if ENGINES.get(self.lobby_id) is self:
+                del ENGINES[self.lobby_id]
+        self.stop()
+
+    def _notify(self, event: str) -> None:
+        snap = self.state.fields_snapshot(self.state.take_view_delta())
+        for fn in list(self._listeners):
+            try:
+                fn(event, snap)
+            except Exception as ex:
+                print(f"[GameEngine {self.lobby_id}] Listener fehlgeschlagen: {ex}")
+
+    # -- Kommandos ------------------------------------------------------------
+
+    def submit(self, command: Callable[..., Any], *args: Any, include_board: bool = False) -> None:
+        """Host-Aktion: reiht ``command(state, *args)`` im Actor der Lobby ein. Das
+        Kommando ändert den State der Engine; danach wird gebroadcastet und die
+        Host-Ansicht informiert. include_board=True schickt das volle Board mit."""
+        self._actor.submit(self._run_command, command, args, include_board)
+
+    def close(self) -> None:
+        """Host beendet die Lobby: "menu" geht als letzter Broadcast raus, danach
+        wird die Engine gestoppt — im Actor, also nach allen eingereihten Kommandos."""
+        self._actor.submit(self._close)
+
+    def broadcast(self, include_board: bool = False) -> None:
+        """Plant einen State-Broadcast. Mehrere Aufrufe im selben Fenster werden zu
+        einer Nachricht zusammengefasst; include_board=True gewinnt."""
+        self._broadcaster.request(include_board)
+
+    def flush(self) -> None:
+        """Sendet einen anstehenden Broadcast sofort, am Coalescer vorbei —
+        z.B. bevor die Engine gestoppt wird und den Lobby-Kanal verlässt."""
+        self._broadcaster.flush_now()
+
+    def stop(self) -> None:
+        self._stopped = True
+        self._channel.leave()
+        self._listeners.clear()
+        drop_lobby(self.lobby_id, self._player_ids())
+
+    def _run_command(self, command: Callable[..., Any], args: tuple, include_board: bool) -> None:
+        state = self.state
+        buzz_round = state.buzz_round
+        command(state, *args)
+        if state.buzz_round != buzz_round:
+            # Buzzer (neu) geöffnet oder neue Frage: Buzzes der alten Runde verwerfen
+            self._arbiter.reset()
+        self.broadcast(include_board)
+        self._notify(REFRESH)
+
+    def _close(self) -> None:
+        self.state.screen = "menu"
+        self.broadcast()
+        self.flush()
+        stop_engine(self.lobby_id)
+
+    # -- Intents --------------------------------------------------------------
+
+    def _on_message(self, message) -> None:
+        env = decode(message)
+        if env is None or env.lobby_id != self.lobby_id:
+            return
+        self._dispatcher.dispatch(env.type, env.payload, "host")
+
+    def _intent(self, fn):
+        """Handler, der nicht im Pubsub-Thread, sondern im Lobby-Actor läuft."""
+        def _submit(msg):
+            self.intents += 1
+            self._actor.submit(fn, msg)
+        return _submit
+
+    def _on_player_join(self, msg: PlayerJoin) -> None:
+        track(msg.player_id, self.lobby_id)
+        self.state.add_player(msg.player_id, msg.name)
+        # Nur das Spieler-Delta: das Board holt sich der Neue per Resync aus dem Lobby-Store
+        self.broadcast()
+        self._notify(REFRESH)
+
+    def _on_player_leave(self, msg: PlayerLeave) -> None:
+        self.state.remove_player(msg.player_id)
+        forget(msg.player_id, self.lobby_id)
+        self.broadcast()
+        self._notify(REFRESH)
+
+    def _on_player_buzz(self, msg: PlayerBuzz) -> None:
+        # Nur stempeln und einreihen; entschieden wird nach dem Arbitrierungsfenster
+        self.intents += 1
+        if self.state.buzzer_open:
+            self._arbiter.submit(msg.player_id, msg.t_ns)
+
+    def _apply_buzz_decision(self, decision: BuzzDecision) -> None:
+        """Übernimmt eine entschiedene Buzz-Runde: ein State-Delta, ein Rebuild."""
+        state = self.state
+        if not state.buzzer_open:
+            return
+        for player_id in decision.order:
+            idx = next((i for i, p in enumerate(state.players) if p.player_id == player_id), -1)
+            if idx >= 0 and idx not in state.buzzed_queue:
+                state.buzzed_queue.append(idx)
+        state.mark_dirty("buzzed_queue")
+        if state.buzzed_queue:
+            state.set_answerer(state.buzzed_queue[0])
+            state.buzzer_open = False
+            # Ein Buzz-Sound für die ganze Lobby (Host und alle Spieler), einmal pro Runde
+            self._channel.send(PlaySound(name="buzz").to_message(self.lobby_id))
+        self.broadcast()
+        self._notify(BUZZ)
+
+    def _on_player_estimate(self, msg: PlayerEstimate) -> None:
+        # Nur updaten wenn noch nicht eingeloggt (Lock bleibt erhalten)
+        if msg.player_id and msg.player_id not in self.state.estimates_locked:
+            self.state.estimates[msg.player_id] = msg.answer
+            self.state.mark_dirty("estimates")
+        self._notify(ESTIMATE)
+
+    def _on_player_estimate_lock(self, msg: PlayerEstimateLock) -> None:
+        state = self.state
+        if msg.player_id:
+            state.estimates[msg.player_id] = msg.answer
+            if msg.player_id not in state.estimates_locked:
+                state.estimates_locked.append(msg.player_id)
+            state.mark_dirty("estimates", "estimates_locked")
+        self.broadcast()
+        self._notify(REFRESH)
+
+    # -- Snapshots ------------------------------------------------------------
+
+    def _flush(self, include_board: bool) -> None:
+        state = self.state
+        # Gesendet werden nur die seit dem letzten Broadcast geänderten Felder
+        send_snap = state.delta_snapshot(include_board=include_board)
+
+        # Lobby-Store: dynamischer State als Patch, Board nur wenn es neu ist.
+        # Der volle Snapshot wird erst bei Join/Reconnect zusammengesetzt.
+        patch = dict(send_snap)
+        lobby = get_lobby(self.lobby_id)
+        if not lobby.data:
+            patch.update(state.snapshot(include_board=False))
+        if "board" not in patch and state.board_hash() != lobby.board_hash:
+            patch["board"] = AppState._board_to_dict(state.board)
+            patch["board_progress"] = state.board_progress()
+        lobby = update_lobby(self.lobby_id, patch)
+
+        self._channel.send(LobbyStateMessage(version=lobby.version, data=send_snap).to_message(self.lobby_id))
+
+
+# Prozessweite Registry: lobby_id -> GameEngine
+ENGINES: dict[str, GameEngine] = {}
+_registry_lock = threading.Lock()
+
+
+def loop_runner(loop: asyncio.AbstractEventLoop) -> Callable:
+    """``run_task``-Ersatz ohne Page: startet Coroutine-Funktionen auf ``loop``."""
+    def run_task(handler, *args):
+        return asyncio.run_coroutine_threadsafe(handler(*args), loop)
+    return run_task
+
+
+def start_engine(lobby_id: str, state: AppState, pubsub, run_task: Callable) -> GameEngine:
+    """Legt die Engine der Lobby an (bzw. gibt die bestehende zurück). Eine neue
+    Engine übernimmt ``state`` als ihren eigenen; der Aufrufer behält keine Referenz."""
+    with _registry_lock:
+        engine = ENGINES.get(lobby_id)
+        if engine is None:
+            engine = ENGINES[lobby_id] = GameEngine(lobby_id, state, pubsub, run_task)
+        return engine
+
+
+def get_engine(lobby_id: Optional[str]) -> Optional[GameEngine]:
+    return ENGINES.get(lobby_id) if lobby_id else None
+
+
+def stop_engine(lobby_id: Optional[str]) -> None:
+    with _registry_lock:
+        engine = ENGINES.pop(lobby_id, None) if lobby_id else None
+    if engine is not None:
+        engine.stop()
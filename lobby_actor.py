@@ -0,0 +1,86 @@
+"""Single-Writer pro Lobby.
+
+Spieler-Intents kommen über Pubsub in Executor-Threads an, UI-Events des Hosts
+laufen auf der Event-Loop. Statt beides mit einem prozessweiten Lock zu
+serialisieren, besitzt jede Lobby einen :class:`LobbyActor`: Kommandos werden in
+eine Queue gelegt und von genau einem Drain-Task auf der Event-Loop nacheinander
+angewendet. Alles, was bis zum Start des Drain-Tasks eintrifft, wird als ein
+Batch abgearbeitet; Broadcasts der Kommandos fasst der Coalescer ohnehin zu
+einem Delta zusammen. Verschiedene Lobbies teilen sich nichts.
+"""
+from __future__ import annotations
+
+import inspect
+import threading
+from collections import deque
+from typing import Any, Callable
+
+
+class LobbyActor:
+    """Kommando-Queue einer Lobby mit genau einem aktiven Drain-Task.
+
+    ``run_task`` startet eine Coroutine-Funktion auf der Event-Loop
+    (``page.run_task``). ``submit`` ist thread-safe und blockiert nicht.
+    """
+
+    def __init__(self, lobby_id: str, run_task: Callable):
+        self.lobby_id = lobby_id
+        self._run_task = run_task
+        self._queue: deque = deque()
+        self._lock = threading.Lock()
+        self._scheduled = False
+        self.processed = 0
+        self.batches = 0
+
+    def submit(self, command: Callable[..., Any], *args: Any) -> None:
+        """Reiht ``command(*args)`` ein; startet den Drain-Task, falls keiner läuft."""
+        with self._lock:
+            self._queue.append((command, args))
+            if self._scheduled:
+                return
+            self._scheduled = True
+        try:
+            self._run_task(self._drain)
+        except Exception:
+            # Keine Event-Loop erreichbar → synchron abarbeiten
+            self._drain_now()
+
+    def _take_batch(self) -> list:
+        with self._lock:
+            if not self._queue:
+                self._scheduled = False
+                return []
+            batch = list(self._queue)
+            self._queue.clear()
+        return batch
+
+    async def _drain(self) -> None:
+        while batch := self._take_batch():
+            for command, args in batch:
+                try:
+                    result = command(*args)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as ex:
+                    print(f"[LobbyActor {self.lobby_id}] Kommando fehlgeschlagen: {ex}")
+            self._finish_batch(len(batch))
+
+    def _drain_now(self) -> None:
+        while batch := self._take_batch():
+            for command, args in batch:
+                try:
+                    result = command(*args)
+                    if inspect.isawaitable(result):
+                        result.close()
+                except Exception as ex:
+                    print(f"[LobbyActor {self.lobby_id}] Kommando fehlgeschlagen: {ex}")
+            self._finish_batch(len(batch))
+
+    def _finish_batch(self, size: int) -> None:
+        self.processed += size
+        self.batches += 1
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
@@ -0,0 +1,185 @@
+"""Typisierte Lobby-Nachrichten und Dispatch-Tabelle.
+
+Jeder Nachrichtentyp ist eine kleine frozen Dataclass, registriert unter seinem
+``type``-String. Ein :class:`Dispatcher` ordnet (type, Rolle) genau einem Handler
+zu — das Routing einer Nachricht ist ein Dict-Lookup, egal wie viele Typen es gibt.
+Pro Typ werden Anzahl und Handler-Laufzeit mitgezählt (:data:`STATS`).
+"""
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, ClassVar, Iterable, Mapping, Optional
+
+ROLES = ("host", "player")
+
+# type-String -> Nachrichtenklasse
+MESSAGE_TYPES: dict[str, type["LobbyMessage"]] = {}
+
+
+def message(type_name: str):
+    """Klassen-Decorator: registriert eine Nachrichtenklasse unter ``type_name``."""
+    def _register(cls):
+        cls.TYPE = type_name
+        cls._FIELDS = tuple(f.name for f in fields(cls))
+        MESSAGE_TYPES[type_name] = cls
+        return cls
+    return _register
+
+
+@dataclass(frozen=True)
+class LobbyMessage:
+    TYPE: ClassVar[str] = ""
+    _FIELDS: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, Any]) -> "LobbyMessage":
+        """Baut die Nachricht aus einem (ggf. read-only) Payload; fehlende Felder
+        bekommen ihre Defaults, unbekannte werden ignoriert."""
+        return cls(**{name: payload[name] for name in cls._FIELDS if name in payload})
+
+    def to_message(self, lobby_id: str) -> dict:
+        """Wire-Format für ``LobbyChannel.send``."""
+        msg = {"type": self.TYPE, "lobby_id": lobby_id}
+        for name in self._FIELDS:
+            msg[name] = getattr(self, name)
+        return msg
+
+
+@message("player_join")
+@dataclass(frozen=True)
+class PlayerJoin(LobbyMessage):
+    player_id: str = ""
+    name: str = "Spieler"
+
+
+@message("player_leave")
+@dataclass(frozen=True)
+class PlayerLeave(LobbyMessage):
+    player_id: str = ""
+
+
+@message("player_buzz")
+@dataclass(frozen=True)
+class PlayerBuzz(LobbyMessage):
+    player_id: str = ""
+    t_ns: int = 0   # monotonic_ns beim Eingang des Klicks in der Spieler-Session
+
+
+@message("player_estimate")
+@dataclass(frozen=True)
+class PlayerEstimate(LobbyMessage):
+    player_id: str = ""
+    answer: str = ""
+
+
+@message("player_estimate_lock")
+@dataclass(frozen=True)
+class PlayerEstimateLock(LobbyMessage):
+    player_id: str = ""
+    answer: str = ""
+
+
+@message("lobby_state")
+@dataclass(frozen=True)
+class LobbyStateMessage(LobbyMessage):
+    version: Optional[int] = None
+    data: Mapping[str, Any] = field(default_factory=dict)
+
+
+@message("play_sound")
+@dataclass(frozen=True)
+class PlaySound(LobbyMessage):
+    name: str = ""
+
+
+@message("play_question_audio")
+@dataclass(frozen=True)
+class PlayQuestionAudio(LobbyMessage):
+    pass
+
+
+def parse(type_name: str, payload: Mapping[str, Any]) -> Optional[LobbyMessage]:
+    """Typisierte Nachricht für ``type_name`` oder None bei unbekanntem Typ."""
+    cls = MESSAGE_TYPES.get(type_name)
+    if cls is None:
+        return None
+    try:
+        return cls.from_payload(payload)
+    except TypeError:
+        return None
+
+
+@dataclass
+class MessageStats:
+    """Anzahl und Handler-Laufzeit eines Nachrichtentyps."""
+    count: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+
+    @property
+    def avg_us(self) -> float:
+        return self.total_ns / self.count / 1000 if self.count else 0.0
+
+
+# Prozessweite Statistik pro Nachrichtentyp (über alle Sessions)
+STATS: dict[str, MessageStats] = {}
+_stats_lock = threading.Lock()
+
+
+def reset_stats() -> None:
+    with _stats_lock:
+        STATS.clear()
+
+
+class Dispatcher:
+    """Dispatch-Tabelle (type, Rolle) -> Handler für eine Session.
+
+    Handler bekommen die typisierte Nachricht::
+
+        dispatcher = Dispatcher()
+
+        @dispatcher.on(PlayerBuzz, roles=("host",))
+        def _on_buzz(msg: PlayerBuzz): ...
+
+        dispatcher.dispatch("player_buzz", payload, role="host")
+    """
+
+    def __init__(self, stats: Optional[dict[str, MessageStats]] = None):
+        self._table: dict[tuple[str, str], Callable[[LobbyMessage], Any]] = {}
+        self._stats = STATS if stats is None else stats
+
+    def on(self, msg_cls: type[LobbyMessage], roles: Iterable[str] = ROLES):
+        """Decorator: registriert einen Handler für ``msg_cls`` und die gegebenen Rollen."""
+        def _register(fn):
+            for role in roles:
+                self._table[(msg_cls.TYPE, role)] = fn
+            return fn
+        return _register
+
+    def handles(self, type_name: str, role: str) -> bool:
+        return (type_name, role) in self._table
+
+    def dispatch(self, type_name: str, payload: Mapping[str, Any], role: str) -> bool:
+        """Ruft den Handler für (type, role) auf. False wenn keiner zuständig ist."""
+        handler = self._table.get((type_name, role))
+        if handler is None:
+            return False
+        msg = parse(type_name, payload)
+        if msg is None:
+            return False
+        t0 = time.perf_counter_ns()
+        try:
+            handler(msg)
+        finally:
+            elapsed = time.perf_counter_ns() - t0
+            with _stats_lock:
+                s = self._stats.get(type_name)
+                if s is None:
+                    s = self._stats[type_name] = MessageStats()
+                s.count += 1
+                s.total_ns += elapsed
+                if elapsed > s.max_ns:
+                    s.max_ns = elapsed
+        return True
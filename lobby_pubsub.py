@@ -0,0 +1,129 @@
+"""Lobby-scoped Pubsub-Kanäle.
+
+Statt jede Nachricht per ``send_all`` an alle Sessions im Prozess zu schicken
+(und sie dort per ``lobby_id`` wieder zu verwerfen), abonniert jede Session nur
+das Topic ihrer eigenen Lobby. Der Fan-out pro Nachricht wächst damit mit der
+Lobby-Größe statt mit der Gesamtzahl der Sessions.
+
+Spieler-Intents (Join, Buzz, Schätzung, …) interessieren nur den Host. Der Host
+abonniert dafür zusätzlich die Inbox ``lobby:<id>:host``; Spieler senden ihre
+Intents nur dorthin (Fan-out 1 statt Lobby-Größe). Das Lobby-Topic bleibt dem
+Host-State für alle vorbehalten.
+
+Flets Pubsub ist prozessintern und reicht Objekte unverändert weiter. Nachrichten
+werden deshalb einmal beim Senden in einen unveränderlichen :class:`LobbyEnvelope`
+verpackt, den alle Empfänger gemeinsam lesen — kein ``json.loads`` pro Session.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional
+
+_TOPIC_PREFIX = "lobby:"
+_HOST_SUFFIX = ":host"
+SESSION_KEY = "_lobby_channel"
+
+
+def lobby_topic(lobby_id: str) -> str:
+    """Pubsub-Topic einer Lobby."""
+    return f"{_TOPIC_PREFIX}{lobby_id}"
+
+
+def host_topic(lobby_id: str) -> str:
+    """Pubsub-Topic der Host-Inbox einer Lobby."""
+    return f"{_TOPIC_PREFIX}{lobby_id}{_HOST_SUFFIX}"
+
+
+def freeze(value: Any) -> Any:
+    """Tief unveränderliche Kopie: dict → MappingProxyType, list → tuple."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True)
+class LobbyEnvelope:
+    """Bereits dekodierte, unveränderliche Pubsub-Nachricht.
+    ``payload`` ist die komplette Nachricht (inkl. type/lobby_id) als frozen Mapping."""
+    type: str
+    lobby_id: str
+    payload: Mapping[str, Any]
+
+    @classmethod
+    def from_message(cls, message: Mapping[str, Any]) -> "LobbyEnvelope":
+        payload = freeze(message)
+        return cls(type=str(payload.get("type") or ""), lobby_id=str(payload.get("lobby_id") or ""),
+                   payload=payload)
+
+
+def decode(message: Any) -> Optional[LobbyEnvelope]:
+    """Envelope aus einer Pubsub-Nachricht; alles andere wird verworfen."""
+    if isinstance(message, LobbyEnvelope):
+        return message
+    return None
+
+
+class LobbyChannel:
+    """Session-gebundener Kanal auf das Topic der aktuellen Lobby.
+
+    ``pubsub`` ist der ``PubSubClient`` der Session (``page.pubsub``),
+    ``handler`` bekommt jede eingehende Nachricht der Lobby.
+    """
+
+    def __init__(self, pubsub, handler: Callable[[Any], None]):
+        self._pubsub = pubsub
+        self._handler = handler
+        self.lobby_id: Optional[str] = None
+        self.is_host = False
+
+    def _on_topic(self, _topic: str, message: Any) -> None:
+        self._handler(message)
+
+    def join(self, lobby_id: Optional[str], host: bool = False) -> None:
+        """Abonniert das Topic der Lobby (und verlässt ggf. die vorherige).
+        Mit ``host=True`` zusätzlich die Host-Inbox der Lobby."""
+        if lobby_id == self.lobby_id and host == self.is_host:
+            return
+        self.leave()
+        if not lobby_id:
+            return
+        self._pubsub.subscribe_topic(lobby_topic(lobby_id), self._on_topic)
+        if host:
+            self._pubsub.subscribe_topic(host_topic(lobby_id), self._on_topic)
+        self.lobby_id = lobby_id
+        self.is_host = host
+
+    def leave(self) -> None:
+        """Beendet das Abo der aktuellen Lobby (inkl. Host-Inbox)."""
+        if self.lobby_id is None:
+            return
+        self._pubsub.unsubscribe_topic(lobby_topic(self.lobby_id))
+        if self.is_host:
+            self._pubsub.unsubscribe_topic(host_topic(self.lobby_id))
+        self.lobby_id = None
+        self.is_host = False
+
+    def send(self, message: dict) -> None:
+        """Sendet eine Nachricht an alle Mitglieder der Lobby aus ``message["lobby_id"]``.
+        Die Nachricht wird genau einmal in einen LobbyEnvelope verpackt."""
+        lobby_id = message.get("lobby_id")
+        if not lobby_id:
+            return
+        self._pubsub.send_all_on_topic(lobby_topic(lobby_id), LobbyEnvelope.from_message(message))
+
+    def send_to_host(self, message: dict) -> None:
+        """Sendet einen Spieler-Intent nur an die Host-Inbox der Lobby."""
+        lobby_id = message.get("lobby_id")
+        if not lobby_id:
+            return
+        self._pubsub.send_all_on_topic(host_topic(lobby_id), LobbyEnvelope.from_message(message))
+
+
+def send_to_host(page, message: dict) -> None:
+    """Sendet einen Spieler-Intent über den Lobby-Kanal der Session an den Host."""
+    channel = page.session.store.get(SESSION_KEY)
+    if channel is not None:
+        channel.send_to_host(message)
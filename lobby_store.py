@@ -1,6 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import time
 
 
@@ -8,8 +8,18 @@ import time
 class LobbyState:
     lobby_id: str
     version: int = 0
-    data: Dict[str, Any] = field(default_factory=dict)
+    data: Dict[str, Any] = field(default_factory=dict)  # dynamischer State (ohne Board)
     updated_at: float = field(default_factory=time.time)
+    # Board separat: wird nur beim Spielstart / Board-Wechsel geschrieben, used-Flags
+    # kommen als kompaktes data["board_progress"]
+    board: Optional[Dict[str, Any]] = None
+    board_hash: Optional[str] = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Voller Snapshot für Join/Reconnect; das Board wird erst hier dazugelegt."""
+        snap = dict(self.data)
+        snap["board"] = self.board
+        return snap
 
 
 LOBBIES: Dict[str, LobbyState] = {}
@@ -27,9 +37,16 @@ def get_lobby(lobby_id: str) -> LobbyState:
 
 
 def update_lobby(lobby_id: str, patch: Dict[str, Any]) -> LobbyState:
+    """Merged ``patch`` in den Lobby-State. Ein "board"-Eintrag wird separat abgelegt
+    (Hash aus patch["board_progress"]), alles andere landet in ``data``."""
     l = get_lobby(lobby_id)
     l.version += 1
     l.updated_at = time.time()
+    if "board" in patch:
+        patch = dict(patch)
+        l.board = patch.pop("board")
+        progress = patch.get("board_progress") or {}
+        l.board_hash = progress.get("hash") if l.board is not None else None
     l.data.update(patch)
     return l
 
@@ -27,6 +27,23 @@ class Category:
 class Board:
     categories: List[Category]
     title: str = ""
+    # Beim Laden vorab ermittelte Asset-Metadaten (Bildmaße, Dauer, Peaks) nach
+    # aufgelöstem Pfad wie in Question.assets; die Views lesen nur hier nach.
+    asset_meta: dict[str, dict] = field(default_factory=dict)
+
+
+def fresh_copy(board: Board) -> Board:
+    """Neue Board-Instanz mit eigenen Tiles (used=False) für ein neues Spiel.
+    Fragen (Prompt, Antwort, Assets) werden nicht kopiert, sondern geteilt —
+    sie gelten als unveränderlich, ebenso ``asset_meta``."""
+    return Board(
+        categories=[
+            Category(title=c.title, tiles=[Tile(value=t.value, question=t.question) for t in c.tiles])
+            for c in board.categories
+        ],
+        title=board.title,
+        asset_meta=board.asset_meta,
+    )
 
 
 def build_dummy_board(cols: int = 6, rows: int = 5) -> Board:
@@ -4,6 +4,10 @@ Startet alle drei Dienste gleichzeitig:
   - python serve_build.py   (Flutter-Build + WebSocket-Proxy, Port 8080)
   - cloudflared tunnel      (öffentliche URL auf Port 8080)
 
+Nebenher berechnet ``python -m waveform_peaks`` fehlende Waveform-Peaks. Das
+blockiert den Start nicht: Boards, die vor dem Ende geladen werden, zeigen flache
+Balken; einzeln vorab geht es mit ``python -m waveform_peaks [board_id ...]``.
+
 Beenden mit Strg+C.
 """
 import socket
@@ -44,6 +48,15 @@ def _tunnel_filter(line: str) -> bool:
 def main():
     procs = []
 
+    # Waveform-Peaks neuer/geänderter Audio-Assets im Hintergrund (bekannte werden übersprungen)
+    p_peaks = subprocess.Popen(
+        [sys.executable, "-m", "waveform_peaks"],
+        cwd=BASE_DIR,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    threading.Thread(target=stream_output, args=(p_peaks, "peaks "), daemon=True).start()
+
     try:
         p_main = subprocess.Popen(
             [sys.executable, "main.py"],
@@ -90,6 +103,8 @@ def main():
         print("\n[start] Beende alle Prozesse...")
 
     finally:
+        if p_peaks.poll() is None:
+            procs.append(p_peaks)
         for p in procs:
             p.terminate()
         for p in procs:
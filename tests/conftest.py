@@ -0,0 +1,55 @@
+"""Gemeinsame Test-Helfer: Event-Loop für Szenarien, In-Memory-Pubsub."""
+import asyncio
+
+import pytest
+
+
+class FakePubSub:
+    """Minimaler In-Memory-Hub mit der Topic-API von ``page.pubsub``."""
+
+    def __init__(self):
+        self.topics: dict[str, list] = {}
+
+    def client(self):
+        hub = self
+
+        class _Client:
+            def subscribe_topic(self, topic, handler):
+                hub.topics.setdefault(topic, []).append((self, handler))
+
+            def unsubscribe_topic(self, topic):
+                hub.topics[topic] = [(c, h) for c, h in hub.topics.get(topic, []) if c is not self]
+
+            def send_all_on_topic(self, topic, message):
+                for _, handler in list(hub.topics.get(topic, [])):
+                    handler(topic, message)
+
+        return _Client()
+
+
+@pytest.fixture
+def hub():
+    return FakePubSub()
+
+
+def _run_scenario(scenario):
+    """Führt ``scenario(run_task)`` auf einer frischen Event-Loop aus und wartet
+    alle darüber gestarteten Tasks ab. ``run_task`` verhält sich wie
+    ``page.run_task`` und darf auch aus anderen Threads aufgerufen werden."""
+    async def main():
+        loop = asyncio.get_running_loop()
+        tasks = []
+
+        def run_task(handler, *args):
+            tasks.append(asyncio.run_coroutine_threadsafe(handler(*args), loop))
+
+        await scenario(run_task)
+        while tasks:
+            await asyncio.wrap_future(tasks.pop(0))
+
+    asyncio.run(main())
+
+
+@pytest.fixture
+def run_scenario():
+    return _run_scenario
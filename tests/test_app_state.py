@@ -171,6 +171,177 @@ class TestSnapshot:
         assert fresh.buzzed_queue == [1, 2]
 
 
+# ---------------------------------------------------------------------------
+# Board-Fortschritt (used-Bitmaske statt volles Board)
+# ---------------------------------------------------------------------------
+
+class TestBoardProgress:
+    def test_snapshot_without_board_carries_progress(self, state):
+        snap = state.snapshot(include_board=False)
+        assert snap["board_progress"]["hash"] == state.board_hash()
+        assert snap["board_progress"]["used"] == "0"
+
+    def test_used_tile_sets_bit(self, state):
+        state.board.categories[0].tiles[1].used = True
+        assert state.board_progress()["used"] == "2"
+
+    def test_progress_applied_in_place(self, state):
+        client = AppState()
+        client.apply_snapshot(state.snapshot(include_board=True))
+        client_board = client.board
+
+        state.board.categories[2].tiles[3].used = True
+        assert client.apply_snapshot(state.snapshot(include_board=False)) is True
+
+        assert client.board is client_board
+        assert client.board.categories[2].tiles[3].used is True
+        assert client.board.categories[0].tiles[0].used is False
+
+    def test_hash_mismatch_requests_full_board(self, state):
+        client = AppState()
+        client.board = build_dummy_board(cols=3, rows=3)
+        assert client.apply_snapshot(state.snapshot(include_board=False)) is False
+
+    def test_missing_board_requests_full_board(self, state):
+        client = AppState()
+        assert client.apply_snapshot(state.snapshot(include_board=False)) is False
+
+    def test_hash_ignores_used_flags(self, state):
+        before = state.board_hash()
+        state.board.categories[0].tiles[0].used = True
+        assert AppState._board_content_hash(state.board) == before
+
+    def test_hash_changes_with_content(self, state):
+        other = AppState()
+        other.board = build_dummy_board()
+        other.board.categories[0].tiles[0].question.prompt = "anders"
+        assert other.board_hash() != state.board_hash()
+
+    def test_hash_survives_wire_round_trip(self, state):
+        state.board.title = "Allgemeinwissen"
+        received = AppState._board_from_dict(AppState._board_to_dict(state.board))
+        assert received.title == "Allgemeinwissen"
+        assert AppState._board_content_hash(received) == AppState._board_content_hash(state.board)
+
+    def test_asset_meta_survives_frozen_round_trip(self, state):
+        from lobby_pubsub import freeze
+        state.board.asset_meta = {"/boards/b/sounds/a.mp3": {"duration_ms": 1200, "peaks": [0.5, 1.0]}}
+        received = AppState._board_from_dict(freeze(AppState._board_to_dict(state.board)))
+        assert received.asset_meta["/boards/b/sounds/a.mp3"]["duration_ms"] == 1200
+        assert AppState._board_content_hash(received) == AppState._board_content_hash(state.board)
+
+    def test_progress_payload_much_smaller_than_board(self):
+        import json
+        s = AppState()
+        s.board = build_dummy_board(cols=10, rows=5)
+        s.board.categories[4].tiles[2].used = True
+        full = len(json.dumps(AppState._board_to_dict(s.board)))
+        delta = len(json.dumps(s.board_progress()))
+        assert delta * 50 < full
+
+
+# ---------------------------------------------------------------------------
+# Dirty-Tracking / delta_snapshot
+# ---------------------------------------------------------------------------
+
+class TestDeltaSnapshot:
+    def test_fresh_state_is_fully_dirty(self, state):
+        delta = state.delta_snapshot()
+        assert set(state.snapshot(include_board=False)) <= set(delta)
+
+    def test_delta_resets_dirty_set(self, state):
+        state.delta_snapshot()
+        assert state.delta_snapshot() == {}
+
+    def test_fields_snapshot_only_named_fields(self, state):
+        state.board.categories[0].tiles[0].used = True
+        snap = state.fields_snapshot({"board", "buzzer_open"})
+        assert set(snap) == {"buzzer_open", "board_progress"}
+        assert snap["board_progress"] == state.board_progress()
+
+    def test_direct_field_write_is_tracked(self, state):
+        state.delta_snapshot()
+        state.question_asset_index = 2
+        assert state.delta_snapshot() == {"question_asset_index": 2}
+
+    def test_open_buzzer_only_sends_buzzer_fields(self, state):
+        state.delta_snapshot()
+        state.open_buzzer()
+        assert set(state.delta_snapshot()) == {"buzzer_open", "buzzed_queue"}
+
+    def test_set_turn_marks_players(self, state):
+        state.delta_snapshot()
+        state.set_turn(1)
+        delta = state.delta_snapshot()
+        assert delta["active_player_index"] == 1
+        assert delta["players"][1]["is_turn"] is True
+
+    def test_unchanged_turn_is_not_dirty(self, state):
+        state.delta_snapshot()
+        state.ensure_players()  # läuft bei jedem View-Aufbau
+        state.set_turn(state.active_player_index)
+        assert state.delta_snapshot() == {}
+
+    def test_in_place_mutation_needs_mark_dirty(self, state):
+        state.delta_snapshot()
+        state.players[0].score += 100
+        state.mark_dirty("players")
+        assert state.delta_snapshot()["players"][0]["score"] == 100
+
+    def test_used_tile_sends_progress_not_board(self, state):
+        state.delta_snapshot()
+        state.board.categories[0].tiles[0].used = True
+        state.mark_dirty("board")
+        delta = state.delta_snapshot()
+        assert "board" not in delta
+        assert delta["board_progress"]["used"] == "1"
+
+    def test_include_board_sends_full_board(self, state):
+        state.delta_snapshot()
+        delta = state.delta_snapshot(include_board=True)
+        assert delta["board"] is not None
+        assert "board_progress" in delta
+
+    def test_cleared_board_is_sent_as_none(self, state):
+        state.delta_snapshot()
+        state.board = None
+        assert state.delta_snapshot()["board"] is None
+
+    def test_partial_snapshot_applies_on_client(self, state):
+        client = AppState()
+        client.apply_snapshot(state.snapshot(include_board=True))
+        state.delta_snapshot()
+        state.buzzer_open = True
+        assert client.apply_snapshot(state.delta_snapshot()) is True
+        assert client.buzzer_open is True
+        assert len(client.players) == len(state.players)
+
+
+class TestViewDelta:
+    def test_view_delta_is_independent_of_broadcast(self, state):
+        state.take_view_delta()
+        state.buzzer_open = True
+        state.delta_snapshot()
+        assert state.take_view_delta() == {"buzzer_open"}
+        assert state.take_view_delta() == frozenset()
+
+    def test_mark_dirty_reaches_view_delta(self, state):
+        state.take_view_delta()
+        state.players[0].score += 100
+        state.mark_dirty("players")
+        assert state.take_view_delta() == {"players"}
+
+    def test_applied_progress_marks_board(self, state):
+        client = AppState()
+        client.apply_snapshot(state.snapshot(include_board=True))
+        client.take_view_delta()
+        state.delta_snapshot()
+        state.board.categories[0].tiles[0].used = True
+        state.mark_dirty("board")
+        client.apply_snapshot(state.delta_snapshot())
+        assert client.take_view_delta() == {"board"}
+
+
 # ---------------------------------------------------------------------------
 # Fragen-Runde
 # ---------------------------------------------------------------------------
@@ -0,0 +1,85 @@
+"""Tests für asset_meta — Bildgrößen und MP3-Dauer aus den Datei-Headern."""
+import struct
+import zlib
+
+from asset_meta import iter_mp3_frames, probe_file, probe_image, probe_mp3
+
+# MPEG-1 Layer III, 128 kbit/s, 44,1 kHz, Stereo, ohne Padding → 417 Bytes pro Frame
+_FRAME_HEADER = b"\xff\xfb\x90\x00"
+_FRAME_LEN = 417
+
+
+def _mp3(frames: int, id3: bytes = b"", info_frame: bool = False, junk: bytes = b"") -> bytes:
+    body = bytearray()
+    if info_frame:
+        frame = bytearray(_FRAME_HEADER + bytes(_FRAME_LEN - 4))
+        frame[4 + 32:4 + 36] = b"Info"
+        body += frame
+    body += junk
+    for _ in range(frames):
+        body += _FRAME_HEADER + bytes(_FRAME_LEN - 4)
+    return id3 + bytes(body)
+
+
+def _id3(payload_len: int) -> bytes:
+    size = bytes((payload_len >> s) & 0x7F for s in (21, 14, 7, 0))
+    return b"ID3\x03\x00\x00" + size + bytes(payload_len)
+
+
+def _png(w: int, h: int) -> bytes:
+    ihdr = struct.pack(">IIBBBBB", w, h, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + struct.pack(">I", len(ihdr)) + b"IHDR" + ihdr
+            + struct.pack(">I", zlib.crc32(b"IHDR" + ihdr)))
+
+
+def _jpeg(w: int, h: int) -> bytes:
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + bytes(9)
+    sof = b"\xff\xc2" + struct.pack(">HBHHB", 11, 8, h, w, 1) + bytes(3)
+    return b"\xff\xd8" + app0 + sof + b"\xff\xd9"
+
+
+class TestProbeMp3:
+    def test_duration_and_bitrate(self):
+        meta = probe_mp3(_mp3(100))
+        assert meta["duration_ms"] == 100 * 1152 * 1000 // 44100
+        assert meta["sample_rate"] == 44100
+        assert meta["frames"] == 100
+        assert abs(meta["bitrate_kbps"] - 128) <= 1
+
+    def test_skips_id3v2_tag(self):
+        assert probe_mp3(_mp3(50, id3=_id3(300)))["frames"] == 50
+
+    def test_info_frame_is_not_audio(self):
+        assert probe_mp3(_mp3(50, info_frame=True))["frames"] == 50
+
+    def test_resyncs_after_junk(self):
+        frames = list(iter_mp3_frames(_mp3(20, junk=b"\x00\xff\x12" * 5)))
+        assert len(frames) == 20
+
+    def test_no_frames(self):
+        assert probe_mp3(b"kein mp3") is None
+
+
+class TestProbeImage:
+    def test_png(self):
+        assert probe_image(_png(640, 480)) == (640, 480)
+
+    def test_jpeg(self):
+        assert probe_image(_jpeg(800, 600)) == (800, 600)
+
+    def test_unknown_format(self):
+        assert probe_image(b"GIF89a") is None
+
+
+class TestProbeFile:
+    def test_image_file(self, tmp_path):
+        path = tmp_path / "bild.png"
+        path.write_bytes(_png(10, 20))
+        meta = probe_file(path)
+        assert (meta["width"], meta["height"], meta["size"]) == (10, 20, path.stat().st_size)
+        assert len(meta["sha256"]) == 64
+
+    def test_audio_file(self, tmp_path):
+        path = tmp_path / "ton.mp3"
+        path.write_bytes(_mp3(10))
+        assert probe_file(path)["duration_ms"] == 10 * 1152 * 1000 // 44100
@@ -0,0 +1,70 @@
+"""Tests für async_io — blockierende I/O im Thread-Pool statt auf der Event-Loop."""
+import asyncio
+import json
+import threading
+
+import pytest
+from unittest.mock import patch
+
+import async_io
+import board_loader
+
+
+@pytest.fixture
+def boards_dir(tmp_path):
+    board_dir = tmp_path / "b1"
+    board_dir.mkdir()
+    (board_dir / "board.json").write_text(json.dumps({
+        "title": "Eins",
+        "categories": [{"title": "K", "tiles": [{"value": 100, "question": {"prompt": "P", "answer": "A"}}]}],
+    }), encoding="utf-8")
+    with patch.object(board_loader, "BOARDS_DIR", tmp_path):
+        yield tmp_path
+
+
+class TestAsyncIO:
+    def test_runs_off_the_event_loop_thread(self):
+        async def main():
+            return threading.get_ident(), await async_io.run_io(threading.get_ident)
+
+        loop_thread, worker_thread = asyncio.run(main())
+        assert loop_thread != worker_thread
+
+    def test_exceptions_arrive_at_await(self, boards_dir):
+        with pytest.raises(ValueError):
+            asyncio.run(async_io.load_board("fehlt"))
+
+    def test_load_and_list_boards(self, boards_dir):
+        board = asyncio.run(async_io.load_board("b1"))
+        assert board.categories[0].tiles[0].value == 100
+        assert asyncio.run(async_io.list_boards()) == [("b1", "Eins", False)]
+
+    def test_asset_meta_and_peaks_resolved_in_pool(self, boards_dir):
+        import waveform_peaks
+        (boards_dir / "b1" / "sounds").mkdir()
+        (boards_dir / "b1" / "sounds" / "a.mp3").write_bytes(b"kein mp3")
+        (boards_dir / "b1" / "board.json").write_text(json.dumps({"title": "Eins", "categories": [
+            {"title": "K", "tiles": [{"value": 100, "question": {
+                "type": "audio", "prompt": "P", "answer": "A", "assets": ["sounds/a.mp3"]}}]},
+        ]}), encoding="utf-8")
+        board_loader.clear_board_cache()
+        threads = []
+        probe, lookup = board_loader.probe_file, waveform_peaks.peaks_for
+
+        def record(fn):
+            def wrapper(*args):
+                threads.append(threading.current_thread().name)
+                return fn(*args)
+            return wrapper
+
+        with patch.object(board_loader, "probe_file", record(probe)), \
+                patch.object(waveform_peaks, "peaks_for", record(lookup)):
+            board = asyncio.run(async_io.load_board("b1"))
+        assert len(threads) == 2
+        assert all(name.startswith("jeopardy-io") for name in threads)
+        assert str((boards_dir / "b1" / "sounds" / "a.mp3").resolve()) in board.asset_meta
+
+    def test_write_bytes_creates_directory(self, tmp_path):
+        dest = tmp_path / "sounds" / "x.mp3"
+        asyncio.run(async_io.write_bytes(dest, b"abc"))
+        assert dest.read_bytes() == b"abc"
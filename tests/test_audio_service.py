@@ -0,0 +1,52 @@
+"""Tests für views.audio_service — ein Frage-Player pro Session, src-Tausch."""
+from pathlib import Path
+from types import SimpleNamespace
+
+from views.audio_service import AudioService
+
+
+def _service(assets_dir=Path("/nonexistent")):
+    page = SimpleNamespace(services=[], update=lambda: None)
+    return AudioService(page, assets_dir), page
+
+
+class TestAudioService:
+    def test_same_src_keeps_player_and_caches(self):
+        svc, page = _service()
+        svc.set_question_src("assets/a.mp3")
+        svc.apply_pending()
+        player = svc.question
+        svc.duration_ms = 30_000
+        for _ in range(5):  # Rebuilds durch Buzzes/Schätzungen
+            svc.set_question_src("assets/a.mp3")
+            svc.apply_pending()
+        assert svc.question is player
+        assert svc.duration_ms == 30_000
+        assert page.services == [player]
+        assert svc.created == 1
+
+    def test_new_asset_swaps_src(self):
+        svc, page = _service()
+        for src in ("assets/a.mp3", "assets/b.mp3"):
+            svc.set_question_src(src)
+            svc.apply_pending()
+        assert svc.question.src == "assets/b.mp3"
+        assert svc.duration_ms is None
+        assert (svc.created, svc.questions, svc.src_swaps) == (1, 2, 1)
+        assert len(page.services) == 1
+
+    def test_sounds_loaded_once(self, tmp_path):
+        (tmp_path / "buzz.mp3").write_bytes(b"")
+        svc, page = _service(tmp_path)
+        svc.load_sounds()
+        svc.load_sounds()
+        assert list(svc.sounds) == ["buzz"]
+        assert svc.created == 1
+
+    def test_end_game_reports_once_and_resets(self):
+        svc, _ = _service()
+        svc.set_question_src("assets/a.mp3")
+        svc.apply_pending()
+        assert "1 Audio-Controls" in svc.end_game()
+        assert (svc.created, svc.questions, svc.src_swaps) == (0, 0, 0)
+        assert svc.end_game() is None  # nichts Neues im nächsten Spiel
@@ -0,0 +1,54 @@
+"""Tests für views.board_grid — Tiles werden per data["apply"] in-place nachgezogen."""
+from types import SimpleNamespace
+
+from app_state import AppState
+from models.models import build_dummy_board
+from views.board_grid import board_grid_view
+
+
+def _grid(can_pick_tile: bool):
+    state = AppState()
+    state.board = build_dummy_board()
+    state.take_view_delta()
+    host = board_grid_view(SimpleNamespace(width=1400), state, can_pick_tile=can_pick_tile)
+    rows = host.content.controls[0].controls[1:]
+    # (cat_i, tile_i) -> innerer Button bzw. Text
+    inner = {(c, r): cell.content for r, row in enumerate(rows) for c, cell in enumerate(row.controls)}
+    return state, host, inner
+
+
+def _shown(inner) -> dict:
+    return {key: (ctrl.disabled, getattr(ctrl, "value", None)) for key, ctrl in inner.items()}
+
+
+class TestBoardGridApply:
+    def test_used_tile_touches_only_that_tile(self):
+        for can_pick_tile in (True, False):
+            state, host, inner = _grid(can_pick_tile)
+            before = _shown(inner)
+            controls = dict(inner)
+
+            state.board.categories[2].tiles[3].used = True
+            state.mark_dirty("board")
+            assert host.data["apply"](state.take_view_delta())
+
+            after = _shown(inner)
+            changed = {key for key in before if before[key] != after[key]}
+            assert changed == {(2, 3)}
+            assert all(inner[key] is controls[key] for key in inner)
+            if can_pick_tile:
+                assert inner[(2, 3)].disabled
+            else:
+                assert inner[(2, 3)].value == ""
+
+    def test_delta_without_board_changes_nothing(self):
+        state, host, inner = _grid(True)
+        before = _shown(inner)
+        state.board.categories[0].tiles[0].used = True
+        assert host.data["apply"]({"players"})
+        assert _shown(inner) == before
+
+    def test_other_board_requests_rebuild(self):
+        state, host, _inner = _grid(True)
+        state.board = build_dummy_board()
+        assert host.data["apply"]({"board"}) is False
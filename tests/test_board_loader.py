@@ -144,3 +144,146 @@ class TestListBoards:
         boards = loader.list_boards()
         ids = [b[0] for b in boards]
         assert "kein-board" not in ids
+
+
+class TestBoardCache:
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self, loader):
+        loader.clear_board_cache()
+        yield
+        loader.clear_board_cache()
+
+    def test_second_load_does_not_reparse(self, loader):
+        loader.load_board("testboard")
+        with patch.object(loader, "_parse_board", side_effect=AssertionError("reparsed")):
+            board = loader.load_board("testboard")
+        assert board.title == "Testboard"
+
+    def test_each_load_gets_own_used_flags(self, loader):
+        a = loader.load_board("testboard")
+        b = loader.load_board("testboard")
+        a.categories[0].tiles[0].used = True
+        assert b.categories[0].tiles[0].used is False
+        assert loader.load_board("testboard").categories[0].tiles[0].used is False
+
+    def test_cache_hit_does_not_scan_assets(self, loader):
+        first = loader.load_board("testboard")
+        with patch.object(loader, "board_asset_meta", side_effect=AssertionError("scanned")):
+            board = loader.load_board("testboard")
+        assert board.asset_meta == first.asset_meta
+
+    def test_questions_are_shared(self, loader):
+        a = loader.load_board("testboard")
+        b = loader.load_board("testboard")
+        assert a.categories[0].tiles[1].question is b.categories[0].tiles[1].question
+
+    def test_changed_file_is_reloaded(self, loader, boards_dir):
+        loader.load_board("testboard")
+        json_path = boards_dir / "testboard" / "board.json"
+        data = json.loads(json_path.read_text(encoding="utf-8"))
+        data["title"] = "Neuer Titel, länger als vorher"
+        json_path.write_text(json.dumps(data), encoding="utf-8")
+        assert loader.load_board("testboard").title == "Neuer Titel, länger als vorher"
+
+    def test_lru_eviction_respects_memory_cap(self, loader, boards_dir):
+        size = (boards_dir / "testboard" / "board.json").stat().st_size
+        other = boards_dir / "other"
+        other.mkdir()
+        (other / "board.json").write_text(
+            (boards_dir / "testboard" / "board.json").read_text(encoding="utf-8"), encoding="utf-8"
+        )
+        with patch.object(loader, "_BOARD_CACHE_MAX_BYTES", size + 1):
+            loader.load_board("testboard")
+            loader.load_board("other")
+        assert list(loader._BOARD_CACHE) == [str(other / "board.json")]
+
+
+class TestBoardCatalog:
+    def test_catalog_contains_metadata(self, loader):
+        meta = loader.board_catalog()["testboard"]
+        assert meta["title"] == "Testboard"
+        assert meta["wip"] is False
+        assert meta["num_categories"] == 1
+        assert meta["num_questions"] == 2
+        assert meta["asset_count"] == 1
+
+    def test_catalog_file_is_written(self, loader, boards_dir):
+        loader.list_boards()
+        raw = json.loads((boards_dir / loader.CATALOG_FILE).read_text(encoding="utf-8"))
+        assert "testboard" in raw["boards"]
+
+    def test_unchanged_boards_are_not_reread(self, loader):
+        loader.list_boards()
+        with patch.object(loader, "_read_board_meta", side_effect=AssertionError("reread")):
+            assert loader.list_boards()[0][0] == "testboard"
+
+    def test_catalog_file_survives_restart(self, loader):
+        loader.list_boards()
+        loader._CATALOG[0] = None  # neuer Prozess: nur die Index-Datei ist da
+        with patch.object(loader, "_read_board_meta", side_effect=AssertionError("reread")):
+            assert [b[0] for b in loader.list_boards()] == ["testboard"]
+
+    def test_changed_board_is_reread(self, loader, boards_dir):
+        loader.list_boards()
+        json_path = boards_dir / "testboard" / "board.json"
+        data = json.loads(json_path.read_text(encoding="utf-8"))
+        data["wip"] = True
+        data["title"] = "Umbenannt"
+        json_path.write_text(json.dumps(data), encoding="utf-8")
+        assert loader.list_boards() == [("testboard", "Umbenannt", True)]
+
+    def test_deleted_board_disappears(self, loader, boards_dir):
+        import shutil
+        loader.list_boards()
+        shutil.rmtree(boards_dir / "testboard")
+        assert loader.list_boards() == []
+        assert loader.board_catalog() == {}
+
+    def test_invalid_board_is_skipped(self, loader, boards_dir):
+        broken = boards_dir / "kaputt"
+        broken.mkdir()
+        (broken / "board.json").write_text("{ kaputt", encoding="utf-8")
+        assert [b[0] for b in loader.list_boards()] == ["testboard"]
+
+    def test_corrupt_catalog_file_is_ignored(self, loader, boards_dir):
+        (boards_dir / loader.CATALOG_FILE).write_text("{ kaputt", encoding="utf-8")
+        loader._CATALOG[0] = None
+        assert [b[0] for b in loader.list_boards()] == ["testboard"]
+
+
+class TestAssetMeta:
+    def test_sidecar_contains_image_dimensions(self, loader, boards_dir):
+        from tests.test_asset_meta import _png
+        (boards_dir / "testboard" / "images" / "test.png").write_bytes(_png(40, 30))
+        meta = loader.board_asset_meta("testboard")["images/test.png"]
+        assert (meta["width"], meta["height"]) == (40, 30)
+        raw = json.loads((boards_dir / "testboard" / loader.ASSET_META_FILE).read_text(encoding="utf-8"))
+        assert "images/test.png" in raw["assets"]
+
+    def test_load_board_builds_sidecar(self, loader, boards_dir):
+        loader.load_board("testboard")
+        assert (boards_dir / "testboard" / loader.ASSET_META_FILE).exists()
+
+    def test_load_board_attaches_render_meta(self, loader, boards_dir):
+        from tests.test_asset_meta import _png
+        path = boards_dir / "testboard" / "images" / "test.png"
+        path.write_bytes(_png(40, 30))
+        board = loader.load_board("testboard")
+        assert board.asset_meta == {str(path.resolve()): {"width": 40, "height": 30}}
+
+    def test_unchanged_assets_are_not_reprobed(self, loader):
+        loader.board_asset_meta("testboard")
+        loader._ASSET_META.clear()  # neuer Prozess: nur die Sidecar-Datei ist da
+        with patch.object(loader, "probe_file", side_effect=AssertionError("reprobed")):
+            assert "images/test.png" in loader.board_asset_meta("testboard")
+
+    def test_asset_meta_by_resolved_path(self, loader, boards_dir):
+        from tests.test_asset_meta import _png
+        path = boards_dir / "testboard" / "images" / "test.png"
+        path.write_bytes(_png(5, 6))
+        assert loader.asset_meta(str(path.resolve()))["width"] == 5
+        path.write_bytes(_png(7, 8) + b"x")  # neue Größe → neu vermessen
+        assert loader.asset_meta(str(path.resolve()))["width"] == 7
+
+    def test_asset_meta_missing_file(self, loader, boards_dir):
+        assert loader.asset_meta(str(boards_dir / "testboard" / "images" / "fehlt.png")) is None
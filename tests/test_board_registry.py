@@ -0,0 +1,86 @@
+"""Tests für board_registry — geteilte Board-Templates pro Content-Hash."""
+import pytest
+from unittest.mock import patch
+
+import board_registry
+from app_state import AppState
+from board_registry import intern_board, clear_templates, template_count
+from models.models import build_dummy_board
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    clear_templates()
+    yield
+    clear_templates()
+
+
+class TestInternBoard:
+    def test_build_called_once_per_hash(self):
+        calls = []
+
+        def build():
+            calls.append(1)
+            return build_dummy_board()
+
+        intern_board("h1", build)
+        intern_board("h1", build)
+        assert len(calls) == 1
+        assert template_count() == 1
+
+    def test_copies_share_questions_but_not_tiles(self):
+        a = intern_board("h1", build_dummy_board)
+        b = intern_board("h1", build_dummy_board)
+        assert a is not b
+        assert a.categories[0].tiles[0] is not b.categories[0].tiles[0]
+        assert a.categories[0].tiles[0].question is b.categories[0].tiles[0].question
+
+    def test_used_flags_are_per_copy(self):
+        a = intern_board("h1", build_dummy_board)
+        a.categories[0].tiles[0].used = True
+        b = intern_board("h1", build_dummy_board)
+        assert b.categories[0].tiles[0].used is False
+
+    def test_template_ignores_used_flags_of_built_board(self):
+        def build():
+            board = build_dummy_board()
+            board.categories[0].tiles[0].used = True
+            return board
+
+        assert intern_board("h1", build).categories[0].tiles[0].used is False
+
+    def test_lru_limit(self):
+        with patch.object(board_registry, "_MAX_TEMPLATES", 2):
+            for h in ("a", "b", "c"):
+                intern_board(h, build_dummy_board)
+        assert list(board_registry._TEMPLATES) == ["b", "c"]
+
+
+class TestApplySnapshotInterning:
+    def test_sessions_share_questions(self):
+        host = AppState()
+        host.board = build_dummy_board()
+        snap = host.snapshot(include_board=True)
+
+        p1, p2 = AppState(), AppState()
+        p1.apply_snapshot(snap)
+        p2.apply_snapshot(snap)
+
+        q1 = p1.board.categories[3].tiles[2].question
+        assert q1 is p2.board.categories[3].tiles[2].question
+        assert q1.prompt == host.board.categories[3].tiles[2].question.prompt
+
+    def test_used_state_stays_per_session(self):
+        host = AppState()
+        host.board = build_dummy_board()
+        host.board.categories[0].tiles[0].used = True
+        snap = host.snapshot(include_board=True)
+
+        p1, p2 = AppState(), AppState()
+        p1.apply_snapshot(snap)
+        p2.apply_snapshot(snap)
+        p1.board.categories[0].tiles[1].used = True
+
+        assert p1.board.categories[0].tiles[0].used is True
+        assert p2.board.categories[0].tiles[0].used is True
+        assert p2.board.categories[0].tiles[1].used is False
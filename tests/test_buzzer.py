@@ -0,0 +1,112 @@
+"""Tests für buzzer — Buzz-Reihenfolge nach Zeitstempel statt nach Thread-Glück."""
+import asyncio
+import time
+from buzzer import BuzzArbiter, arrival_stamp
+
+
+class TestArrivalStamp:
+    def test_plausible_stamp_is_kept(self):
+        now = time.monotonic_ns()
+        assert arrival_stamp(now - 5_000_000, now) == now - 5_000_000
+
+    def test_future_stamp_falls_back_to_receipt(self):
+        now = time.monotonic_ns()
+        assert arrival_stamp(now + 1, now) == now
+
+    def test_stale_or_missing_stamp_falls_back_to_receipt(self):
+        now = time.monotonic_ns()
+        assert arrival_stamp(now - 5_000_000_000, now) == now
+        assert arrival_stamp(0, now) == now
+        assert arrival_stamp(None, now) == now
+
+
+class TestBuzzArbiter:
+    def test_earliest_stamp_wins_regardless_of_arrival_order(self, run_scenario):
+        decisions = []
+
+        async def scenario(run_task):
+            arb = BuzzArbiter(run_task, decisions.append, window_s=0.01)
+            now = time.monotonic_ns()
+            arb.submit("late", now - 1_000_000)
+            arb.submit("early", now - 3_000_000)
+            arb.submit("middle", now - 2_000_000)
+
+        run_scenario(scenario)
+        assert len(decisions) == 1
+        assert decisions[0].order == ("early", "middle", "late")
+        assert decisions[0].winner == "early"
+
+    def test_duplicate_buzzes_count_once(self, run_scenario):
+        decisions = []
+
+        async def scenario(run_task):
+            arb = BuzzArbiter(run_task, decisions.append, window_s=0)
+            arb.submit("p1")
+            arb.submit("p1")
+            arb.submit("p2")
+
+        run_scenario(scenario)
+        assert decisions[0].order == ("p1", "p2")
+
+    def test_rounds_after_decision_are_separate(self, run_scenario):
+        decisions = []
+
+        async def scenario(run_task):
+            arb = BuzzArbiter(run_task, decisions.append, window_s=0)
+            arb.submit("p1")
+            await asyncio.sleep(0.01)
+            arb.submit("p2")
+
+        run_scenario(scenario)
+        assert [d.order for d in decisions] == [("p1",), ("p2",)]
+
+    def test_reset_drops_pending_round(self, run_scenario):
+        decisions = []
+
+        async def scenario(run_task):
+            arb = BuzzArbiter(run_task, decisions.append, window_s=0.01)
+            arb.submit("p1")
+            arb.reset()
+
+        run_scenario(scenario)
+        assert decisions == []
+
+    def test_stale_window_does_not_decide_next_round(self, run_scenario):
+        decisions = []
+        seen = {}
+
+        async def scenario(run_task):
+            arb = BuzzArbiter(run_task, decisions.append, window_s=0.02)
+            arb.submit("p1")
+            await asyncio.sleep(0.01)
+            arb.reset()          # Buzzer neu geöffnet
+            arb.submit("p2")
+            await asyncio.sleep(0.015)  # altes Fenster ist abgelaufen, neues noch nicht
+            seen["early"] = list(decisions)
+
+        run_scenario(scenario)
+        assert seen["early"] == []
+        assert [d.order for d in decisions] == [("p2",)]
+
+    def test_decides_synchronously_without_loop(self):
+        decisions = []
+
+        def broken_run_task(_handler, *_args):
+            raise RuntimeError("keine Verbindung")
+
+        BuzzArbiter(broken_run_task, decisions.append).submit("p1")
+        assert decisions[0].winner == "p1"
+
+    def test_correction_reorders_by_latency(self, run_scenario):
+        decisions = []
+        latency = {"mobile": 5_000_000, "lan": 0}
+
+        async def scenario(run_task):
+            arb = BuzzArbiter(run_task, decisions.append, window_s=0.01,
+                              correct=lambda pid, t: t - latency[pid])
+            now = time.monotonic_ns()
+            arb.submit("lan", now - 2_000_000)
+            arb.submit("mobile", now - 1_000_000)  # später angekommen, aber früher geklickt
+
+        run_scenario(scenario)
+        assert decisions[0].order == ("mobile", "lan")
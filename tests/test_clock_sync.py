@@ -0,0 +1,122 @@
+"""Tests für clock_sync — Latenzschätzung und begrenzte Buzz-Korrektur."""
+import asyncio
+import pytest
+import clock_sync
+from clock_sync import (
+    LatencyEstimate, correction_ns, corrected_stamp, drop_lobby, forget, get_estimate, latency_spread_ns,
+    measure_rtt, record_rtt, track,
+)
+
+MS = 1_000_000
+
+
+@pytest.fixture(autouse=True)
+def _clean():
+    yield
+    drop_lobby("", ("p1", "p2", "lan", "cheat"))
+    drop_lobby("L1", ("p2",))
+
+
+class TestLatencyEstimate:
+    def test_min_filter_ignores_outliers(self):
+        est = LatencyEstimate()
+        for rtt in (200, 210, 900, 205):
+            est.add(rtt * MS)
+        assert est.rtt_ns == 200 * MS
+        assert est.one_way_ns == 100 * MS
+        assert est.jitter_ns == 700 * MS
+
+    def test_rolling_window(self):
+        est = LatencyEstimate(size=2)
+        est.add(10 * MS)
+        est.add(50 * MS)
+        est.add(60 * MS)
+        assert est.rtt_ns == 50 * MS
+        assert est.samples == 2
+
+    def test_empty_and_invalid_samples(self):
+        est = LatencyEstimate()
+        est.add(0)
+        est.add(-5)
+        assert est.rtt_ns is None
+        assert est.one_way_ns == 0
+
+
+class TestCorrectedStamp:
+    def test_unknown_player_is_not_corrected(self):
+        assert corrected_stamp("p1", 1_000 * MS) == 1_000 * MS
+
+    def test_subtracts_half_rtt(self):
+        record_rtt("p1", 200 * MS)
+        assert corrected_stamp("p1", 1_000 * MS) == 900 * MS
+
+    def test_correction_is_bounded(self):
+        record_rtt("p1", 2_000 * MS)
+        assert corrected_stamp("p1", 1_000 * MS, max_correction_ns=150 * MS) == 850 * MS
+
+    def test_correction_bounded_by_fastest_player(self):
+        record_rtt("lan", 6 * MS)
+        record_rtt("p1", 300 * MS)
+        assert correction_ns("p1", ["lan", "p1"], max_spread_ns=60 * MS) == 63 * MS
+        assert correction_ns("lan", ["lan", "p1"], max_spread_ns=60 * MS) == 3 * MS
+
+    def test_delayed_pings_do_not_win_a_later_click(self):
+        # Cheater (echt 20 ms one-way) verzögert Ping-Antworten um 400 ms und klickt
+        # 50 ms nach dem LAN-Spieler (3 ms one-way)
+        for _ in range(8):
+            record_rtt("lan", 6 * MS)
+            record_rtt("cheat", 40 * MS + 400 * MS)
+        lobby = ["lan", "cheat"]
+        lan_arrival = 3 * MS
+        cheat_arrival = 50 * MS + 20 * MS
+        # früher: Korrektur nur absolut auf 150 ms gedeckelt → Cheater vorne
+        assert (corrected_stamp("cheat", cheat_arrival, max_correction_ns=150 * MS)
+                < corrected_stamp("lan", lan_arrival, max_correction_ns=150 * MS))
+        assert (corrected_stamp("cheat", cheat_arrival, lobby, max_spread_ns=60 * MS)
+                > corrected_stamp("lan", lan_arrival, lobby, max_spread_ns=60 * MS))
+
+    def test_forget(self):
+        record_rtt("p2", 10 * MS)
+        forget("p2")
+        assert get_estimate("p2") is None
+
+    def test_samples_after_forget_are_ignored_until_rejoin(self):
+        forget("p2")
+        record_rtt("p2", 10 * MS)  # Ping war beim Verlassen noch unterwegs
+        assert get_estimate("p2") is None
+        track("p2")
+        record_rtt("p2", 10 * MS)
+        assert get_estimate("p2").rtt_ns == 10 * MS
+
+    def test_forget_is_scoped_to_the_lobby(self):
+        forget("p2", "L1")
+        record_rtt("p2", 10 * MS, "L2")  # inzwischen in einer anderen Lobby
+        assert get_estimate("p2").rtt_ns == 10 * MS
+
+    def test_drop_lobby_releases_tombstones(self):
+        forget("p2", "L1")
+        drop_lobby("L1", ("p2",))
+        assert "L1" not in clock_sync._FORGOTTEN
+        track("p1", "L1")
+        assert "L1" not in clock_sync._FORGOTTEN  # track legt nichts an
+
+
+def test_measure_rtt():
+    async def ping():
+        await asyncio.sleep(0.01)
+
+    rtt = asyncio.run(measure_rtt(ping))
+    assert rtt >= 10 * MS
+
+
+class TestLatencySpread:
+    def test_spread_between_fastest_and_slowest(self):
+        record_rtt("p1", 20 * MS)
+        record_rtt("p2", 220 * MS)
+        assert latency_spread_ns(["p1", "p2"], max_spread_ns=200 * MS) == 100 * MS
+        assert latency_spread_ns(["p1", "p2"], max_spread_ns=60 * MS) == 60 * MS
+
+    def test_unknown_players_count_as_zero_and_spread_is_bounded(self):
+        record_rtt("p1", 2_000 * MS)
+        assert latency_spread_ns(["p1", "x"], max_correction_ns=250 * MS) == 250 * MS
+        assert latency_spread_ns([]) == 0
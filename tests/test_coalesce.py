@@ -0,0 +1,102 @@
+"""Tests für coalesce — mehrere Anforderungen pro Fenster → ein Flush."""
+import asyncio
+import operator
+from coalesce import Coalescer
+
+
+class TestCoalescer:
+    def test_requests_in_same_tick_flush_once(self, run_scenario):
+        flushed = []
+
+        async def scenario(run_task):
+            c = Coalescer(run_task, flushed.append, merge=operator.or_)
+            c.request(False)
+            c.request(True)
+            c.request(False)
+
+        run_scenario(scenario)
+        assert flushed == [True]
+
+    def test_flush_happens_after_current_tick(self, run_scenario):
+        flushed = []
+
+        async def scenario(run_task):
+            c = Coalescer(run_task, flushed.append)
+            c.request("a")
+            assert flushed == []
+            await asyncio.sleep(0.01)
+            assert flushed == ["a"]
+
+        run_scenario(scenario)
+
+    def test_separate_ticks_flush_separately(self, run_scenario):
+        flushed = []
+
+        async def scenario(run_task):
+            c = Coalescer(run_task, flushed.append)
+            c.request(1)
+            await asyncio.sleep(0.01)
+            c.request(2)
+
+        run_scenario(scenario)
+        assert flushed == [1, 2]
+
+    def test_window_merges_requests_across_ticks(self, run_scenario):
+        flushed = []
+
+        async def scenario(run_task):
+            c = Coalescer(run_task, flushed.append, window_s=0.05)
+            c.request(1)
+            await asyncio.sleep(0.01)
+            c.request(2)
+
+        run_scenario(scenario)
+        assert flushed == [2]
+
+    def test_async_flush_is_awaited(self, run_scenario):
+        flushed = []
+
+        async def flush(value):
+            await asyncio.sleep(0)
+            flushed.append(value)
+
+        async def scenario(run_task):
+            Coalescer(run_task, flush).request("x")
+
+        run_scenario(scenario)
+        assert flushed == ["x"]
+
+    def test_flush_now_runs_pending_immediately(self, run_scenario):
+        flushed = []
+
+        async def scenario(run_task):
+            c = Coalescer(run_task, flushed.append)
+            c.request(1)
+            c.flush_now()
+            assert flushed == [1]
+
+        run_scenario(scenario)
+        assert flushed == [1]
+
+    def test_falls_back_to_sync_flush_without_loop(self):
+        flushed = []
+
+        def broken_run_task(_handler):
+            raise RuntimeError("keine Verbindung")
+
+        c = Coalescer(broken_run_task, flushed.append)
+        c.request(1)
+        assert flushed == [1]
+
+    def test_cancel_drops_pending(self, run_scenario):
+        flushed = []
+
+        async def scenario(run_task):
+            c = Coalescer(run_task, flushed.append, window_s=0.01)
+            c.request(1)
+            c.cancel()
+            await asyncio.sleep(0.02)
+            c.request(2)
+
+        run_scenario(scenario)
+        assert flushed == [2]
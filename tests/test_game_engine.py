@@ -0,0 +1,268 @@
+"""Tests für game_engine — Intents werden ohne Host-Session angewendet."""
+import pytest
+import clock_sync
+from app_state import AppState
+from game_engine import BUZZ, ESTIMATE, REFRESH, GameEngine, get_engine, start_engine, stop_engine
+from lobby_messages import PlayerBuzz, PlayerEstimate, PlayerEstimateLock, PlayerJoin, PlayerLeave
+from lobby_pubsub import LobbyChannel
+from lobby_store import LOBBIES
+from models.models import build_dummy_board
+
+
+@pytest.fixture(autouse=True)
+def _clean_lobbies():
+    yield
+    for lid in ("E1", "E2"):
+        LOBBIES.pop(lid, None)
+        stop_engine(lid)
+
+
+def _player(hub, lobby_id):
+    inbox = []
+    channel = LobbyChannel(hub.client(), inbox.append)
+    channel.join(lobby_id)
+    return channel, inbox
+
+
+def _engine(hub, run_task, lobby_id="E1"):
+    state = AppState()
+    state.board = build_dummy_board()
+    events = []
+    engine = GameEngine(lobby_id, state, hub.client(), run_task)
+    engine.add_listener(lambda event, _snap: events.append(event))
+    return engine, events
+
+
+class TestGameEngine:
+    def test_join_sends_players_delta_and_stores_board(self, hub, run_scenario):
+        result = {}
+
+        async def scenario(run_task):
+            engine, events = _engine(hub, run_task)
+            player, inbox = _player(hub, "E1")
+            player.send_to_host(PlayerJoin(player_id="p1", name="Anna").to_message("E1"))
+            result.update(engine=engine, events=events, inbox=inbox)
+
+        run_scenario(scenario)
+        engine, inbox = result["engine"], result["inbox"]
+        assert [p.name for p in engine.state.players] == ["Anna"]
+        assert REFRESH in result["events"]
+        states = [m for m in inbox if m.type == "lobby_state"]
+        assert len(states) == 1
+        assert "board" not in states[0].payload["data"]
+        assert [p["name"] for p in states[0].payload["data"]["players"]] == ["Anna"]
+        assert LOBBIES["E1"].board is not None  # für den Resync des neuen Spielers
+
+    def test_estimate_notifies_without_broadcast(self, hub, run_scenario):
+        result = {}
+
+        async def scenario(run_task):
+            engine, events = _engine(hub, run_task)
+            player, inbox = _player(hub, "E1")
+            for answer in ("1", "12", "123"):
+                player.send_to_host(PlayerEstimate(player_id="p1", answer=answer).to_message("E1"))
+            result.update(engine=engine, events=events, inbox=inbox)
+
+        run_scenario(scenario)
+        assert result["engine"].state.estimates == {"p1": "123"}
+        assert result["events"] == [ESTIMATE] * 3
+        assert result["inbox"] == []
+
+    def test_estimate_after_lock_is_ignored(self, hub, run_scenario):
+        result = {}
+
+        async def scenario(run_task):
+            engine, _ = _engine(hub, run_task)
+            player, _ = _player(hub, "E1")
+            player.send_to_host(PlayerEstimateLock(player_id="p1", answer="42").to_message("E1"))
+            player.send_to_host(PlayerEstimate(player_id="p1", answer="7").to_message("E1"))
+            result["engine"] = engine
+
+        run_scenario(scenario)
+        assert result["engine"].state.estimates == {"p1": "42"}
+        assert result["engine"].state.estimates_locked == ["p1"]
+
+    def test_buzz_decision_sets_answerer(self, hub, run_scenario):
+        result = {}
+
+        async def scenario(run_task):
+            engine, events = _engine(hub, run_task)
+            engine.state.add_player("p1", "A")
+            engine.state.add_player("p2", "B")
+            engine.state.open_buzzer()
+            player, inbox = _player(hub, "E1")
+            player.send_to_host(PlayerBuzz(player_id="p2").to_message("E1"))
+            player.send_to_host(PlayerBuzz(player_id="p1").to_message("E1"))
+            result.update(engine=engine, events=events, inbox=inbox)
+
+        run_scenario(scenario)
+        state = result["engine"].state
+        assert state.buzzer_open is False
+        assert state.buzzed_queue == [1, 0]
+        assert BUZZ in result["events"]
+        sounds = [m.payload["name"] for m in result["inbox"] if m.type == "play_sound"]
+        assert sounds == ["buzz"]  # einmal für die ganze Lobby
+
+    def test_reopening_buzzer_resets_arbiter(self, hub, run_scenario):
+        result = {}
+
+        async def scenario(run_task):
+            engine, events = _engine(hub, run_task)
+            engine.state.add_player("p1", "A")
+            engine.state.add_player("p2", "B")
+            engine.state.open_buzzer()
+            player, _ = _player(hub, "E1")
+            player.send_to_host(PlayerBuzz(player_id="p1").to_message("E1"))
+            engine.submit(AppState.open_buzzer)  # Host öffnet neu, bevor entschieden ist
+            result.update(engine=engine, events=events)
+
+        run_scenario(scenario)
+        assert result["engine"].state.buzzer_open is True
+        assert BUZZ not in result["events"]
+
+    def test_engines_are_isolated_per_lobby(self, hub, run_scenario):
+        result = {}
+
+        async def scenario(run_task):
+            e1, _ = _engine(hub, run_task, "E1")
+            e2, _ = _engine(hub, run_task, "E2")
+            player, _ = _player(hub, "E2")
+            player.send_to_host(PlayerJoin(player_id="p1", name="Bo").to_message("E2"))
+            result.update(e1=e1, e2=e2)
+
+        run_scenario(scenario)
+        assert result["e1"].state.players == []
+        assert [p.name for p in result["e2"].state.players] == ["Bo"]
+
+    def test_stop_unsubscribes_inbox(self, hub, run_scenario):
+        result = {}
+
+        async def scenario(run_task):
+            engine, _ = _engine(hub, run_task)
+            engine.stop()
+            player, _ = _player(hub, "E1")
+            player.send_to_host(PlayerJoin(player_id="p1").to_message("E1"))
+            result["engine"] = engine
+
+        run_scenario(scenario)
+        assert result["engine"].state.players == []
+
+    def test_stop_releases_latency_tombstones(self, hub, run_scenario):
+        async def scenario(run_task):
+            engine = start_engine("E1", AppState(), hub.client(), run_task)
+            player, _ = _player(hub, "E1")
+            player.send_to_host(PlayerJoin(player_id="p1", name="A").to_message("E1"))
+            player.send_to_host(PlayerLeave(player_id="p1").to_message("E1"))
+            engine.close()
+
+        run_scenario(scenario)
+        assert "E1" not in clock_sync._FORGOTTEN
+
+    def test_flush_sends_pending_broadcast_before_stop(self, hub, run_scenario):
+        result = {}
+
+        async def scenario(run_task):
+            engine, _ = _engine(hub, run_task)
+            player, inbox = _player(hub, "E1")
+            engine.state.screen = "menu"
+            engine.broadcast()
+            engine.flush()
+            engine.stop()
+            result["inbox"] = inbox
+
+        run_scenario(scenario)
+        states = [m for m in result["inbox"] if m.type == "lobby_state"]
+        assert len(states) == 1
+        assert states[0].payload["data"]["screen"] == "menu"
+
+    def test_submit_runs_host_command_on_engine_state(self, hub, run_scenario):
+        result = {}
+
+        def _pick(s, cat_i, tile_i):
+            s.selected = (cat_i, tile_i)
+            s.screen = "question"
+
+        async def scenario(run_task):
+            engine, events = _engine(hub, run_task)
+            player, inbox = _player(hub, "E1")
+            engine.submit(_pick, 1, 2)
+            result.update(engine=engine, events=events, inbox=inbox)
+
+        run_scenario(scenario)
+        assert result["engine"].state.selected == (1, 2)
+        assert result["events"] == [REFRESH]
+        states = [m for m in result["inbox"] if m.type == "lobby_state"]
+        assert states[-1].payload["data"]["screen"] == "question"
+
+    def test_close_broadcasts_menu_after_queued_commands(self, hub, run_scenario):
+        result = {}
+
+        async def scenario(run_task):
+            engine = start_engine("E1", AppState(), hub.client(), run_task)
+            player, inbox = _player(hub, "E1")
+            engine.submit(lambda s: setattr(s, "max_players", 6))
+            engine.close()
+            result["inbox"] = inbox
+
+        run_scenario(scenario)
+        data = {}
+        for m in result["inbox"]:
+            data.update(m.payload["data"])
+        assert data["screen"] == "menu"
+        assert data["max_players"] == 6
+        assert get_engine("E1") is None
+
+    def test_listener_gets_snapshot_not_engine_state(self, hub, run_scenario):
+        result = {}
+
+        async def scenario(run_task):
+            engine, _ = _engine(hub, run_task)
+            view = AppState()
+            view.apply_snapshot(engine.state.snapshot(include_board=True))
+            snaps = []
+            engine.add_listener(lambda _event, snap: (snaps.append(snap), view.apply_snapshot(snap)))
+            player, _ = _player(hub, "E1")
+            player.send_to_host(PlayerJoin(player_id="p1", name="Anna").to_message("E1"))
+            result.update(engine=engine, view=view, snaps=snaps)
+
+        run_scenario(scenario)
+        engine, view = result["engine"], result["view"]
+        assert "players" in result["snaps"][-1]
+        assert [p.name for p in view.players] == ["Anna"]
+        assert view.players[0] is not engine.state.players[0]
+        view.players[0].score = 500  # Host-Kopie ändern lässt die Engine unberührt
+        assert engine.state.players[0].score == 0
+
+
+class TestRegistry:
+    def test_engine_without_host_is_stopped_after_idle_timeout(self, hub, run_scenario):
+        result = {}
+
+        def host(_event, _snap):
+            pass
+
+        async def scenario(run_task):
+            orphaned = start_engine("E1", AppState(), hub.client(), run_task)
+            orphaned.idle_timeout_s = 0.01
+            orphaned.add_listener(host)
+            orphaned.remove_listener(host)  # Host-Tab geschlossen
+
+            kept = start_engine("E2", AppState(), hub.client(), run_task)
+            kept.idle_timeout_s = 0.01
+            kept.add_listener(host)
+            kept.remove_listener(host)
+            kept.add_listener(host)  # Reconnect innerhalb der Frist
+            result["kept"] = kept
+
+        run_scenario(scenario)  # wartet die Idle-Timer beider Engines ab
+        assert get_engine("E1") is None
+        assert get_engine("E2") is result["kept"]
+
+    def test_start_get_stop(self, hub):
+        state = AppState()
+        engine = start_engine("E1", state, hub.client(), lambda _h: None)
+        assert start_engine("E1", AppState(), hub.client(), lambda _h: None) is engine
+        assert get_engine("E1") is engine
+        stop_engine("E1")
+        assert get_engine("E1") is None
+        assert get_engine(None) is None
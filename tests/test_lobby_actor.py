@@ -0,0 +1,84 @@
+"""Tests für lobby_actor — Kommandos einer Lobby laufen nacheinander auf der Loop."""
+import asyncio
+import threading
+from lobby_actor import LobbyActor
+
+
+class TestLobbyActor:
+    def test_commands_run_in_order_as_one_batch(self, run_scenario):
+        applied = []
+
+        async def scenario(run_task):
+            actor = LobbyActor("L1", run_task)
+            for i in range(5):
+                actor.submit(applied.append, i)
+            assert applied == []  # erst auf der Loop
+            await asyncio.sleep(0.01)
+            assert actor.batches == 1
+            assert actor.processed == 5
+
+        run_scenario(scenario)
+        assert applied == [0, 1, 2, 3, 4]
+
+    def test_commands_from_threads_run_on_loop_thread(self, run_scenario):
+        threads = set()
+        counter = [0]
+
+        def increment():
+            threads.add(threading.get_ident())
+            value = counter[0]
+            counter[0] = value + 1
+
+        async def scenario(run_task):
+            actor = LobbyActor("L1", run_task)
+            workers = [threading.Thread(target=lambda: [actor.submit(increment) for _ in range(200)])
+                       for _ in range(4)]
+            for w in workers:
+                w.start()
+            for w in workers:
+                w.join()
+            await asyncio.sleep(0.05)
+            assert threads == {threading.get_ident()}
+
+        run_scenario(scenario)
+        assert counter[0] == 800
+
+    def test_async_command_is_awaited_before_next(self, run_scenario):
+        order = []
+
+        async def slow():
+            await asyncio.sleep(0.01)
+            order.append("slow")
+
+        async def scenario(run_task):
+            actor = LobbyActor("L1", run_task)
+            actor.submit(slow)
+            actor.submit(order.append, "fast")
+            await asyncio.sleep(0.05)
+
+        run_scenario(scenario)
+        assert order == ["slow", "fast"]
+
+    def test_failing_command_does_not_stop_queue(self, run_scenario):
+        applied = []
+
+        async def scenario(run_task):
+            actor = LobbyActor("L1", run_task)
+            actor.submit(lambda: 1 / 0)
+            actor.submit(applied.append, "ok")
+            await asyncio.sleep(0.01)
+
+        run_scenario(scenario)
+        assert applied == ["ok"]
+
+    def test_runs_synchronously_without_loop(self):
+        applied = []
+
+        def broken_run_task(_handler):
+            raise RuntimeError("keine Verbindung")
+
+        actor = LobbyActor("L1", broken_run_task)
+        actor.submit(applied.append, 1)
+        assert applied == [1]
+        assert actor.pending == 0
+
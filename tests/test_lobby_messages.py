@@ -0,0 +1,76 @@
+"""Tests für lobby_messages — typisierte Nachrichten und Dispatch-Tabelle."""
+import pytest
+from lobby_messages import (
+    MESSAGE_TYPES, Dispatcher, LobbyStateMessage, PlayerBuzz, PlayerEstimate, PlayerJoin,
+    PlayQuestionAudio, parse,
+)
+from lobby_pubsub import freeze
+
+
+class TestMessages:
+    def test_all_wire_types_registered(self):
+        assert set(MESSAGE_TYPES) == {
+            "player_join", "player_leave", "player_buzz", "player_estimate",
+            "player_estimate_lock", "lobby_state", "play_sound", "play_question_audio",
+        }
+
+    def test_to_message_roundtrip(self):
+        msg = PlayerEstimate(player_id="p1", answer="42")
+        wire = msg.to_message("L1")
+        assert wire == {"type": "player_estimate", "lobby_id": "L1", "player_id": "p1", "answer": "42"}
+        assert parse(wire["type"], wire) == msg
+
+    def test_parse_from_frozen_payload_ignores_unknown_fields(self):
+        payload = freeze({"type": "player_join", "lobby_id": "L1", "player_id": "p1", "extra": 1})
+        assert parse("player_join", payload) == PlayerJoin(player_id="p1", name="Spieler")
+
+    def test_parse_unknown_type(self):
+        assert parse("nope", {}) is None
+
+    def test_message_without_fields(self):
+        assert PlayQuestionAudio().to_message("L1") == {"type": "play_question_audio", "lobby_id": "L1"}
+
+
+class TestDispatcher:
+    @pytest.fixture
+    def dispatcher(self):
+        return Dispatcher(stats={})
+
+    def test_dispatches_typed_message(self, dispatcher):
+        seen = []
+        dispatcher.on(PlayerBuzz, roles=("host",))(seen.append)
+        assert dispatcher.dispatch("player_buzz", {"player_id": "p1"}, "host") is True
+        assert seen == [PlayerBuzz(player_id="p1")]
+
+    def test_role_filter(self, dispatcher):
+        seen = []
+        dispatcher.on(PlayerBuzz, roles=("host",))(seen.append)
+        assert dispatcher.dispatch("player_buzz", {"player_id": "p1"}, "player") is False
+        assert seen == []
+
+    def test_same_type_different_handlers_per_role(self, dispatcher):
+        host, player = [], []
+        dispatcher.on(LobbyStateMessage, roles=("host",))(host.append)
+        dispatcher.on(LobbyStateMessage, roles=("player",))(player.append)
+        dispatcher.dispatch("lobby_state", {"version": 3}, "player")
+        assert host == []
+        assert player == [LobbyStateMessage(version=3)]
+
+    def test_unhandled_type(self, dispatcher):
+        assert dispatcher.dispatch("player_leave", {}, "host") is False
+
+    def test_stats_counted_per_type(self, dispatcher):
+        dispatcher.on(PlayerBuzz)(lambda _m: None)
+        for _ in range(3):
+            dispatcher.dispatch("player_buzz", {}, "host")
+        s = dispatcher._stats["player_buzz"]
+        assert s.count == 3
+        assert s.total_ns >= s.max_ns >= 0
+
+    def test_stats_recorded_when_handler_raises(self, dispatcher):
+        def boom(_m):
+            raise RuntimeError
+        dispatcher.on(PlayerBuzz)(boom)
+        with pytest.raises(RuntimeError):
+            dispatcher.dispatch("player_buzz", {}, "host")
+        assert dispatcher._stats["player_buzz"].count == 1
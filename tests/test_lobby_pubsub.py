@@ -0,0 +1,148 @@
+"""Tests für lobby_pubsub — Topic-Abos pro Lobby statt globalem send_all."""
+import pytest
+from lobby_pubsub import LobbyChannel, LobbyEnvelope, decode, freeze, host_topic, lobby_topic
+
+
+def _member(hub, lobby_id=None):
+    inbox = []
+    channel = LobbyChannel(hub.client(), inbox.append)
+    if lobby_id:
+        channel.join(lobby_id)
+    return channel, inbox
+
+
+class TestLobbyChannel:
+    def test_message_reaches_only_own_lobby(self, hub):
+        a1, inbox_a1 = _member(hub, "AAA")
+        _, inbox_a2 = _member(hub, "AAA")
+        _, inbox_b = _member(hub, "BBB")
+
+        a1.send({"type": "play_sound", "lobby_id": "AAA", "name": "buzz"})
+
+        assert len(inbox_a1) == 1
+        assert len(inbox_a2) == 1
+        assert inbox_b == []
+
+    def test_message_is_sent_as_envelope(self, hub):
+        a, inbox = _member(hub, "AAA")
+        a.send({"type": "player_buzz", "lobby_id": "AAA", "player_id": "p1"})
+        env = inbox[0]
+        assert isinstance(env, LobbyEnvelope)
+        assert env.type == "player_buzz"
+        assert env.lobby_id == "AAA"
+        assert env.payload["player_id"] == "p1"
+
+    def test_all_members_share_one_envelope(self, hub):
+        a, inbox_a = _member(hub, "AAA")
+        _, inbox_b = _member(hub, "AAA")
+        a.send({"type": "lobby_state", "lobby_id": "AAA", "data": {"screen": "board"}})
+        assert inbox_a[0] is inbox_b[0]
+
+    def test_leave_stops_delivery(self, hub):
+        sender, _ = _member(hub, "AAA")
+        member, inbox = _member(hub, "AAA")
+        member.leave()
+        sender.send({"type": "play_sound", "lobby_id": "AAA"})
+        assert inbox == []
+        assert member.lobby_id is None
+
+    def test_join_other_lobby_switches_topic(self, hub):
+        member, inbox = _member(hub, "AAA")
+        member.join("BBB")
+        sender, _ = _member(hub)
+        sender.send({"type": "x", "lobby_id": "AAA"})
+        sender.send({"type": "y", "lobby_id": "BBB"})
+        assert [m.type for m in inbox] == ["y"]
+        assert hub.topics[lobby_topic("AAA")] == []
+
+    def test_join_same_lobby_twice_subscribes_once(self, hub):
+        member, inbox = _member(hub, "AAA")
+        member.join("AAA")
+        member.send({"type": "x", "lobby_id": "AAA"})
+        assert len(inbox) == 1
+
+    def test_send_without_lobby_id_is_dropped(self, hub):
+        member, inbox = _member(hub, "AAA")
+        member.send({"type": "x"})
+        assert inbox == []
+
+
+class TestHostInbox:
+    def test_intent_reaches_only_host(self, hub):
+        host_inbox = []
+        host = LobbyChannel(hub.client(), host_inbox.append)
+        host.join("AAA", host=True)
+        player, player_inbox = _member(hub, "AAA")
+        _, other_inbox = _member(hub, "AAA")
+
+        player.send_to_host({"type": "player_buzz", "lobby_id": "AAA", "player_id": "p1"})
+
+        assert [m.type for m in host_inbox] == ["player_buzz"]
+        assert player_inbox == []
+        assert other_inbox == []
+
+    def test_host_still_receives_lobby_broadcasts(self, hub):
+        host_inbox = []
+        host = LobbyChannel(hub.client(), host_inbox.append)
+        host.join("AAA", host=True)
+        player, player_inbox = _member(hub, "AAA")
+        host.send({"type": "lobby_state", "lobby_id": "AAA"})
+        assert len(host_inbox) == 1
+        assert len(player_inbox) == 1
+
+    def test_leave_unsubscribes_inbox(self, hub):
+        host = LobbyChannel(hub.client(), lambda _m: None)
+        host.join("AAA", host=True)
+        host.leave()
+        assert hub.topics[host_topic("AAA")] == []
+        assert host.is_host is False
+
+    def test_rejoin_as_host_adds_inbox(self, hub):
+        inbox = []
+        member = LobbyChannel(hub.client(), inbox.append)
+        member.join("AAA")
+        member.join("AAA", host=True)
+        sender, _ = _member(hub)
+        sender.send_to_host({"type": "player_join", "lobby_id": "AAA"})
+        sender.send({"type": "lobby_state", "lobby_id": "AAA"})
+        assert [m.type for m in inbox] == ["player_join", "lobby_state"]
+        assert len(hub.topics[lobby_topic("AAA")]) == 1
+
+
+class TestEnvelope:
+    def test_payload_is_deeply_frozen(self):
+        env = LobbyEnvelope.from_message({"type": "lobby_state", "lobby_id": "A",
+                                          "data": {"players": [{"name": "x"}]}})
+        with pytest.raises(TypeError):
+            env.payload["type"] = "other"
+        with pytest.raises(TypeError):
+            env.payload["data"]["players"][0]["name"] = "y"
+        assert isinstance(env.payload["data"]["players"], tuple)
+
+    def test_envelope_is_not_copied_by_sender_mutation(self):
+        message = {"type": "x", "lobby_id": "A", "data": {"n": 1}}
+        env = LobbyEnvelope.from_message(message)
+        message["data"]["n"] = 2
+        assert env.payload["data"]["n"] == 1
+
+    def test_decode_passes_envelope_through(self):
+        env = LobbyEnvelope.from_message({"type": "x", "lobby_id": "A"})
+        assert decode(env) is env
+
+    def test_decode_rejects_non_envelopes(self):
+        assert decode('{"type": "x", "lobby_id": "A"}') is None
+        assert decode({"type": "x", "lobby_id": "A"}) is None
+        assert decode(42) is None
+
+    def test_frozen_snapshot_applies_to_state(self):
+        from app_state import AppState
+        from models.models import build_dummy_board
+        host = AppState()
+        host.board = build_dummy_board()
+        host.ensure_players()
+        host.estimates = {"p1": "42"}
+        client = AppState()
+        assert client.apply_snapshot(freeze(host.snapshot(include_board=True))) is True
+        client.estimates["p2"] = "7"
+        client.players.append(client.players[0])
+        assert client.board.categories[0].tiles[0].question.prompt == host.board.categories[0].tiles[0].question.prompt
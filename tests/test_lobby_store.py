@@ -67,3 +67,57 @@ class TestCleanup:
         _cleanup_old_lobbies()
         assert "FRESH" in LOBBIES
         assert "STALE" not in LOBBIES
+
+
+class TestBoardStorage:
+    BOARD = {"categories": [{"title": "A", "tiles": []}]}
+
+    def test_board_is_kept_out_of_data(self):
+        lobby = update_lobby("L1", {"screen": "board", "board": self.BOARD,
+                                    "board_progress": {"hash": "h1", "used": "0"}})
+        assert "board" not in lobby.data
+        assert lobby.board == self.BOARD
+        assert lobby.board_hash == "h1"
+
+    def test_dynamic_patch_keeps_board(self):
+        update_lobby("L1", {"board": self.BOARD, "board_progress": {"hash": "h1", "used": "0"}})
+        lobby = update_lobby("L1", {"buzzer_open": True, "board_progress": {"hash": "h1", "used": "1"}})
+        assert lobby.board == self.BOARD
+        assert lobby.data["board_progress"]["used"] == "1"
+
+    def test_snapshot_adds_board(self):
+        update_lobby("L1", {"screen": "board", "board": self.BOARD,
+                            "board_progress": {"hash": "h1", "used": "0"}})
+        snap = get_lobby("L1").snapshot()
+        assert snap["board"] == self.BOARD
+        assert snap["screen"] == "board"
+
+    def test_clearing_board(self):
+        update_lobby("L1", {"board": self.BOARD, "board_progress": {"hash": "h1", "used": "0"}})
+        lobby = update_lobby("L1", {"board": None})
+        assert lobby.board is None
+        assert lobby.board_hash is None
+        assert lobby.snapshot()["board"] is None
+
+    def test_patch_is_not_mutated(self):
+        patch = {"board": self.BOARD}
+        update_lobby("L1", patch)
+        assert "board" in patch
+
+    def test_reconnect_snapshot_restores_used_tiles(self):
+        from app_state import AppState
+        from models.models import build_dummy_board
+
+        host = AppState()
+        host.board = build_dummy_board()
+        host.ensure_players()
+        update_lobby("L1", host.delta_snapshot(include_board=True))
+
+        host.board.categories[1].tiles[2].used = True
+        host.mark_dirty("board")
+        update_lobby("L1", host.delta_snapshot())
+
+        client = AppState()
+        assert client.apply_snapshot(get_lobby("L1").snapshot()) is True
+        assert client.board.categories[1].tiles[2].used is True
+        assert client.board.categories[0].tiles[0].used is False
@@ -0,0 +1,93 @@
+"""Tests für views.components.player_card — Karten werden in-place geändert."""
+from types import SimpleNamespace as P
+
+import flet as ft
+
+from views.components.player_card import PlayerCard, card_key, sync_card_row
+
+
+class TestPlayerCard:
+    def test_set_score_updates_text_in_place(self):
+        card = PlayerCard("Anna", 100)
+        score_text, content = card._score_text, card.content
+
+        card.set_score(300)
+
+        assert card._score_text is score_text
+        assert card.content is content
+        assert score_text.value == "Punkte: 300"
+
+    def test_set_active_only_changes_border(self):
+        card = PlayerCard("Anna", 100)
+        content, name_text = card.content, card._name_text
+        idle_border = card.border
+
+        card.set_active(True)
+        active_border = card.border
+        card.set_active(True)
+
+        assert card.content is content and card._name_text is name_text
+        assert active_border != idle_border
+        assert card.border is active_border  # unveränderter Wert → kein neues Objekt
+
+    def test_keyed_body_replaced_only_on_key_change(self):
+        card = PlayerCard("Anna", 100)
+        built = []
+
+        def builder(label):
+            def build():
+                built.append(label)
+                return ft.Text(label)
+            return build
+
+        card.set_body(builder("a"), key=("p1", "a"))
+        first = card._middle.content
+        card.set_body(builder("a"), key=("p1", "a"))
+        assert card._middle.content is first
+        assert built == ["a"]
+
+        card.set_body(builder("b"), key=("p1", "b"))
+        assert card._middle.content is not first
+        assert card._middle.content.value == "b"
+        assert built == ["a", "b"]
+
+    def test_unkeyed_body_always_rebuilt(self):
+        card = PlayerCard("Anna", 100)
+        built = []
+
+        def build():
+            built.append(len(built))
+            return ft.Text(str(len(built)))
+
+        card.set_body(build)
+        card.set_body(build)
+        assert built == [0, 1]
+        assert card._middle.content.value == "2"
+
+    def test_sync_card_row_reuses_cards_and_drops_gone(self):
+        row, cards, built = ft.Row(controls=[]), {}, []
+
+        def update(_key, _i, p, card):
+            if card is None:
+                built.append(p.player_id)
+                return PlayerCard(p.name, p.score)
+            card.set_score(p.score)
+            return card
+
+        players = [P(player_id="a", name="A", score=0), P(player_id="b", name="B", score=0)]
+        sync_card_row(row, cards, players, 200, update)
+        first = list(row.controls)
+
+        players[0].score = 300
+        sync_card_row(row, cards, players, 200, update)
+        assert row.controls == first and all(a is b for a, b in zip(row.controls, first))
+        assert first[0]._score_text.value == "Punkte: 300"
+
+        sync_card_row(row, cards, players[1:], 240, update)
+        assert set(cards) == {"b"} and row.controls[0] is first[1]
+        assert first[1].width == 240
+        assert built == ["a", "b"]
+
+    def test_card_key_falls_back_to_slot(self):
+        assert card_key(3, P(player_id="")) == "#3"
+        assert card_key(3, P(player_id="p7")) == "p7"
@@ -0,0 +1,46 @@
+"""Tests für views.question — Schätzungs-Throttle pro Frage."""
+from types import SimpleNamespace
+
+from lobby_pubsub import SESSION_KEY
+from views.question import _estimate_throttle, cancel_pending_estimate
+
+
+class _Store(dict):
+    def set(self, key, value):
+        self[key] = value
+
+
+def _page(run_task, sent):
+    channel = SimpleNamespace(send_to_host=sent.append)
+    return SimpleNamespace(run_task=run_task, session=SimpleNamespace(store=_Store({SESSION_KEY: channel})))
+
+
+class TestEstimateThrottle:
+    def test_same_question_reuses_throttle(self, run_scenario):
+        async def scenario(run_task):
+            page = _page(run_task, [])
+            assert _estimate_throttle(page, ("L1", (0, 0))) is _estimate_throttle(page, ("L1", (0, 0)))
+
+        run_scenario(scenario)
+
+    def test_pending_estimate_dropped_on_next_question(self, run_scenario):
+        sent = []
+
+        async def scenario(run_task):
+            page = _page(run_task, sent)
+            _estimate_throttle(page, ("L1", (0, 0))).request({"answer": "alt"})
+            _estimate_throttle(page, ("L1", (0, 1))).request({"answer": "neu"})
+
+        run_scenario(scenario)
+        assert sent == [{"answer": "neu"}]
+
+    def test_leaving_question_cancels_pending(self, run_scenario):
+        sent = []
+
+        async def scenario(run_task):
+            page = _page(run_task, sent)
+            _estimate_throttle(page, ("L1", (0, 0))).request({"answer": "42"})
+            cancel_pending_estimate(page)
+
+        run_scenario(scenario)
+        assert sent == []
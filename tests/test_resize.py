@@ -0,0 +1,90 @@
+"""Tests für ui.layout / ui.resize — Breiten-Cache und gebündelte Resize-Events."""
+import asyncio
+from types import SimpleNamespace
+
+from ui.layout import WIDTH_BUCKET_PX, card_width, column_width, width_bucket
+from ui.resize import ResizeCoordinator
+
+
+class TestLayout:
+    def test_bucket_rounds_down(self):
+        assert width_bucket(WIDTH_BUCKET_PX * 10 + 1) == WIDTH_BUCKET_PX * 10
+        assert width_bucket(-5) == 0
+
+    def test_widths_equal_within_bucket(self):
+        base = WIDTH_BUCKET_PX * 150
+        assert column_width(base, 16, 6, 220, 12) == column_width(base + WIDTH_BUCKET_PX - 1, 16, 6, 220, 12)
+        assert card_width(base, 16, 4, 220, 12) == card_width(base + WIDTH_BUCKET_PX - 1, 16, 4, 220, 12)
+
+    def test_min_width_enforced(self):
+        assert column_width(400, 16, 6, 220, 12) == 220
+        assert card_width(400, 16, 8, 180, 8) == 180
+
+    def test_cards_fill_available_width(self):
+        w = card_width(1200, 16, 4, 100, 12)
+        assert 4 * w + 3 * 12 <= 1200 - 2 * 16 - 2 * 8 - 2
+
+
+def _page(width):
+    page = SimpleNamespace(width=width, updates=0)
+    page.update = lambda: setattr(page, "updates", page.updates + 1)
+    page.run_task = lambda handler, *args: asyncio.get_running_loop().create_task(handler(*args))
+    return page
+
+
+def _run(scenario):
+    async def main():
+        await scenario()
+        await asyncio.sleep(0.01)
+
+    asyncio.run(main())
+
+
+class TestResizeCoordinator:
+    def test_burst_of_events_computes_once(self):
+        calls = []
+        result = {}
+
+        async def scenario():
+            page = _page(1000)
+            coord = ResizeCoordinator(page, window_s=0)
+            coord.set_targets(lambda w, pad: calls.append(w) or True)
+            for w in (1100, 1200, 1300, 1400):
+                page.width = w
+                coord.on_resize()
+            result.update(page=page, coord=coord)
+
+        _run(scenario)
+        assert calls == [width_bucket(1400)]
+        assert result["coord"].events == 4
+        assert result["page"].updates == 1
+
+    def test_same_bucket_skips_work(self):
+        calls = []
+        result = {}
+
+        async def scenario():
+            page = _page(1000)
+            coord = ResizeCoordinator(page, window_s=0)
+            coord.set_targets(lambda w, pad: calls.append(w) or True)
+            page.width = 1000 + WIDTH_BUCKET_PX - 1 - 1000 % WIDTH_BUCKET_PX
+            coord.on_resize()
+            result["page"] = page
+
+        _run(scenario)
+        assert calls == []
+        assert result["page"].updates == 0
+
+    def test_unchanged_layout_skips_update(self):
+        result = {}
+
+        async def scenario():
+            page = _page(1000)
+            coord = ResizeCoordinator(page, window_s=0)
+            coord.set_targets(lambda w, pad: False)
+            page.width = 1600
+            coord.on_resize()
+            result["page"] = page
+
+        _run(scenario)
+        assert result["page"].updates == 0
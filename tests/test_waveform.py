@@ -0,0 +1,86 @@
+"""Tests für views.components.waveform — Fortschritt mit wenigen, gezielten Pushes."""
+from views.components.waveform import WaveformProgress
+
+
+def _wave(bars: int = 10):
+    pushes = []
+    wave = WaveformProgress([20] * bars, push=lambda *controls: pushes.append(
+        [(c, c.width, getattr(c, "animate", None)) for c in controls]))
+    return wave, pushes
+
+
+class TestAnimated:
+    def test_start_pushes_one_animation_to_the_end(self):
+        wave, pushes = _wave()
+
+        wave.animate_from(0, 10_000)
+
+        assert len(pushes) == 1
+        [(mask, width, animate)] = pushes[0]
+        assert mask is wave._mask
+        assert width == wave.total_width
+        assert animate.duration == 10_000
+
+    def test_seek_jumps_without_animation_then_animates_rest(self):
+        wave, pushes = _wave()
+        wave.animate_from(0, 10_000)
+        pushes.clear()
+
+        wave.animate_from(4_000, 10_000)
+
+        [(_m, jump_w, jump_anim)], [(_m2, end_w, end_anim)] = pushes
+        assert jump_w == round(wave.total_width * 0.4) and jump_anim is None
+        assert end_w == wave.total_width and end_anim.duration == 6_000
+
+    def test_pause_holds_at_position(self):
+        wave, pushes = _wave()
+        wave.animate_from(0, 10_000)
+        pushes.clear()
+
+        wave.hold_at(2_500, 10_000)
+
+        assert pushes == [[(wave._mask, round(wave.total_width * 0.25), None)]]
+
+    def test_stop_resets_to_start(self):
+        wave, pushes = _wave()
+        wave.animate_from(0, 10_000)
+        pushes.clear()
+
+        wave.reset()
+
+        assert pushes == [[(wave._mask, 0, None)]]
+        pushes.clear()
+        wave.reset()  # schon am Anfang → nichts zu pushen
+        assert pushes == []
+
+
+class TestLoopFallback:
+    def test_one_step_pushes_only_that_bar(self):
+        wave, pushes = _wave()
+        wave.show_fraction(0.1)
+
+        assert [[c for c, *_ in p] for p in pushes] == [[wave._bars[0]]]
+        assert wave._bars[0].bgcolor == "primary"
+        assert all(bar.bgcolor == "outline" for bar in wave._bars[1:])
+
+    def test_unchanged_fraction_pushes_nothing(self):
+        wave, pushes = _wave()
+        wave.show_fraction(0.35)
+        pushes.clear()
+        wave.show_fraction(0.38)
+        assert pushes == []
+
+    def test_reset_uncolors_filled_bars(self):
+        wave, pushes = _wave()
+        wave.show_fraction(0.5)
+        pushes.clear()
+
+        wave.reset()
+
+        assert [[c for c, *_ in p] for p in pushes] == [[wave._bars_row]]
+        assert all(bar.bgcolor == "outline" for bar in wave._bars)
+
+    def test_failed_push_marks_detached(self):
+        wave = WaveformProgress([20] * 4)
+        wave.show_fraction(0.25)  # nicht auf einer Page → update() schlägt fehl
+        assert wave.detached
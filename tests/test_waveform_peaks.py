@@ -0,0 +1,97 @@
+"""Tests für waveform_peaks — Hüllkurve aus global_gain, Batch und Nachschlagen."""
+import json
+from unittest.mock import patch
+
+import pytest
+
+import board_loader
+import waveform_peaks
+from waveform_peaks import PEAK_BARS, mp3_peaks
+
+_FRAME_HEADER = b"\xff\xfb\x90\x00"   # MPEG-1 Layer III, 128 kbit/s, 44,1 kHz, Stereo
+_FRAME_LEN = 417
+
+
+def _frame(gain: int) -> bytes:
+    """Frame, dessen vier Granules/Kanäle ``gain`` als global_gain tragen (0 = Stille)."""
+    bits = 0
+    total = 32 * 8
+    base = 9 + 3 + 4 * 2
+    for i in range(4):
+        pos = base + i * 59
+        if gain:
+            bits |= 100 << (total - pos - 12)           # part2_3_length
+            bits |= gain << (total - pos - 21 - 8)      # global_gain
+    side_info = bits.to_bytes(32, "big")
+    return _FRAME_HEADER + side_info + bytes(_FRAME_LEN - 4 - 32)
+
+
+def _mp3(gains: list[int]) -> bytes:
+    return b"".join(_frame(g) for g in gains)
+
+
+class TestMp3Peaks:
+    def test_loudest_bar_is_one(self):
+        peaks = mp3_peaks(_mp3([150] * 24 + [170] * 24), bars=2)
+        assert peaks[1] == 1.0
+        assert peaks[0] == pytest.approx(1.0 - 1.5 * 20 / 36, abs=1e-3)
+
+    def test_silence_is_zero(self):
+        assert mp3_peaks(_mp3([0] * 10 + [160] * 10), bars=2) == [0.0, 1.0]
+
+    def test_fewer_frames_than_bars(self):
+        assert len(mp3_peaks(_mp3([160] * 5))) == PEAK_BARS
+
+    def test_not_mp3(self):
+        assert mp3_peaks(b"kein mp3") is None
+
+
+@pytest.fixture
+def boards_dir(tmp_path):
+    board_dir = tmp_path / "tonboard"
+    (board_dir / "sounds").mkdir(parents=True)
+    (board_dir / "board.json").write_text(json.dumps({"title": "Ton", "categories": []}), encoding="utf-8")
+    (board_dir / "sounds" / "a.mp3").write_bytes(_mp3([120] * 30 + [160] * 30))
+    with patch.object(board_loader, "BOARDS_DIR", tmp_path):
+        yield tmp_path
+
+
+class TestBatch:
+    def test_compute_and_lookup(self, boards_dir):
+        assert waveform_peaks.compute_all(workers=1) == 1
+        peaks = waveform_peaks.peaks_for(str((boards_dir / "tonboard" / "sounds" / "a.mp3").resolve()))
+        assert len(peaks) == PEAK_BARS and peaks[-1] == 1.0
+
+    def test_known_hash_is_skipped(self, boards_dir):
+        waveform_peaks.compute_all(workers=1)
+        # gleiche Datei unter neuem Namen: Content-Hash bekannt, nichts zu tun
+        (boards_dir / "tonboard" / "sounds" / "a.mp3").rename(boards_dir / "tonboard" / "sounds" / "b.mp3")
+        assert waveform_peaks.compute_all(workers=1) == 0
+        assert waveform_peaks.peaks_for(str((boards_dir / "tonboard" / "sounds" / "b.mp3").resolve()))
+
+    def test_missing_peaks(self, boards_dir):
+        assert waveform_peaks.peaks_for(str((boards_dir / "tonboard" / "sounds" / "a.mp3").resolve())) is None
+
+
+class TestAttachPeaks:
+    @pytest.fixture
+    def audio_board(self, boards_dir):
+        (boards_dir / "tonboard" / "board.json").write_text(json.dumps({"title": "Ton", "categories": [
+            {"title": "K", "tiles": [{"value": 100, "question": {
+                "type": "audio", "prompt": "?", "answer": "!", "assets": ["sounds/a.mp3"]}}]},
+        ]}), encoding="utf-8")
+        board_loader.clear_board_cache()
+        yield str((boards_dir / "tonboard" / "sounds" / "a.mp3").resolve())
+        board_loader.clear_board_cache()
+
+    def test_peaks_attached_to_render_meta(self, audio_board):
+        waveform_peaks.compute_all(workers=1)
+        board = board_loader.load_board("tonboard")
+        waveform_peaks.attach_peaks(board)
+        meta = board.asset_meta[audio_board]
+        assert len(meta["peaks"]) == PEAK_BARS and meta["duration_ms"] > 0
+
+    def test_not_yet_computed_leaves_meta_alone(self, audio_board):
+        board = board_loader.load_board("tonboard")
+        waveform_peaks.attach_peaks(board)
+        assert "peaks" not in board.asset_meta[audio_board]
@@ -1,4 +1,7 @@
+import math
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 
 @dataclass(frozen=True)
 class Layout:
@@ -7,4 +10,42 @@ class Layout:
     grid_gap: int = 8
     section_gap: int = 24
 
-LAYOUT = Layout()
\ No newline at end of file
+LAYOUT = Layout()
+
+# Breiten werden pro Bucket berechnet: Fensterbreiten innerhalb eines Buckets
+# ergeben dasselbe Layout (und treffen denselben Cache-Eintrag).
+WIDTH_BUCKET_PX = max(1, int(os.environ.get("JEOPARDY_RESIZE_BUCKET_PX", "8")))
+
+# Rand der Host-Container um Board und Spielerkarten
+_HOST_PADDING = 8
+_HOST_BORDER = 1
+
+
+def width_bucket(viewport_w) -> int:
+    """Rundet die Fensterbreite auf den Bucket ab."""
+    return max(0, int(viewport_w)) // WIDTH_BUCKET_PX * WIDTH_BUCKET_PX
+
+
+def column_width(viewport_w, pad: int, cols: int, min_w: int, gap: int) -> int:
+    """Spaltenbreite des Boards (Mindestbreite, danach horizontaler Scroll)."""
+    return _column_width(width_bucket(viewport_w), pad, cols, min_w, gap)
+
+
+def card_width(viewport_w, pad: int, n: int, min_w: int, gap: int) -> int:
+    """Breite einer Spielerkarte bei n Karten nebeneinander."""
+    return _card_width(width_bucket(viewport_w), pad, max(1, n), min_w, gap)
+
+
+@lru_cache(maxsize=512)
+def _column_width(bucket_w: int, pad: int, cols: int, min_w: int, gap: int) -> int:
+    usable = bucket_w - 2 * pad - 2 * _HOST_PADDING
+    return int(max(min_w, (usable - (cols - 1) * gap) / cols))
+
+
+@lru_cache(maxsize=512)
+def _card_width(bucket_w: int, pad: int, n: int, min_w: int, gap: int) -> int:
+    usable = bucket_w - 2 * pad - 2 * _HOST_PADDING - 2 * _HOST_BORDER
+    usable -= 2  # Sicherheitsmarge
+    available_for_cards = max(0, usable - (n - 1) * gap)
+    # Mindestbreite erzwingen (dann darf gescrollt werden)
+    return max(min_w, math.floor(available_for_cards / n))
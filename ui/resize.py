@@ -0,0 +1,69 @@
+"""Gebündelte Resize-Behandlung pro Session.
+
+Beim Ziehen einer Fensterkante (oder beim Drehen eines Handys) feuert Flet viele
+``on_resize``-Events hintereinander. Bisher hat jedes davon alle Layouts neu
+berechnet und ``page.update()`` ausgelöst. Der :class:`ResizeCoordinator`
+fasst die Events über einen :class:`Coalescer` zusammen (trailing, letzte Breite
+gewinnt), rechnet nur bei geändertem Breiten-Bucket und ruft ``page.update()``
+nur, wenn ein Ziel tatsächlich etwas geändert hat.
+"""
+from __future__ import annotations
+
+import os
+from typing import Callable
+
+import flet as ft
+
+from coalesce import Coalescer
+from ui.layout import LAYOUT, width_bucket
+
+RESIZE_DEBOUNCE_S = float(os.environ.get("JEOPARDY_RESIZE_DEBOUNCE_MS", "100")) / 1000
+_SESSION_KEY = "_resize_coordinator"
+
+
+class ResizeCoordinator:
+    """Verteilt gebündelte Resize-Events an die Layout-Ziele des aktuellen Screens.
+
+    Ein Ziel ist ``recompute(viewport_w, pad) -> bool`` und gibt zurück, ob es
+    Controls geändert hat.
+    """
+
+    def __init__(self, page: ft.Page, window_s: float = RESIZE_DEBOUNCE_S):
+        self._page = page
+        self._targets: list[Callable[[int, int], bool]] = []
+        self._bucket: int | None = None
+        self._coalescer = Coalescer(page.run_task, self._flush, window_s)
+        self.events = 0
+        self.flushes = 0
+        self.updates = 0
+
+    def set_targets(self, *targets: Callable[[int, int], bool]) -> None:
+        """Ersetzt die Ziele (pro Screen-Aufbau); die aktuelle Breite gilt als angewendet."""
+        self._targets = [t for t in targets if callable(t)]
+        self._bucket = width_bucket(self._page.width or 1200)
+
+    def on_resize(self, _=None) -> None:
+        self.events += 1
+        self._coalescer.request()
+
+    def _flush(self, _value=None) -> None:
+        self.flushes += 1
+        bucket = width_bucket(self._page.width or 1200)
+        if bucket == self._bucket:
+            return
+        self._bucket = bucket
+        changed = False
+        for recompute in self._targets:
+            changed = bool(recompute(bucket, LAYOUT.page_padding)) or changed
+        if changed:
+            self.updates += 1
+            self._page.update()
+
+
+def resize_coordinator(page: ft.Page) -> ResizeCoordinator:
+    """Session-weiter Coordinator; überlebt Screen-Wechsel."""
+    coordinator = page.session.store.get(_SESSION_KEY)
+    if coordinator is None:
+        coordinator = ResizeCoordinator(page)
+        page.session.store.set(_SESSION_KEY, coordinator)
+    return coordinator
@@ -0,0 +1,203 @@
+"""Audio pro Session: Soundeffekte und ein einziger Frage-Audio-Player.
+
+Bisher hat jeder Rebuild einer Audio-Frage (auch durch Buzzes oder Schätzungen)
+den alten ``flet_audio.Audio`` aus ``page.services`` entfernt und einen neuen
+angehängt: Flutter hat den Player neu erzeugt, den Clip neu geladen, und die
+gecachte Duration/Position war weg. Der :class:`AudioService` hält alle
+Audio-Controls der Session (Soundeffekte + Frage-Player) dauerhaft in
+``page.services`` und tauscht beim Frage-Player nur ``src`` — und nur, wenn sich
+das Asset wirklich ändert.
+"""
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Optional
+
+import flet as ft
+
+SOUND_FILES = {"buzz": "buzz.mp3", "correct_answer": "correct_answer.mp3", "wrong_answer": "wrong_answer.mp3"}
+
+_SESSION_KEY = "_audio_service"
+
+
+class AudioService:
+    """Audio-Controls einer Session; ``created`` zählt die im laufenden Spiel
+    angelegten Audio-Controls (zurückgesetzt durch :meth:`end_game`)."""
+
+    def __init__(self, page: ft.Page, assets_dir: Path):
+        self._page = page
+        self._assets_dir = assets_dir
+        self._cls = None
+        self._release_mode = None
+        self.available = False
+        self.works: Optional[bool] = None       # None=ungetestet, True=funktioniert, False=kein Flutter-Build
+        self.sounds: dict = {}
+        self.question = None                    # Frage-Player (einmal angelegt, bleibt gemountet)
+        self.question_src: Optional[str] = None
+        self.duration_ms: Optional[int] = None  # via on_duration_change
+        self._position: Optional[tuple] = None  # (int ms, float monotonic_time) via on_position_change
+        self._pending_src: Optional[str] = None
+        # Zähler pro Spiel
+        self.created = 0     # angelegte Audio-Controls (Effekte + Frage-Player)
+        self.questions = 0   # angewendete Frage-Assets
+        self.src_swaps = 0   # davon per src-Tausch statt neuem Control
+
+        try:
+            from flet_audio import Audio, ReleaseMode
+        except Exception:
+            return  # flet_audio nicht verfügbar (Dev-Modus)
+        self._cls = Audio
+        self._release_mode = ReleaseMode.STOP
+        self.available = True
+
+    # -- Soundeffekte -----------------------------------------------------------
+
+    def load_sounds(self) -> None:
+        """Legt die Soundeffekt-Player einmal pro Session an."""
+        if not self.available or self.sounds:
+            return
+        for name, filename in SOUND_FILES.items():
+            if (self._assets_dir / filename).exists():
+                self.sounds[name] = self._new_audio(f"assets/{filename}")
+        if self.sounds:
+            self._page.update()
+
+    def play_sound(self, name: str) -> None:
+        audio = self.sounds.get(name)
+        if not (audio and self._page.session and self._page.session.connection):
+            return
+
+        async def _play_safe():
+            try:
+                await audio.play()
+            except Exception:
+                pass
+        self._page.run_task(_play_safe)
+
+    # -- Frage-Audio ------------------------------------------------------------
+
+    def set_question_src(self, src: str) -> None:
+        """Merkt den Src vor; apply_pending() führt die eigentliche Arbeit durch."""
+        self._pending_src = src
+
+    def apply_pending(self) -> None:
+        """Nach page.views.append(): Player einmal anlegen, sonst nur src tauschen."""
+        src = self._pending_src
+        self._pending_src = None
+        if not src or not self.available:
+            return
+        if self.question is not None and src == self.question_src:
+            return  # gleiches Asset: Player, Duration und Position bleiben
+
+        self.duration_ms = None
+        self._position = None
+        self.question_src = src
+        self.questions += 1
+        if self.question is None:
+            self.question = self._new_audio(src)
+            self.question.on_duration_change = self._on_duration_change
+            self.question.on_position_change = self._on_position_change
+            self.question.on_state_change = self._on_state_change
+            self.works = None  # wird durch on_duration_change oder play()-Timeout gesetzt
+        else:
+            self.question.src = src
+            self.src_swaps += 1
+        # Lautstärke wird in play_question() direkt vor play() angewendet,
+        # wenn Flutter das Control bereits kennt (nach page.update()).
+
+    def play_question(self) -> None:
+        """Spielt das geladene Frage-Audio ab."""
+        fa = self.question
+        if fa is None:
+            return
+        # Position auf (0, jetzt) setzen → Interpolation startet sofort ab 0ms
+        self._position = (0, time.monotonic())
+        page = self._page
+
+        async def _do_play():
+            if not (page.session and page.session.connection):
+                return
+            saved_vol = page.session.store.get("_audio_volume")
+            if saved_vol is not None:
+                try:
+                    fa.volume = max(0.0, min(1.0, float(saved_vol)))
+                    fa.update()
+                except (TypeError, ValueError):
+                    pass
+            try:
+                await fa.play()
+                if self.works is None:
+                    self.works = True
+            except Exception:
+                self.works = False
+
+        page.run_task(_do_play)
+
+    def position_ms(self) -> Optional[int]:
+        """Interpolierte Abspielposition (int ms).
+        Interpoliert zwischen on_position_change-Events; gecappt auf 900ms um
+        Overshoot und Rücksprünge beim nächsten Event zu vermeiden."""
+        data = self._position
+        if data is None:
+            return None
+        pos_ms, t = data
+        elapsed_ms = min(int((time.monotonic() - t) * 1000), 900)
+        return pos_ms + elapsed_ms
+
+    def set_volume(self, value: float) -> None:
+        """Setzt die lokale Lautstärke (0.0–1.0)."""
+        if self.question is not None:
+            self.question.volume = max(0.0, min(1.0, value))
+            self.question.update()
+
+    def report(self) -> str:
+        """Kurzfassung der Zähler des laufenden Spiels."""
+        return (f"{self.created} Audio-Controls angelegt ({len(self.sounds)} Effekte, "
+                f"{1 if self.question is not None else 0} Frage-Player) für {self.questions} Frage-Assets, "
+                f"{self.src_swaps} src-Wechsel")
+
+    def end_game(self) -> Optional[str]:
+        """Spiel vorbei (Menü, Session zu): Report des Spiels, danach Zähler auf 0.
+        None, wenn im Spiel kein Audio angefallen ist."""
+        if not (self.created or self.questions):
+            return None
+        report = self.report()
+        self.created = self.questions = self.src_swaps = 0
+        return report
+
+    # -- intern -----------------------------------------------------------------
+
+    def _new_audio(self, src: str):
+        audio = self._cls(src=src, autoplay=False, release_mode=self._release_mode)
+        self._page.services.append(audio)
+        self.created += 1
+        return audio
+
+    def _on_duration_change(self, e) -> None:
+        try:
+            self.duration_ms = e.duration.in_milliseconds
+            self.works = True
+        except Exception as ex:
+            print(f"[AUDIO] on_duration_change error: {ex}")
+
+    def _on_position_change(self, e) -> None:
+        try:
+            self._position = (e.position, time.monotonic())
+        except Exception:
+            pass
+
+    def _on_state_change(self, e) -> None:
+        # Pause/Resume/Ende an den Fortschritt der Frage-Ansicht weiterreichen
+        fn = self._page.session.store.get("_question_audio_state")
+        if callable(fn):
+            fn(getattr(e.state, "value", str(e.state)))
+
+
+def audio_service(page: ft.Page, assets_dir: Path) -> AudioService:
+    """Session-weiter AudioService; überlebt Rebuilds und Screen-Wechsel."""
+    service = page.session.store.get(_SESSION_KEY)
+    if service is None:
+        service = AudioService(page, assets_dir)
+        page.session.store.set(_SESSION_KEY, service)
+    return service
@@ -1,14 +1,14 @@
 import flet as ft
 
 from app_state import AppState, Capabilities, compute_capabilities
-from ui.layout import LAYOUT
+from ui.resize import resize_coordinator
 
 from views.player_view import player_view
 from views.board_grid import board_grid_view
 from views.topbar import topbar_view
 
 
-def board_view(page: ft.Page, state: AppState, rerender, broadcast_state, caps: Capabilities | None = None) -> (
+def board_view(page: ft.Page, state: AppState, rerender, submit, caps: Capabilities | None = None) -> (
         ft.Control):
     if state.board is None:
         state.screen = "lobby"
@@ -22,9 +22,9 @@ def board_view(page: ft.Page, state: AppState, rerender, broadcast_state, caps:
         caps = compute_capabilities(state, role)
 
     def go_lobby(_):
-        state.screen = "lobby"
-        broadcast_state()
-        rerender()
+        def _to_lobby(s: AppState):
+            s.screen = "lobby"
+        submit(_to_lobby)
 
     topbar = topbar_view(
         title=state.board.title or "Board",
@@ -34,11 +34,12 @@ def board_view(page: ft.Page, state: AppState, rerender, broadcast_state, caps:
     def on_pick_tile(cat_i: int, tile_i: int):
         if not caps.can_pick_tile:
             return
-        state.selected = (cat_i, tile_i)
-        state.start_question_round()
-        state.screen = "question"
-        rerender()
-        broadcast_state()
+
+        def _pick(s: AppState):
+            s.selected = (cat_i, tile_i)
+            s.start_question_round()
+            s.screen = "question"
+        submit(_pick)
 
     board_host = board_grid_view(
         page,
@@ -46,31 +47,24 @@ def board_view(page: ft.Page, state: AppState, rerender, broadcast_state, caps:
         on_pick_tile=on_pick_tile,
         can_pick_tile=caps.can_pick_tile,
     )
-    player_host = player_view(page, state, broadcast_state, can_select_turn=caps.can_select_turn)
-
-    def recompute_all():
-        # Parameters
-        viewport_w = page.width or 1200
-        pad = LAYOUT.page_padding
+    player_host = player_view(page, state, submit, can_select_turn=caps.can_select_turn)
 
-        # Board recompute
-        bd = getattr(board_host, "data", None) or {}
-        fn = bd.get("recompute")
-        if callable(fn):
-            fn(viewport_w, pad)
+    def _recompute_fn(part):
+        return (getattr(part, "data", None) or {}).get("recompute")
 
-        # Player recompute
-        pd = getattr(player_host, "data", None) or {}
-        fn = pd.get("recompute")
-        if callable(fn):
-            fn(viewport_w, pad)
+    # Resize: gebündelt, nur bei geändertem Layout ein page.update()
+    coordinator = resize_coordinator(page)
+    coordinator.set_targets(_recompute_fn(board_host), _recompute_fn(player_host))
 
-    def on_resize(_):
-        recompute_all()
-        page.update()
+    def apply(delta) -> bool:
+        # Nur die betroffenen Teile nachziehen; False → Router baut den Screen neu
+        for part in (board_host, player_host):
+            fn = (getattr(part, "data", None) or {}).get("apply")
+            if not callable(fn) or not fn(delta):
+                return False
+        return True
 
-    page.on_resize = on_resize
-    recompute_all()
+    page.on_resize = coordinator.on_resize
 
     return ft.Column(
         controls=[
@@ -82,4 +76,5 @@ def board_view(page: ft.Page, state: AppState, rerender, broadcast_state, caps:
         ],
         expand=True,
         spacing=0,
+        data={"apply": apply},
     )
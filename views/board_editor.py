@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import json
-import shutil
 import uuid
 from pathlib import Path
 from typing import Callable
 
 import flet as ft
 
+import async_io
 from board_loader import BOARDS_DIR
 from views.topbar import topbar_view
 
@@ -80,6 +80,11 @@ def _load_into_editor(board_id: str) -> tuple[str, list[_CatData], int, int]:
     return title, cats, num_cats, num_q
 
 
+async def load_editor_data(board_id: str) -> tuple[str, list[_CatData], int, int]:
+    """_load_into_editor im I/O-Pool; Ergebnis geht als ``loaded`` an board_editor_view."""
+    return await async_io.run_io(_load_into_editor, board_id)
+
+
 def _create_board_skeleton(board_id: str, title: str, num_cats: int, num_q: int) -> None:
     """Legt ein leeres Board-Gerüst auf dem Dateisystem an."""
     board_dir = BOARDS_DIR / board_id
@@ -182,7 +187,7 @@ def board_setup_view(
             q_label.value = str(new)
             q_label.update()
 
-    def on_submit(_):
+    async def on_submit(_):
         title = title_field.value.strip()
         if not title:
             error_text.value = "Bitte einen Board-Titel eingeben."
@@ -192,7 +197,7 @@ def board_setup_view(
         error_text.visible = False
         error_text.update()
         board_id = str(uuid.uuid4())
-        _create_board_skeleton(board_id, title, num_cats_val[0], num_q_val[0])
+        await async_io.run_io(_create_board_skeleton, board_id, title, num_cats_val[0], num_q_val[0])
         on_created(board_id)
 
     def _stepper(label: str, ctrl: ft.Control, on_dec, on_inc) -> ft.Control:
@@ -248,10 +253,12 @@ def board_setup_view(
 def board_editor_view(
     page: ft.Page,
     board_id: str,
+    loaded: tuple[str, list[_CatData], int, int],
     on_back: Callable,
 ) -> ft.Control:
-    """Schritt 2: Feste Struktur befüllen (kein Hinzufügen/Entfernen von Kategorien/Fragen)."""
-    loaded_title, cats, num_cats_target, num_q_target = _load_into_editor(board_id)
+    """Schritt 2: Feste Struktur befüllen (kein Hinzufügen/Entfernen von Kategorien/Fragen).
+    ``loaded`` ist das Ergebnis von _load_into_editor (vom Router im I/O-Pool geladen)."""
+    loaded_title, cats, num_cats_target, num_q_target = loaded
 
     # Struktur auf Zielgröße bringen (Padding / Trimming)
     while len(cats) < num_cats_target:
@@ -370,13 +377,11 @@ def board_editor_view(
                     if not safe_name:
                         return
                     sub_dir = "sounds" if current_type == "audio" else "images"
-                    dest_dir = board_dir / sub_dir
-                    dest_dir.mkdir(exist_ok=True)
-                    dest = dest_dir / safe_name
+                    dest = board_dir / sub_dir / safe_name
                     if picked.bytes:
-                        dest.write_bytes(picked.bytes)
+                        await async_io.write_bytes(dest, picked.bytes)
                     elif picked.path:
-                        shutil.copy2(picked.path, dest)
+                        await async_io.copy_file(picked.path, dest)
                     else:
                         return
                     q.assets.append(f"{sub_dir}/{safe_name}")
@@ -452,7 +457,7 @@ def board_editor_view(
             ),
         )
 
-    def save(_):
+    async def save(_):
         # Typen zuverlässig aus Dropdowns lesen (on_select in Flet 0.83 manchmal unzuverlässig)
         for (ci, qi), dd in _type_dropdowns.items():
             cats[ci].questions[qi].type_ = dd.value or "text"
@@ -464,7 +469,7 @@ def board_editor_view(
             status_text.color = "error"
             status_text.update()
             return
-        is_complete = _save_board(board_id, title, cats, num_cats_target, num_q_target)
+        is_complete = await async_io.run_io(_save_board, board_id, title, cats, num_cats_target, num_q_target)
         if is_complete:
             status_text.value = "✓ Gespeichert – Board ist vollständig und spielbereit."
             status_text.color = "tertiary"
@@ -1,8 +1,7 @@
 import flet as ft
-from flet.controls.core import view
 
 from app_state import AppState
-from ui.layout import LAYOUT
+from ui.layout import LAYOUT, column_width
 
 
 def board_grid_view(
@@ -17,7 +16,9 @@ def board_grid_view(
     - Spaltenbreite verteilt sich gleichmäßig über die Containerbreite
     - Mindestbreite pro Spalte; wenn überschritten -> horizontaler Scroll
     - Host hat fixe Höhe (Board expandet nicht vertikal)
-    - host.data["recompute"] = Funktion zum Rebuild bei Resize
+    - host.data["recompute"] = passt bei Resize nur die Breiten an (True, wenn geändert)
+    - host.data["apply"] = Tiles nach geändertem "used"-Stand nachziehen; False,
+      wenn ein anderes Board geladen wurde (dann baut der Router neu)
     """
     if state.board is None:
         return ft.Text("Kein Board geladen.")
@@ -35,70 +36,67 @@ def board_grid_view(
         shape=ft.RoundedRectangleBorder(radius=10),
     )
 
-    def build_board_grid(col_w: int) -> ft.Control:
-        header = ft.Row(
-            controls=[
-                ft.Container(
-                    width=col_w,
-                    height=CELL_H,
-                    alignment=ft.Alignment.CENTER,
-                    padding=10,
-                    border=ft.Border.all(2, color="primary"),
-                    bgcolor="primary_container",
-                    border_radius=10,
-                    content=ft.Text(cat.title, weight=ft.FontWeight.BOLD, color="on_primary_container"),
-                )
-                for cat in state.board.categories
-            ],
-            spacing=GAP,
+    # Ein Control pro Header/Tile, einmal gebaut und danach nur noch mutiert:
+    # Resize setzt Breiten, "used" schaltet disabled bzw. das Label um.
+    headers: list[ft.Container] = [
+        ft.Container(
+            height=CELL_H,
+            alignment=ft.Alignment.CENTER,
+            padding=10,
+            border=ft.Border.all(2, color="primary"),
+            bgcolor="primary_container",
+            border_radius=10,
+            content=ft.Text(cat.title, weight=ft.FontWeight.BOLD, color="on_primary_container"),
         )
-
-        def tile_cell(cat_i: int, tile_i: int) -> ft.Control:
-            tile = state.board.categories[cat_i].tiles[tile_i]
-
-            if can_pick_tile:
-                def _pick(_):
-                    if tile.used or on_pick_tile is None:
-                        return
-                    on_pick_tile(cat_i, tile_i)
-
-                return ft.Container(
-                    width=col_w,
-                    height=CELL_H,
-                    alignment=ft.Alignment.CENTER,
-                    content=ft.Button(
-                        content=str(tile.value),
-                        on_click=_pick,
-                        disabled=tile.used,
-                        style=tile_btn_style,
-                        width=col_w,
-                        height=CELL_H,
-                    ),
-                )
-
+        for cat in state.board.categories
+    ]
+    # (cat_i, tile_i) -> (Zelle, Button bzw. Text)
+    tiles: dict[tuple[int, int], tuple[ft.Container, ft.Control]] = {}
+    used_shown: dict[tuple[int, int], bool] = {}
+
+    def tile_cell(cat_i: int, tile_i: int) -> ft.Control:
+        tile = state.board.categories[cat_i].tiles[tile_i]
+
+        if can_pick_tile:
+            def _pick(_):
+                if tile.used or on_pick_tile is None:
+                    return
+                on_pick_tile(cat_i, tile_i)
+
+            inner = ft.Button(
+                content=str(tile.value),
+                on_click=_pick,
+                disabled=tile.used,
+                style=tile_btn_style,
+                height=CELL_H,
+            )
+            cell = ft.Container(
+                height=CELL_H,
+                alignment=ft.Alignment.CENTER,
+                content=inner,
+            )
+        else:
             # Spieler-Ansicht: kein Button, kein Cursor, kein Klick-Feedback
-            return ft.Container(
-                width=col_w,
+            inner = ft.Text("" if tile.used else str(tile.value))
+            cell = ft.Container(
                 height=CELL_H,
                 alignment=ft.Alignment.CENTER,
                 border_radius=10,
                 bgcolor="surface_container",
                 border=ft.Border.all(1, color="outline"),
-                content=ft.Text("" if tile.used else str(tile.value)),
-            )
-
-        grid_rows = [header]
-        for r in range(rows):
-            grid_rows.append(
-                ft.Row(
-                    controls=[tile_cell(c, r) for c in range(cols)],
-                    spacing=GAP,
-                )
+                content=inner,
             )
+        tiles[(cat_i, tile_i)] = (cell, inner)
+        used_shown[(cat_i, tile_i)] = tile.used
+        return cell
 
-        return ft.Column(controls=grid_rows, spacing=GAP)
+    grid_rows: list[ft.Control] = [ft.Row(controls=headers, spacing=GAP)]
+    for r in range(rows):
+        grid_rows.append(ft.Row(controls=[tile_cell(c, r) for c in range(cols)], spacing=GAP))
 
-    board_content = ft.Column()
+    board_content = ft.Column(controls=grid_rows, spacing=GAP)
+    board = state.board
+    col_w_ref = [None]
 
     # Fixe Höhe: Header + rows
     board_height = (CELL_H + GAP) * (rows + 1) + GAP
@@ -115,16 +113,37 @@ def board_grid_view(
         ),
     )
 
-    def recompute(viewport_w: int, pad: int):
-        usable = viewport_w
-        usable -= 2 * pad
-        usable -= 2 * 8  # host.padding
-
-        col_w = int(max(MIN_COL_W, (usable - (cols - 1) * GAP) / cols))
-        board_content.controls = [build_board_grid(col_w)]
+    def recompute(viewport_w: int, pad: int) -> bool:
+        col_w = column_width(viewport_w, pad, cols, MIN_COL_W, GAP)
+        if col_w == col_w_ref[0]:
+            return False
+        col_w_ref[0] = col_w
+        for header in headers:
+            header.width = col_w
+        for cell, inner in tiles.values():
+            cell.width = col_w
+            if can_pick_tile:
+                inner.width = col_w
+        return True
+
+    def apply(delta) -> bool:
+        if state.board is not board:
+            return False
+        if "board" not in delta:
+            return True
+        for (cat_i, tile_i), (_cell, inner) in tiles.items():
+            tile = board.categories[cat_i].tiles[tile_i]
+            if used_shown[(cat_i, tile_i)] == tile.used:
+                continue
+            used_shown[(cat_i, tile_i)] = tile.used
+            if can_pick_tile:
+                inner.disabled = tile.used
+            else:
+                inner.value = "" if tile.used else str(tile.value)
+        return True
 
-    # Initial befüllen (kein update() auf board_content!)
+    # Initiale Breiten setzen (kein update() auf board_content!)
     recompute(page.width or 1200, LAYOUT.page_padding)
 
-    host.data = {"recompute": recompute}
+    host.data = {"recompute": recompute, "apply": apply}
     return host
@@ -1,10 +1,17 @@
 import flet as ft
-from typing import Callable, Optional
+from typing import Callable, Optional, Sequence
 
 from ui.layout import LAYOUT
 
 
 class PlayerCard(ft.Container):
+    """Spielerkarte mit Name, frei belegbarer Mitte und Punkte-Badge (+ Footer).
+
+    Die Karte wird einmal gebaut und danach über die ``set_*``-Methoden in-place
+    geändert; jede Methode fasst nur die betroffenen Controls an und nur, wenn
+    sich der Wert wirklich ändert. Punkte vergeben → ein geändertes ``ft.Text``.
+    """
+
     def __init__(
         self,
         name: str,
@@ -23,42 +30,100 @@ class PlayerCard(ft.Container):
         self.body_content = body_content
         self.footer_controls = footer_controls
         self.highlight_color = highlight_color
+        # Schlüssel, mit dem Body/Footer zuletzt gebaut wurden (None = immer neu setzen)
+        self.body_key = None
+        self.footer_key = None
 
-        border_color = highlight_color if highlight_color else ("primary" if is_active else "outline")
-        border_width = 2 if (is_active or highlight_color) else 1
-        self.border = ft.Border.all(border_width, color=border_color)
         self.border_radius = 16
         self.padding = LAYOUT.card_padding
         self.expand = 1
         self.bgcolor = "surface_container"
+        self._apply_border()
 
         # klickbar (Host kann Turn setzen)
         if on_select is not None:
             self.on_click = lambda _: on_select()
 
-        self.content = self._build()
+        self._name_text = ft.Text(name, weight=ft.FontWeight.BOLD)
+        self._score_text = ft.Text(f"Punkte: {score}", weight=ft.FontWeight.BOLD)
+        self._middle = ft.Container(
+            expand=1,
+            alignment=ft.Alignment.CENTER,
+            content=body_content,
+        )
+        self._bottom = ft.Container(alignment=ft.Alignment.CENTER)
+        self._score_badge = self._badge(self._score_text)
+        self._build_bottom()
+
+        self.content = ft.Column(
+            controls=[
+                ft.Container(alignment=ft.Alignment.CENTER, content=self._badge(self._name_text)),
+                self._middle,
+                self._bottom,
+            ],
+            spacing=8,
+        )
+
+    # -- In-place Updates -------------------------------------------------------
+
+    def set_name(self, name: str) -> None:
+        if name != self.name:
+            self.name = name
+            self._name_text.value = name
+
+    def set_score(self, score: int) -> None:
+        if score != self.score:
+            self.score = score
+            self._score_text.value = f"Punkte: {score}"
+
+    def set_active(self, is_active: bool) -> None:
+        if is_active != self.is_active:
+            self.is_active = is_active
+            self._apply_border()
+
+    def set_highlight(self, color: str | None) -> None:
+        if color != self.highlight_color:
+            self.highlight_color = color
+            self._apply_border()
+
+    def set_body(self, content: ft.Control | None, key=None) -> None:
+        """Tauscht die Mitte. Mit ``key`` nur, wenn er sich seit dem letzten Aufruf
+        geändert hat — ``content`` darf dann ein Builder ``() -> Control`` sein."""
+        if key is not None and key == self.body_key:
+            return
+        self.body_key = key
+        self.body_content = content() if callable(content) else content
+        self._middle.content = self.body_content
 
-    def _badge(self, text: str) -> ft.Container:
+    def set_footer(self, controls: list[ft.Control] | None, key=None) -> None:
+        """Wie :meth:`set_body`, für die Footer-Zeile unter dem Punkte-Badge."""
+        if key is not None and key == self.footer_key:
+            return
+        self.footer_key = key
+        self.footer_controls = controls() if callable(controls) else controls
+        self._build_bottom()
+
+    # -- Aufbau ---------------------------------------------------------------
+
+    def _apply_border(self) -> None:
+        color = self.highlight_color if self.highlight_color else ("primary" if self.is_active else "outline")
+        width = 2 if (self.is_active or self.highlight_color) else 1
+        self.border = ft.Border.all(width, color=color)
+
+    def _badge(self, text: ft.Text) -> ft.Container:
         return ft.Container(
             padding=ft.Padding(left=12, right=12, top=6, bottom=6),
             border_radius=12,
             alignment=ft.Alignment.CENTER,
             bgcolor="#26ffffff",
-            content=ft.Text(text, weight=ft.FontWeight.BOLD),
-        )
-
-    def _build(self) -> ft.Control:
-        middle = ft.Container(
-            expand=1,
-            alignment=ft.Alignment.CENTER,
-            content=self.body_content,
+            content=text,
         )
 
-        score_badge = self._badge(f"Punkte: {self.score}")
+    def _build_bottom(self) -> None:
         if self.footer_controls:
-            bottom = ft.Column(
+            self._bottom.content = ft.Column(
                 controls=[
-                    ft.Container(alignment=ft.Alignment.CENTER, content=score_badge),
+                    ft.Container(alignment=ft.Alignment.CENTER, content=self._score_badge),
                     ft.Row(
                         controls=self.footer_controls,
                         alignment=ft.MainAxisAlignment.CENTER,
@@ -70,13 +135,36 @@ class PlayerCard(ft.Container):
                 spacing=4,
             )
         else:
-            bottom = ft.Container(alignment=ft.Alignment.CENTER, content=score_badge)
+            self._bottom.content = self._score_badge
 
-        return ft.Column(
-            controls=[
-                ft.Container(alignment=ft.Alignment.CENTER, content=self._badge(self.name)),
-                middle,
-                bottom,
-            ],
-            spacing=8,
-        )
+
+def card_key(index: int, player) -> str:
+    """Stabiler Cache-Schlüssel einer Karte: player_id, für Platzhalter-Spieler der Slot."""
+    return player.player_id or f"#{index}"
+
+
+def sync_card_row(
+    row: ft.Row,
+    cards: dict[str, PlayerCard],
+    players: Sequence,
+    card_w: int,
+    update: Callable[[str, int, object, Optional[PlayerCard]], PlayerCard],
+) -> None:
+    """Gleicht die Kartenzeile mit ``players`` ab. Karten bleiben pro card_key über
+    Refreshes erhalten: ``update(key, i, player, card)`` baut eine neue Karte
+    (``card`` None) bzw. ändert die bestehende per ``set_*`` und gibt sie zurück.
+    Karten ausgeschiedener Spieler fliegen raus; ``row.controls`` wird nur neu
+    gesetzt, wenn sich Reihenfolge oder Besetzung geändert haben."""
+    keys = []
+    for i, p in enumerate(players):
+        key = card_key(i, p)
+        card = cards[key] = update(key, i, p, cards.get(key))
+        card.width = card_w
+        card.height = round(card_w * 9 / 16)
+        keys.append(key)
+
+    for gone in set(cards) - set(keys):
+        del cards[gone]
+    ordered = [cards[k] for k in keys]
+    if len(ordered) != len(row.controls) or any(a is not b for a, b in zip(ordered, row.controls)):
+        row.controls = ordered
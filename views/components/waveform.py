@@ -0,0 +1,110 @@
+import flet as ft
+from typing import Callable, Optional
+
+
+class WaveformProgress(ft.Container):
+    """Waveform-Balken mit Abspielfortschritt.
+
+    Zwei Modi:
+    - animiert: über den grauen Balken liegt eine Kopie in "primary", deren
+      Clip-Breite der Client per implizitem ``animate`` selbst von der Startposition
+      bis zum Ende zieht. Der Server schickt nur Start, Pause/Seek und Ende.
+    - Loop-Fallback: ``show_fraction`` färbt die Balken direkt ein und pusht nur
+      die, deren Farbe sich tatsächlich geändert hat.
+
+    ``push(*controls)`` schickt geänderte Controls an den Client (Standard:
+    ``update()`` pro Control). Schlägt das fehl, ist die Waveform nicht mehr auf
+    der Page und ``detached`` wird True.
+    """
+
+    BAR_W = 5
+    BAR_GAP = 3
+
+    def __init__(self, heights: list[int], height: int = 52,
+                 push: Optional[Callable[..., None]] = None):
+        super().__init__()
+        self._push = push or self._push_each
+        self.detached = False
+        self.bar_count = len(heights)
+        self.total_width = self.bar_count * self.BAR_W + max(0, self.bar_count - 1) * self.BAR_GAP
+        self._filled = 0
+
+        self._bars = [self._bar(h, "outline", animate=ft.Animation(80, ft.AnimationCurve.EASE_IN_OUT))
+                      for h in heights]
+        self._bars_row = self._row(self._bars)
+        played = [self._bar(h, "primary") for h in heights]
+        self._mask = ft.Container(
+            left=0, top=0, width=0, height=height,
+            clip_behavior=ft.ClipBehavior.HARD_EDGE,
+            # Positioniert mit fixer Breite: wird nicht auf die Clip-Breite gestaucht
+            content=ft.Stack(controls=[
+                ft.Container(left=0, top=0, width=self.total_width, height=height, content=self._row(played)),
+            ]),
+        )
+        self.content = ft.Stack(
+            width=self.total_width,
+            height=height,
+            controls=[
+                ft.Container(left=0, top=0, width=self.total_width, height=height, content=self._bars_row),
+                self._mask,
+            ],
+        )
+
+    def _push_each(self, *controls: ft.Control) -> None:
+        for c in controls:
+            try:
+                c.update()
+            except Exception:
+                self.detached = True
+
+    def _bar(self, h: int, color: str, animate=None) -> ft.Container:
+        return ft.Container(width=self.BAR_W, height=h, bgcolor=color, border_radius=2, animate=animate)
+
+    def _row(self, bars: list[ft.Container]) -> ft.Row:
+        return ft.Row(controls=bars, spacing=self.BAR_GAP, vertical_alignment=ft.CrossAxisAlignment.CENTER)
+
+    # -- Animiert (Client zieht den Fortschritt selbst) -------------------------
+
+    def animate_from(self, position_ms: int, duration_ms: int) -> None:
+        """Startet die Client-Animation ab ``position_ms`` (Start, Resume, Seek)."""
+        remaining = max(0, duration_ms - position_ms)
+        start_w = self._width_at(position_ms, duration_ms)
+        if self._mask.width != start_w:
+            # Erst ohne Animation auf die Startposition springen
+            self._mask.animate = None
+            self._mask.width = start_w
+            self._push(self._mask)
+        self._mask.animate = ft.Animation(remaining, ft.AnimationCurve.LINEAR)
+        self._mask.width = self.total_width
+        self._push(self._mask)
+
+    def hold_at(self, position_ms: int, duration_ms: int) -> None:
+        """Hält die Animation an der Position an (Pause, Seek ohne Abspielen)."""
+        self._mask.animate = None
+        self._mask.width = self._width_at(position_ms, duration_ms)
+        self._push(self._mask)
+
+    def _width_at(self, position_ms: int, duration_ms: int) -> int:
+        if not duration_ms:
+            return 0
+        return round(self.total_width * min(1.0, max(0.0, position_ms / duration_ms)))
+
+    # -- Loop-Fallback ----------------------------------------------------------
+
+    def show_fraction(self, fraction: float) -> None:
+        """Färbt die ersten ``fraction`` der Balken ein; pusht nur geänderte Balken."""
+        filled = int(min(1.0, max(0.0, fraction)) * self.bar_count)
+        if filled == self._filled:
+            return
+        lo, hi = sorted((self._filled, filled))
+        for bar in self._bars[lo:hi]:
+            bar.bgcolor = "primary" if filled > self._filled else "outline"
+        self._filled = filled
+        # Ein Balken → nur er; mehrere → ein Patch über die Zeile (enthält nur die geänderten)
+        self._push(self._bars[lo] if hi - lo == 1 else self._bars_row)
+
+    def reset(self) -> None:
+        """Zurück auf Anfang (beide Modi)."""
+        self.show_fraction(0.0)
+        if self._mask.width:
+            self.hold_at(0, 0)
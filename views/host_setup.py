@@ -1,6 +1,5 @@
 import flet as ft
 from typing import Callable
-from board_loader import list_boards
 from views.topbar import topbar_view
 
 MIN_PLAYERS = 2
@@ -8,15 +7,17 @@ MAX_PLAYERS = 8
 
 
 def host_setup_view(
+    boards: list[tuple[str, str, bool]],
     on_create: Callable[[dict], None],
     on_back: Callable,
 ) -> ft.Control:
+    """``boards`` wie list_boards() — (board_id, title, wip), vom Router im I/O-Pool geladen."""
     max_players_val = [4]
 
     count_label = ft.Text(str(max_players_val[0]), size=24, weight=ft.FontWeight.BOLD, width=40, text_align=ft.TextAlign.CENTER)
     error_text = ft.Text("", color="error", visible=False)
 
-    boards = [(bid, title) for bid, title, wip in list_boards() if not wip]
+    boards = [(bid, title) for bid, title, wip in boards if not wip]
 
     def update_count(delta: int):
         new_val = max_players_val[0] + delta
@@ -1,55 +1,56 @@
 import flet as ft
+import async_io
 from app_state import AppState
-from board_loader import load_board
+from game_engine import get_engine
+from lobby_messages import PlayerLeave
+from lobby_pubsub import SESSION_KEY as LOBBY_CHANNEL_KEY, send_to_host
 from views.topbar import topbar_view
 
 
-def lobby_view(page: ft.Page, state: AppState, rerender, *, broadcast_state=None) -> ft.Control:
+def lobby_view(page: ft.Page, state: AppState, rerender, *, submit=None) -> ft.Control:
     role = (page.session.store.get("role") or "host").lower()
     is_host = role == "host"
     lobby_id = page.session.store.get("lobby_id") or "—"
 
-    def on_new_game(_):
-        if not is_host:
+    def _start_game(s: AppState, board):
+        s.board = board
+        s.ensure_players()
+        for p in s.players:
+            p.score = 0
+        s.mark_dirty("players")
+        s.set_turn(0)
+        s.screen = "board"
+
+    async def on_new_game(_):
+        if not (is_host and submit):
             return
         board_id = page.session.store.get("board_id") or ""
         try:
-            state.board = load_board(board_id)
+            board = await async_io.load_board(board_id)
         except ValueError as e:
             print(f"[Lobby] Board laden fehlgeschlagen: {e}")
             return
-        state.ensure_players()
-        for p in state.players:
-            p.score = 0
-        state.set_turn(0)
-        state.screen = "board"
-        rerender()
-        if broadcast_state:
-            broadcast_state(include_board=True)  # Board frisch geladen
+        submit(_start_game, board, include_board=True)  # Board frisch geladen
+
+    def _resume_game(s: AppState):
+        s.screen = "board"  # Board-Stand reist als board_progress mit
 
     def on_resume_game(_):
-        if not is_host:
-            return
-        state.screen = "board"
-        rerender()
-        if broadcast_state:
-            broadcast_state(include_board=True)  # Sicherheit: Board-Stand mitschicken
+        if is_host and submit:
+            submit(_resume_game)
 
     def go_menu(_):
-        import json
         from views.router import push_route
         if is_host:
-            state.screen = "menu"
-            if broadcast_state:
-                broadcast_state()
+            engine = get_engine(lobby_id)
+            if engine is not None:
+                engine.close()  # "menu" an alle, danach stoppt die Engine
         else:
             player_id = page.session.store.get("player_id")
-            msg = json.dumps({
-                "type": "player_leave",
-                "lobby_id": lobby_id,
-                "player_id": player_id,
-            })
-            page.pubsub.send_all(msg)
+            send_to_host(page, PlayerLeave(player_id=player_id).to_message(lobby_id))
+        channel = page.session.store.get(LOBBY_CHANNEL_KEY)
+        if channel is not None:
+            channel.leave()
         push_route(page, "/menu")
 
     copy_btn = ft.IconButton(
@@ -65,8 +66,6 @@ def lobby_view(page: ft.Page, state: AppState, rerender, *, broadcast_state=None
         right_control=copy_btn,
     )
 
-    real_players = [p for p in state.players if p.player_id]
-
     def filled_slot(name: str) -> ft.Control:
         return ft.Container(
             padding=ft.Padding(left=16, right=16, top=10, bottom=10),
@@ -83,21 +82,30 @@ def lobby_view(page: ft.Page, state: AppState, rerender, *, broadcast_state=None
             content=ft.Text(f"Slot {index} – wartet…", size=15, italic=True, color="outline"),
         )
 
-    if is_host:
-        slots = []
-        for i in range(state.max_players):
-            if i < len(real_players):
-                slots.append(filled_slot(real_players[i].name))
-            else:
-                slots.append(empty_slot(i + 1))
-        player_list = ft.Column(controls=slots, spacing=8)
-    else:
-        player_list = ft.Column(
-            controls=[filled_slot(p.name) for p in real_players] if real_players else [
-                ft.Text("Noch keine Spieler beigetreten…", italic=True, color="outline"),
-            ],
-            spacing=8,
-        )
+    def build_slots() -> list[ft.Control]:
+        real_players = [p for p in state.players if p.player_id]
+        if is_host:
+            slots = []
+            for i in range(state.max_players):
+                if i < len(real_players):
+                    slots.append(filled_slot(real_players[i].name))
+                else:
+                    slots.append(empty_slot(i + 1))
+            return slots
+        if real_players:
+            return [filled_slot(p.name) for p in real_players]
+        return [ft.Text("Noch keine Spieler beigetreten…", italic=True, color="outline")]
+
+    player_list = ft.Column(controls=build_slots(), spacing=8)
+    resume_btn = ft.FilledButton("Spiel fortsetzen", on_click=on_resume_game, visible=is_host and state.board is not None)
+
+    def apply(delta) -> bool:
+        # Join/Leave: nur die Slot-Liste tauschen, Topbar und Buttons bleiben
+        if delta & {"players", "max_players"}:
+            player_list.controls = build_slots()
+        if "board" in delta:
+            resume_btn.visible = is_host and state.board is not None
+        return True
 
     return ft.Column(
         controls=[
@@ -107,9 +115,10 @@ def lobby_view(page: ft.Page, state: AppState, rerender, *, broadcast_state=None
             ft.Container(height=8),
             player_list,
             ft.Container(height=24),
-            ft.FilledButton("Spiel fortsetzen", on_click=on_resume_game, visible=is_host and state.board is not None),
+            resume_btn,
             ft.FilledButton("Spiel starten", on_click=on_new_game, visible=is_host),
             ft.Text("Warte auf den Host…", visible=not is_host),
         ],
         tight=True,
+        data={"apply": apply},
     )
@@ -1,17 +1,23 @@
-import math
 import flet as ft
 from app_state import AppState
-from ui.layout import LAYOUT
-from views.components.player_card import PlayerCard
+from ui.layout import LAYOUT, card_width
+from views.components.player_card import PlayerCard, card_key, sync_card_row
 
+# State-Felder, die die Spielerkarten betreffen
+_PLAYER_FIELDS = frozenset({"players", "active_player_index", "max_players"})
 
-def player_view(page: ft.Page, state: AppState, broadcast_state, *, can_select_turn: bool = True) -> ft.Container:
+
+def player_view(page: ft.Page, state: AppState, submit, *, can_select_turn: bool = True) -> ft.Container:
     state.ensure_players()
 
     MIN_PLAYER_W = 220
     PLAYER_GAP = 12
 
-    players_content = ft.Column()
+    # Karten pro Spieler (card_key) bleiben über Refreshes erhalten und werden
+    # nur per set_* geändert; neu gebaut wird nur für neue Spieler.
+    cards: dict[str, PlayerCard] = {}
+    players_row = ft.Row(controls=[], spacing=PLAYER_GAP, expand=1)
+    players_content = ft.Column(controls=[players_row])
 
     host = ft.Container(
         padding=8,
@@ -24,53 +30,45 @@ def player_view(page: ft.Page, state: AppState, broadcast_state, *, can_select_t
         ),
     )
 
-    def build_players_row(card_width: int) -> ft.Row:
-        cards = []
-
-        for i, p in enumerate(state.players):
-
-            def select_turn(i=i):
-                if not can_select_turn:
-                    return
-                state.set_turn(i)
-                recompute(page.width or 1200, LAYOUT.page_padding)
-                page.update()  # nur optisch; Screen bleibt gleich
-                broadcast_state()
-
-            c = PlayerCard(
+    def select_turn(key: str):
+        if not can_select_turn:
+            return
+        idx = next((i for i, p in enumerate(state.players) if card_key(i, p) == key), None)
+        if idx is None:
+            return
+        submit(AppState.set_turn, idx)  # Karten folgen über apply() dem Snapshot der Engine
+
+    def _update_card(key: str, _i: int, p, c: PlayerCard | None) -> PlayerCard:
+        if c is None:
+            return PlayerCard(
                 name=p.name,
                 score=p.score,
                 is_active=p.is_turn,
-                on_select=select_turn if can_select_turn else None,
+                on_select=(lambda key=key: select_turn(key)) if can_select_turn else None,
             )
-            c.width = card_width
-            c.height = round(card_width * 9 / 16)
-            c.expand = 1
-            cards.append(c)
+        c.set_name(p.name)
+        c.set_score(p.score)
+        c.set_active(p.is_turn)
+        return c
 
-        return ft.Row(controls=cards, spacing=PLAYER_GAP, expand=1)
+    shown = [None]  # (card_w, Spielerzahl) der gebauten Karten
 
-    def recompute(viewport_w: int, pad: int):
+    def recompute(viewport_w: int, pad: int, force: bool = False) -> bool:
+        """Gleicht die Karten ab; ohne force nur, wenn sich das Layout ändert."""
         state.ensure_players()
         n = max(1, len(state.players))
-
-        usable = viewport_w
-        usable -= 2 * pad
-        usable -= 2 * 8  # host.padding
-        usable -= 2 * 1 # host.border
-        usable -= 2  # Sicherheitsmarge
-
-        gaps = (n - 1) * PLAYER_GAP
-        # verfügbare Breite für Karten
-        available_for_cards = max(0, usable - gaps)
-
-        # floor statt int() (int() ist auch floor, aber wir halten's explizit)
-        card_w = math.floor(available_for_cards / n)
-
-        # Mindestbreite erzwingen (dann darf gescrollt werden)
-        card_w = max(MIN_PLAYER_W, card_w)
-        players_content.controls = [build_players_row(card_w)]
+        card_w = card_width(viewport_w, pad, n, MIN_PLAYER_W, PLAYER_GAP)
+        if not force and shown[0] == (card_w, n):
+            return False
+        shown[0] = (card_w, n)
+        sync_card_row(players_row, cards, state.players, card_w, _update_card)
+        return True
+
+    def apply(delta) -> bool:
+        if delta & _PLAYER_FIELDS:
+            recompute(page.width or 1200, LAYOUT.page_padding, force=True)
+        return True
 
     recompute(page.width or 1200, LAYOUT.page_padding)
-    host.data = {"recompute": recompute}
+    host.data = {"recompute": recompute, "apply": apply}
     return host
@@ -1,25 +1,63 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
-import json
-import math
+import os
 import time
 from pathlib import Path
 
 import flet as ft
 
 from app_state import AppState, Capabilities, compute_capabilities
-from ui.layout import LAYOUT
-from views.components.player_card import PlayerCard
+from coalesce import Coalescer
+from lobby_messages import PlayerBuzz, PlayerEstimate, PlayerEstimateLock
+from lobby_pubsub import send_to_host
+from ui.layout import LAYOUT, card_width
+from ui.resize import resize_coordinator
+from views.components.player_card import PlayerCard, sync_card_row
+from views.components.waveform import WaveformProgress
 from views.topbar import topbar_view
+from waveform_peaks import PEAK_BARS
+
+# Live-Schätzungen: höchstens eine Nachricht pro Fenster (trailing edge, letzter Wert gewinnt)
+_ESTIMATE_THROTTLE_S = float(os.environ.get("JEOPARDY_ESTIMATE_THROTTLE_MS", "150")) / 1000
+_ESTIMATE_THROTTLE_KEY = "_estimate_throttle"
+
+# Audio-Fortschritt: "animated" = Client animiert ab einem Start-Event,
+# "loop" = Server pollt die Position (nur für Clients ohne Animation)
+_AUDIO_PROGRESS_MODE = os.environ.get("JEOPARDY_AUDIO_PROGRESS", "animated").lower()
+
+# State-Felder, die die Spielerkarten (Score, Antworter, Buzzer, Schätzungen) betreffen
+_PLAYER_ROW_FIELDS = frozenset({
+    "players", "active_player_index", "max_players", "question_answerer_index",
+    "buzzer_open", "buzzed_queue", "estimates", "estimates_locked", "estimates_revealed",
+})
+
+
+def _estimate_throttle(page: ft.Page, question_key) -> Coalescer:
+    """Throttle für player_estimate pro Frage; überlebt View-Rebuilds derselben Frage.
+    Bei einer anderen Frage wird ein noch ausstehender Wert der alten verworfen."""
+    entry = page.session.store.get(_ESTIMATE_THROTTLE_KEY)
+    if entry is not None and entry[0] == question_key:
+        return entry[1]
+    if entry is not None:
+        entry[1].cancel()
+    throttle = Coalescer(page.run_task, lambda msg: send_to_host(page, msg), _ESTIMATE_THROTTLE_S)
+    page.session.store.set(_ESTIMATE_THROTTLE_KEY, (question_key, throttle))
+    return throttle
+
+
+def cancel_pending_estimate(page: ft.Page) -> None:
+    """Verwirft eine noch nicht gesendete Schätzung (Frage verlassen)."""
+    entry = page.session.store.get(_ESTIMATE_THROTTLE_KEY)
+    if entry is not None:
+        entry[1].cancel()
 
 
 def question_view(
     page: ft.Page,
     state: AppState,
     rerender,
-    broadcast_state,
+    submit,
     caps: Capabilities | None = None,
     play_sound=None,
     broadcast_sound=None,
@@ -31,7 +69,6 @@ def question_view(
     get_audio_duration_fn=None,
     get_audio_position_fn=None,
     set_audio_volume_fn=None,
-    rebuild_view=None,
 ) -> ft.Control:
     # Guard rails
     if state.board is None or state.selected is None:
@@ -100,27 +137,26 @@ def question_view(
     # -------------------------------------------------------------------------
     # Action handlers
     # -------------------------------------------------------------------------
+    # Host-Aktionen laufen als Kommando auf dem State der Engine (submit); die
+    # Ansicht folgt dem Snapshot, den die Engine danach zurückmeldet.
     def reveal(_):
-        state.question_answer_revealed = True
-        refresh_answer()
-        answer_container.update()
-        broadcast_state()
+        def _reveal(s: AppState):
+            s.question_answer_revealed = True
+        submit(_reveal)
+
+    def _back_to_board(s: AppState):
+        s.selected = None
+        s.end_question_round()
+        s.screen = "board"
 
     def back_without_use(_):
         page.on_keyboard_event = None
-        state.selected = None
-        state.end_question_round()
-        state.screen = "board"
-        rerender()
-        broadcast_state()
+        submit(_back_to_board)
 
-    def finish_round_and_back():
-        page.on_keyboard_event = None
-        tile.used = True
-        state.selected = None
-        state.end_question_round()
-        state.screen = "board"
-        broadcast_state(include_board=True)
+    def _finish_round(s: AppState):
+        s.board.categories[cat_i].tiles[tile_i].used = True
+        s.mark_dirty("board")  # used-Flag reist als board_progress-Bitmaske mit
+        _back_to_board(s)
 
     correct_btn = ft.FilledButton("✅ Richtig", on_click=lambda _: None)
     wrong_btn = ft.OutlinedButton("❌ Falsch", on_click=lambda _: None)
@@ -128,23 +164,26 @@ def question_view(
     def host_correct(_):
         if not caps.can_award_points:
             return
-        a = state.players[state.question_answerer_index]
-        a.score += tile.value
+        page.on_keyboard_event = None
         _play("correct_answer")
-        state.advance_turn()
-        finish_round_and_back()
-        rerender()
+
+        def _correct(s: AppState):
+            s.players[s.question_answerer_index].score += tile.value
+            s.mark_dirty("players")
+            s.advance_turn()
+            _finish_round(s)
+        submit(_correct)
 
     def host_wrong(_):
         if not caps.can_award_points:
             return
-        a = state.players[state.question_answerer_index]
-        a.score -= tile.value
         _play("wrong_answer")
-        state.open_buzzer()
-        broadcast_state()
-        if rebuild_view:
-            rebuild_view()
+
+        def _wrong(s: AppState):
+            s.players[s.question_answerer_index].score -= tile.value
+            s.mark_dirty("players")
+            s.open_buzzer()
+        submit(_wrong)
 
     correct_btn.on_click = host_correct
     wrong_btn.on_click = host_wrong
@@ -153,12 +192,12 @@ def question_view(
     # Estimate actions
     # -------------------------------------------------------------------------
     def reveal_all_estimates(_):
-        for p in state.players:
-            if p.player_id in state.estimates_locked and p.player_id not in state.estimates_revealed:
-                state.estimates_revealed.append(p.player_id)
-        broadcast_state()
-        if rebuild_view:
-            rebuild_view()
+        def _reveal_all(s: AppState):
+            for p in s.players:
+                if p.player_id in s.estimates_locked and p.player_id not in s.estimates_revealed:
+                    s.estimates_revealed.append(p.player_id)
+            s.mark_dirty("estimates_revealed")
+        submit(_reveal_all)
 
     # -------------------------------------------------------------------------
     # Estimate: input with lock-in for player
@@ -168,6 +207,7 @@ def question_view(
         lobby_id = page.session.store.get("lobby_id") or ""
         is_locked = my_player_id in state.estimates_locked
         existing = state.estimates.get(my_player_id, "")
+        throttle = _estimate_throttle(page, (lobby_id, state.selected))
 
         est_field = ft.TextField(
             label="Deine Schätzung",
@@ -180,12 +220,7 @@ def question_view(
         def on_estimate_change(e):
             if is_locked:
                 return
-            page.pubsub.send_all(json.dumps({
-                "type": "player_estimate",
-                "lobby_id": lobby_id,
-                "player_id": my_player_id,
-                "answer": e.data,
-            }))
+            throttle.request(PlayerEstimate(player_id=my_player_id, answer=e.data).to_message(lobby_id))
 
         est_field.on_change = on_estimate_change
 
@@ -193,12 +228,9 @@ def question_view(
             answer = est_field.value.strip()
             if not answer:
                 return
-            page.pubsub.send_all(json.dumps({
-                "type": "player_estimate_lock",
-                "lobby_id": lobby_id,
-                "player_id": my_player_id,
-                "answer": answer,
-            }))
+            # Lock geht sofort raus; ein noch ausstehender Zwischenstand ist damit überholt
+            throttle.cancel()
+            send_to_host(page, PlayerEstimateLock(player_id=my_player_id, answer=answer).to_message(lobby_id))
 
         controls = [ft.Row(controls=[est_field])]
         if is_locked:
@@ -221,19 +253,18 @@ def question_view(
         n_assets = len(q.assets)
         asset_idx = max(0, min(state.question_asset_index, n_assets - 1))
 
+        def _nav(step: int):
+            def _move(s: AppState):
+                s.question_asset_index = max(0, min(s.question_asset_index + step, n_assets - 1))
+            submit(_move)
+
         def _nav_prev(_):
             if state.question_asset_index > 0:
-                state.question_asset_index -= 1
-                broadcast_state()
-                if rebuild_view:
-                    rebuild_view()
+                _nav(-1)
 
         def _nav_next(_):
             if state.question_asset_index < n_assets - 1:
-                state.question_asset_index += 1
-                broadcast_state()
-                if rebuild_view:
-                    rebuild_view()
+                _nav(1)
 
         return ft.Row(
             controls=[
@@ -254,6 +285,8 @@ def question_view(
     def _build_media_content() -> ft.Control | None:
         asset_idx = max(0, min(state.question_asset_index, len(q.assets) - 1)) if q.assets else 0
         current_asset = q.assets[asset_idx] if q.assets else None
+        # Beim Laden des Boards vorab ermittelt (board_loader) — hier keine Datei-I/O
+        meta = (state.board.asset_meta.get(current_asset) if state.board and current_asset else None) or {}
 
         if q_type == "text":
             return None
@@ -279,8 +312,10 @@ def question_view(
                     page.overlay.append(dlg)
                     page.update()
 
+                # Breite aus dem Sidecar reservieren: kein Layout-Sprung, wenn das Bild ankommt
+                img_w = round(300 * meta["width"] / meta["height"]) if meta.get("height") else None
                 return ft.GestureDetector(
-                    content=ft.Image(src=src, fit=ft.BoxFit.CONTAIN, height=300),
+                    content=ft.Image(src=src, fit=ft.BoxFit.CONTAIN, height=300, width=img_w),
                     on_tap=_open_zoom,
                     mouse_cursor=ft.MouseCursor.ZOOM_IN,
                 )
@@ -301,33 +336,21 @@ def question_view(
             if audio_src and set_question_audio_src:
                 set_question_audio_src(audio_src)
 
-            _seed = Path(current_asset).name if current_asset else "default"
-            _h = hashlib.md5(_seed.encode()).digest()
-            base_heights = [8 + (_h[i % len(_h)] % 44) for i in range(24)]
-            is_playing = [False]
-
-            bars: list[ft.Container] = [
-                ft.Container(
-                    width=5,
-                    height=h,
-                    bgcolor="outline",
-                    border_radius=2,
-                    animate=ft.Animation(80, ft.AnimationCurve.EASE_IN_OUT),
-                )
-                for h in base_heights
-            ]
-            waveform_row = ft.Row(
-                controls=bars,
-                alignment=ft.MainAxisAlignment.CENTER,
-                vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                spacing=3,
-            )
+            meta_duration_ms = meta.get("duration_ms")
+
+            # Offline berechnete Peaks (python -m waveform_peaks); noch keine → flache Balken
+            peaks = meta.get("peaks") or [0.5] * PEAK_BARS
+            base_heights = [8 + round(p * 44) for p in peaks]
+            play_gen = [0]           # pro Start/Pause/Ende erhöht; ältere Progress-Tasks beenden sich
+            progress = ["idle"]      # "idle" | "playing" | "paused"
+
+            waveform = WaveformProgress(base_heights)
             waveform_box = ft.Container(
                 height=68,
                 border=ft.Border.all(1, color="outline"),
                 border_radius=10,
                 padding=ft.Padding(left=16, right=16, top=8, bottom=8),
-                content=waveform_row,
+                content=waveform,
                 alignment=ft.Alignment(0, 0),
             )
 
@@ -341,27 +364,35 @@ def question_view(
                 return f"{s // 60}:{s % 60:02d}"
 
             def _get_duration_ms() -> int | None:
-                return get_audio_duration_fn() if get_audio_duration_fn else None
+                # Player-Wert, sobald bekannt; bis dahin die vorab vermessene Dauer
+                return (get_audio_duration_fn() if get_audio_duration_fn else None) or meta_duration_ms
+
+            def _get_position_ms() -> int:
+                return (get_audio_position_fn() if get_audio_position_fn else None) or 0
 
             time_text = ft.Text(
-                "0:00 / --:--",
+                f"0:00 / {_fmt(meta_duration_ms) if meta_duration_ms else '--:--'}",
                 size=12,
                 opacity=0.6,
                 visible=flet_audio_available,
             )
 
-            def _reset_bars():
-                for bar in bars:
-                    bar.bgcolor = "outline"
-                dur_ms = _get_duration_ms()
-                time_text.value = f"0:00 / {_fmt(dur_ms) if dur_ms else '--:--'}"
+            def _set_time(value: str):
+                # Nur pushen, wenn sich der angezeigte Text ändert
+                if time_text.value == value:
+                    return
+                time_text.value = value
                 try:
-                    waveform_row.update()
                     time_text.update()
                 except Exception:
                     pass
 
-            async def _run_progress():
+            def _reset_progress():
+                waveform.reset()
+                dur_ms = _get_duration_ms()
+                _set_time(f"0:00 / {_fmt(dur_ms) if dur_ms else '--:--'}")
+
+            async def _wait_for_duration() -> int | None:
                 duration_ms = _get_duration_ms()
                 if duration_ms is None and get_audio_duration_fn:
                     for _ in range(15):
@@ -369,34 +400,46 @@ def question_view(
                         duration_ms = _get_duration_ms()
                         if duration_ms is not None:
                             break
+                return duration_ms
 
-                dur_str = _fmt(duration_ms) if duration_ms else "--:--"
-                time_text.value = f"0:00 / {dur_str}"
-                try:
-                    time_text.update()
-                except Exception:
-                    pass
+            async def _finish(gen: int):
+                progress[0] = "idle"
+                await asyncio.sleep(1.0)
+                if gen != play_gen[0]:
+                    return
+                _reset_progress()
+                if _audio_known_broken():
+                    _show_audio_unavailable()
 
+            async def _run_animated(gen: int):
+                """Ein Start-Event; den Fortschritt animiert der Client bis zum Ende selbst."""
+                duration_ms = await _wait_for_duration()
+                if gen != play_gen[0]:
+                    return
+                if duration_ms and not _audio_known_broken():
+                    pos_ms = min(_get_position_ms(), duration_ms)
+                    waveform.animate_from(pos_ms, duration_ms)
+                    _set_time(f"▶ {_fmt(duration_ms)}")
+                    await asyncio.sleep((duration_ms - pos_ms) / 1000)
+                    if gen != play_gen[0]:
+                        return  # Pause/Neustart dazwischen
+                await _finish(gen)
+
+            async def _run_loop(gen: int):
+                """Fallback: Position pollen, nur geänderte Balken/Texte pushen."""
+                duration_ms = await _wait_for_duration()
+                dur_str = _fmt(duration_ms) if duration_ms else "--:--"
+                _set_time(f"0:00 / {dur_str}")
                 play_start = time.monotonic()
 
-                while is_playing[0]:
+                while gen == play_gen[0] and not waveform.detached:
                     if _audio_known_broken():
                         break
-                    pos_ms = None
-                    if get_audio_position_fn and duration_ms:
-                        pos_ms = get_audio_position_fn()
-
-                    if pos_ms is not None and duration_ms:
+                    if duration_ms and get_audio_position_fn:
+                        pos_ms = _get_position_ms()
                         fraction = min(1.0, pos_ms / duration_ms)
-                        filled = int(fraction * len(bars))
-                        for j, bar in enumerate(bars):
-                            bar.bgcolor = "primary" if j < filled else "outline"
-                        time_text.value = f"{_fmt(pos_ms)} / {dur_str}"
-                        try:
-                            waveform_row.update()
-                            time_text.update()
-                        except Exception:
-                            break
+                        waveform.show_fraction(fraction)
+                        _set_time(f"{_fmt(pos_ms)} / {dur_str}")
                         if fraction >= 1.0:
                             break
 
@@ -408,16 +451,32 @@ def question_view(
 
                     await asyncio.sleep(0.1)
 
-                is_playing[0] = False
-                await asyncio.sleep(1.0)
-                _reset_bars()
-                if _audio_known_broken():
-                    try:
-                        audio_status.value = "Audio nur im Static-Build verfügbar"
-                        audio_status.visible = True
-                        audio_status.update()
-                    except Exception:
-                        pass
+                if gen == play_gen[0]:
+                    await _finish(gen)
+
+            def _start_progress():
+                play_gen[0] += 1
+                progress[0] = "playing"
+                runner = _run_loop if _AUDIO_PROGRESS_MODE == "loop" else _run_animated
+                page.run_task(runner, play_gen[0])
+
+            def on_audio_state(audio_state: str):
+                """Zustandswechsel des Audio-Players (vom Router): Pause/Resume/Ende."""
+                if audio_state == "paused" and progress[0] == "playing":
+                    play_gen[0] += 1
+                    progress[0] = "paused"
+                    duration_ms = _get_duration_ms()
+                    pos_ms = _get_position_ms()
+                    if _AUDIO_PROGRESS_MODE != "loop":
+                        waveform.hold_at(pos_ms, duration_ms or 0)
+                    _set_time(f"{_fmt(pos_ms)} / {_fmt(duration_ms) if duration_ms else '--:--'}")
+                elif audio_state == "playing" and progress[0] == "paused":
+                    _start_progress()
+                elif audio_state in ("completed", "stopped") and progress[0] != "idle":
+                    play_gen[0] += 1
+                    page.run_task(_finish, play_gen[0])
+
+            page.session.store.set("_question_audio_state", on_audio_state)
 
             def _show_audio_unavailable():
                 audio_status.value = "Audio nur im Static-Build verfügbar"
@@ -431,9 +490,8 @@ def question_view(
                 if _audio_known_broken():
                     _show_audio_unavailable()
                     return
-                _reset_bars()
-                is_playing[0] = True
-                page.run_task(_run_progress)
+                _reset_progress()
+                _start_progress()
                 if play_question_audio:
                     play_question_audio()
 
@@ -443,9 +501,8 @@ def question_view(
                 if _audio_known_broken():
                     _show_audio_unavailable()
                     return
-                _reset_bars()
-                is_playing[0] = True
-                page.run_task(_run_progress)
+                _reset_progress()
+                _start_progress()
                 if play_question_audio:
                     play_question_audio()
                 if broadcast_question_audio:
@@ -516,6 +573,12 @@ def question_view(
     # -------------------------------------------------------------------------
     # Topbar
     # -------------------------------------------------------------------------
+    def _label_award_buttons():
+        answerer_idx = max(0, min(state.question_answerer_index, len(state.players) - 1))
+        a = state.players[answerer_idx]
+        correct_btn.text = f"✅ Richtig ({a.name})"
+        wrong_btn.text = f"❌ Falsch ({a.name})"
+
     def _build_topbar() -> ft.Control:
         title_str = f"{cat.title} – {tile.value}"
 
@@ -540,10 +603,7 @@ def question_view(
             )
 
         # Non-estimate host
-        answerer_idx = max(0, min(state.question_answerer_index, len(state.players) - 1))
-        a = state.players[answerer_idx]
-        correct_btn.text = f"✅ Richtig ({a.name})"
-        wrong_btn.text = f"❌ Falsch ({a.name})"
+        _label_award_buttons()
 
         right_controls: list[ft.Control] = []
         if caps.can_award_points:
@@ -574,7 +634,6 @@ def question_view(
         MIN_PLAYER_W = 180
         PLAYER_GAP = 8
         my_player_id = page.session.store.get("player_id") or ""
-        answerer_idx = max(0, min(state.question_answerer_index, len(state.players) - 1))
 
         players_content = ft.Column()
 
@@ -589,136 +648,151 @@ def question_view(
             ),
         )
 
-        def build_cards_row(card_width: int) -> ft.Row:
-            cards = []
-            for i, p in enumerate(state.players):
-                body = None
-                footer = None
+        # Karten pro Spieler (card_key) bleiben über Refreshes erhalten; Body und
+        # Footer werden nur neu gebaut, wenn sich ihr Schlüssel ändert.
+        cards: dict[str, PlayerCard] = {}
+        cards_row = ft.Row(controls=[], spacing=PLAYER_GAP, expand=1)
+        players_content.controls = [cards_row]
+        _NONE = ("none",)
+
+        def _revealed_body(answer: str) -> ft.Control:
+            return ft.Container(
+                alignment=ft.Alignment.CENTER,
+                content=ft.Text(answer, size=13, text_align=ft.TextAlign.CENTER),
+                padding=ft.padding.symmetric(horizontal=4),
+            )
+
+        def _host_estimate_body(answer: str, is_locked: bool) -> ft.Control:
+            lock_icon = ft.Icon(
+                ft.Icons.LOCK if is_locked else ft.Icons.LOCK_OPEN,
+                size=14,
+                color="tertiary" if is_locked else "outline",
+            )
+            display = answer if answer else "—"
+            return ft.Row(
+                controls=[
+                    lock_icon,
+                    ft.Text(display, size=12, expand=True,
+                            italic=not is_locked, text_align=ft.TextAlign.CENTER),
+                ],
+                spacing=4,
+                vertical_alignment=ft.CrossAxisAlignment.CENTER,
+            )
+
+        def _host_estimate_footer(i: int, pid: str, is_locked: bool, is_revealed: bool) -> list[ft.Control]:
+            def _reveal_one(s: AppState):
+                if pid not in s.estimates_revealed:
+                    s.estimates_revealed.append(pid)
+                    s.mark_dirty("estimates_revealed")
+
+            def _unlock(s: AppState):
+                if pid in s.estimates_locked:
+                    s.estimates_locked.remove(pid)
+                if pid in s.estimates_revealed:
+                    s.estimates_revealed.remove(pid)
+                s.estimates.pop(pid, None)
+                s.mark_dirty("estimates", "estimates_locked", "estimates_revealed")
+
+            def _award(s: AppState):
+                s.players[i].score += tile.value
+                s.mark_dirty("players")
+                s.question_answerer_index = i
+                _finish_round(s)
+
+            def reveal_one(_):
+                submit(_reveal_one)
+
+            def unlock(_):
+                submit(_unlock)
+
+            def award(_):
+                page.on_keyboard_event = None
+                _play("correct_answer")
+                submit(_award)
+
+            return [
+                ft.TextButton(
+                    "Aufdecken",
+                    on_click=reveal_one,
+                    disabled=not is_locked or is_revealed,
+                    style=ft.ButtonStyle(padding=ft.padding.all(2)),
+                ),
+                ft.IconButton(
+                    ft.Icons.LOCK_OPEN,
+                    tooltip="Entsperren",
+                    on_click=unlock,
+                    icon_size=14,
+                    visible=is_locked,
+                ),
+                ft.TextButton(
+                    "🏆 gewinnt",
+                    on_click=award,
+                    style=ft.ButtonStyle(padding=ft.padding.all(2)),
+                ),
+            ]
+
+        def _buzz_body() -> ft.Control:
+            buzz_btn = ft.FilledButton("Buzz!  [Space]", width=160)
+
+            def send_buzz(_=None):
+                buzz_btn.disabled = True
+                try:
+                    buzz_btn.update()
+                except Exception:
+                    pass
+                lobby_id = page.session.store.get("lobby_id") or ""
+                pid = page.session.store.get("player_id") or ""
+                # Kein lokaler Sound: die Engine spielt "buzz" lobbyweit, sobald entschieden ist
+                send_to_host(page, PlayerBuzz(player_id=pid, t_ns=time.monotonic_ns()).to_message(lobby_id))
+                page.on_keyboard_event = None
+
+            buzz_btn.on_click = send_buzz
+
+            def on_key(e: ft.KeyboardEvent):
+                if e.key == " ":
+                    send_buzz()
+
+            page.on_keyboard_event = on_key
+            return ft.Container(
+                alignment=ft.Alignment.CENTER,
+                content=buzz_btn,
+                padding=ft.padding.symmetric(vertical=8),
+            )
+
+        def sync_cards(card_width: int) -> None:
+            answerer_idx = max(0, min(state.question_answerer_index, len(state.players) - 1))
+
+            def _update_card(_key: str, i: int, p, card: PlayerCard | None) -> PlayerCard:
+                body_key, body = _NONE, None
+                footer_key, footer = _NONE, None
                 highlight = None
 
                 if q_type == "estimate":
                     if role == "player":
                         if p.player_id == my_player_id:
-                            body = _build_estimate_input()
-                        else:
+                            body_key = ("own_estimate", my_player_id in state.estimates_locked)
+                            body = _build_estimate_input
+                        elif p.player_id in state.estimates_revealed:
                             # Andere Karten: aufgedeckte Antwort zeigen falls vorhanden
-                            if p.player_id in state.estimates_revealed:
-                                answer = state.estimates.get(p.player_id, "—")
-                                body = ft.Container(
-                                    alignment=ft.Alignment.CENTER,
-                                    content=ft.Text(answer, size=13, text_align=ft.TextAlign.CENTER),
-                                    padding=ft.padding.symmetric(horizontal=4),
-                                )
+                            answer = state.estimates.get(p.player_id, "—")
+                            body_key = ("revealed", answer)
+                            body = lambda answer=answer: _revealed_body(answer)
                     elif role == "host":
                         answer = state.estimates.get(p.player_id, "")
                         is_locked = p.player_id in state.estimates_locked
                         is_revealed = p.player_id in state.estimates_revealed
-
-                        lock_icon = ft.Icon(
-                            ft.Icons.LOCK if is_locked else ft.Icons.LOCK_OPEN,
-                            size=14,
-                            color="tertiary" if is_locked else "outline",
-                        )
-                        display = answer if answer else "—"
-                        body = ft.Row(
-                            controls=[
-                                lock_icon,
-                                ft.Text(display, size=12, expand=True,
-                                        italic=not is_locked, text_align=ft.TextAlign.CENTER),
-                            ],
-                            spacing=4,
-                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                        )
-
-                        def make_reveal_btn(pid, locked, revealed):
-                            def reveal_one(_):
-                                if pid not in state.estimates_revealed:
-                                    state.estimates_revealed.append(pid)
-                                broadcast_state()
-                                if rebuild_view:
-                                    rebuild_view()
-                            return ft.TextButton(
-                                "Aufdecken",
-                                on_click=reveal_one,
-                                disabled=not locked or revealed,
-                                style=ft.ButtonStyle(padding=ft.padding.all(2)),
-                            )
-
-                        def make_unlock_btn(pid, locked):
-                            def unlock(_):
-                                if pid in state.estimates_locked:
-                                    state.estimates_locked.remove(pid)
-                                if pid in state.estimates_revealed:
-                                    state.estimates_revealed.remove(pid)
-                                if pid in state.estimates:
-                                    del state.estimates[pid]
-                                broadcast_state()
-                                if rebuild_view:
-                                    rebuild_view()
-                            return ft.IconButton(
-                                ft.Icons.LOCK_OPEN,
-                                tooltip="Entsperren",
-                                on_click=unlock,
-                                icon_size=14,
-                                visible=locked,
-                            )
-
-                        def make_award_btn(_pi=i):
-                            def award(_):
-                                state.players[_pi].score += tile.value
-                                state.question_answerer_index = _pi
-                                _play("correct_answer")
-                                finish_round_and_back()
-                                rerender()
-                            return ft.TextButton(
-                                "🏆 gewinnt",
-                                on_click=award,
-                                style=ft.ButtonStyle(padding=ft.padding.all(2)),
-                            )
-
-                        footer = [
-                            make_reveal_btn(p.player_id, is_locked, is_revealed),
-                            make_unlock_btn(p.player_id, is_locked),
-                            make_award_btn(),
-                        ]
+                        body_key = ("estimate", answer, is_locked)
+                        body = lambda answer=answer, is_locked=is_locked: _host_estimate_body(answer, is_locked)
+                        footer_key = ("estimate", i, p.player_id, is_locked, is_revealed)
+                        footer = lambda i=i, pid=p.player_id, lk=is_locked, rv=is_revealed: \
+                            _host_estimate_footer(i, pid, lk, rv)
                 else:
                     # Non-estimate: Buzz-Button für eigene Karte des Spielers
                     if role == "player" and p.player_id == my_player_id:
-                        my_idx = next(
-                            (j for j, pl in enumerate(state.players) if pl.player_id == my_player_id), -1
-                        )
-                        if state.buzzer_open and my_idx != answerer_idx:
-                            buzz_btn = ft.FilledButton("Buzz!  [Space]", width=160)
-
-                            def send_buzz(_=None, _btn=buzz_btn):
-                                _btn.disabled = True
-                                try:
-                                    _btn.update()
-                                except Exception:
-                                    pass
-                                lobby_id = page.session.store.get("lobby_id") or ""
-                                pid = page.session.store.get("player_id") or ""
-                                msg = json.dumps({
-                                    "type": "player_buzz",
-                                    "lobby_id": lobby_id,
-                                    "player_id": pid,
-                                })
-                                _play("buzz")
-                                page.pubsub.send_all(msg)
-                                page.on_keyboard_event = None
-
-                            buzz_btn.on_click = send_buzz
-
-                            def on_key(e: ft.KeyboardEvent):
-                                if e.key == " ":
-                                    send_buzz()
-
-                            page.on_keyboard_event = on_key
-                            body = ft.Container(
-                                alignment=ft.Alignment.CENTER,
-                                content=buzz_btn,
-                                padding=ft.padding.symmetric(vertical=8),
-                            )
+                        if state.buzzer_open and i != answerer_idx:
+                            # Schlüssel mit Antworter: neue Buzz-Runde → frischer Button
+                            body_key = ("buzz", answerer_idx)
+                            body = _buzz_body
                         else:
                             page.on_keyboard_event = None
 
@@ -726,27 +800,32 @@ def question_view(
                     if i == answerer_idx:
                         highlight = "primary"
 
-                card = PlayerCard(
-                    name=p.name,
-                    score=p.score,
-                    is_active=(i == answerer_idx) if q_type != "estimate" else p.is_turn,
-                    body_content=body,
-                    footer_controls=footer,
-                    highlight_color=highlight,
-                )
-                card.width = card_width
-                card.height = round(card_width * 9 / 16)
-                cards.append(card)
+                is_active = (i == answerer_idx) if q_type != "estimate" else p.is_turn
+                if card is None:
+                    card = PlayerCard(name=p.name, score=p.score, is_active=is_active,
+                                      highlight_color=highlight)
+                else:
+                    card.set_name(p.name)
+                    card.set_score(p.score)
+                    card.set_active(is_active)
+                    card.set_highlight(highlight)
+                card.set_body(body, key=body_key)
+                card.set_footer(footer, key=footer_key)
+                return card
 
-            return ft.Row(controls=cards, spacing=PLAYER_GAP, expand=1)
+            sync_card_row(cards_row, cards, state.players, card_width, _update_card)
 
-        def recompute(viewport_w: int, pad: int):
+        shown = [None]  # (card_w, Spielerzahl) der gebauten Karten
+
+        def recompute(viewport_w: int, pad: int, force: bool = False) -> bool:
             state.ensure_players()
             n = max(1, len(state.players))
-            usable = viewport_w - 2 * pad - 2 * 8 - 2 - 2
-            gaps = (n - 1) * PLAYER_GAP
-            card_w = max(MIN_PLAYER_W, math.floor((usable - gaps) / n))
-            players_content.controls = [build_cards_row(card_w)]
+            card_w = card_width(viewport_w, pad, n, MIN_PLAYER_W, PLAYER_GAP)
+            if not force and shown[0] == (card_w, n):
+                return False
+            shown[0] = (card_w, n)
+            sync_cards(card_w)
+            return True
 
         recompute(page.width or 1200, LAYOUT.page_padding)
         outer.data = {"recompute": recompute}
@@ -789,13 +868,26 @@ def question_view(
 
     player_row = _build_player_cards_row()
 
-    def on_resize(_):
-        fn = (player_row.data or {}).get("recompute")
-        if callable(fn):
-            fn(page.width or 1200, LAYOUT.page_padding)
-        page.update()
-
-    page.on_resize = on_resize
+    coordinator = resize_coordinator(page)
+    coordinator.set_targets(player_row.data["recompute"])
+    page.on_resize = coordinator.on_resize
+
+    board = state.board
+
+    def apply(delta) -> bool:
+        """Zieht nur die betroffenen Teile nach; False → Router baut den Screen neu
+        (andere Frage, anderes Board oder anderes Asset)."""
+        if state.board is not board or tuple(state.selected or ()) != (cat_i, tile_i):
+            return False
+        if "question_asset_index" in delta:
+            return False
+        if "question_answer_revealed" in delta:
+            refresh_answer()
+        if delta & _PLAYER_ROW_FIELDS:
+            if role == "host" and q_type != "estimate":
+                _label_award_buttons()
+            player_row.data["recompute"](page.width or 1200, LAYOUT.page_padding, force=True)
+        return True
 
     return ft.Column(
         controls=[
@@ -807,4 +899,5 @@ def question_view(
         ],
         expand=True,
         spacing=0,
+        data={"apply": apply},
     )
@@ -1,30 +1,40 @@
 import asyncio
-import json
+import logging
+import os
 import secrets
-import threading
-import time
 import uuid
 from pathlib import Path
 import flet as ft
+from flet.pubsub.pubsub_client import PubSubClient
 
 from app_state import AppState, compute_capabilities
-from lobby_store import get_lobby, update_lobby
+from clock_sync import PING_INTERVAL_S, measure_rtt, record_rtt
+from coalesce import Coalescer
+from game_engine import ESTIMATE, GameEngine, get_engine, loop_runner, start_engine
+from lobby_messages import Dispatcher, LobbyStateMessage, PlayerJoin, PlayQuestionAudio, PlaySound
+from lobby_pubsub import SESSION_KEY, LobbyChannel, decode
+from lobby_store import get_lobby
 from ui.layout import LAYOUT
+from ui.resize import resize_coordinator
+from views.audio_service import audio_service
 
-from board_loader import list_boards
+import async_io
 from views.menu import menu_view
-from views.board_editor import board_editor_view, board_setup_view
+from views.board_editor import board_editor_view, board_setup_view, load_editor_data
 from views.topbar import topbar_view
 from views.host_setup import host_setup_view
 from views.join import join_view
 from views.lobby import lobby_view
 from views.board import board_view
-from views.question import question_view
+from views.question import cancel_pending_estimate, question_view
 
 
+_log = logging.getLogger(__name__)
+
 _SCREEN_TO_ROUTE = {"lobby": "lobby", "board": "game", "question": "question"}
 _ROUTE_TO_SCREEN = {"lobby": "lobby", "game": "board", "question": "question"}
-_buzz_lock = threading.Lock()
+# Host: eingehende Live-Schätzungen werden pro Fenster zu einem Rebuild zusammengefasst
+_ESTIMATE_RENDER_WINDOW_S = float(os.environ.get("JEOPARDY_ESTIMATE_RENDER_MS", "50")) / 1000
 
 def push_route(page: ft.Page, route: str):
     async def _do():
@@ -64,218 +74,114 @@ def setup_router(page: ft.Page, state: AppState):
     _ensure_defaults(page)
 
     # Audio via flet_audio (funktioniert nur im flet build web, nicht im Dev-Server).
-    _assets_dir = Path(__file__).parent.parent / "assets"
-    _sound_files = {"buzz": "buzz.mp3", "correct_answer": "correct_answer.mp3", "wrong_answer": "wrong_answer.mp3"}
-    _sounds = {}
-    _q_audio = [None]              # aktiver FletAudio-Control für Frage-Audio
-    _q_audio_duration = [None]    # gecachte Duration als int (ms) via on_duration_change
-    _q_audio_position = [None]    # gecachte Position als (int ms, float monotonic_time) via on_position_change
-    _pending_audio_src = [None]   # vorgemerkter Src, wird nach views.append() angewendet
-    _flet_audio_available = [False]
-    _flet_audio_works = [None]    # None=ungetestet, True=funktioniert, False=kein Flutter-Build
-    _flet_audio_cls = None
-    _release_mode_stop = None
-    try:
-        from flet_audio import Audio as _FA, ReleaseMode as _RM
-        _flet_audio_cls = _FA
-        _release_mode_stop = _RM.STOP
-        _flet_audio_available[0] = True
-        for name, filename in _sound_files.items():
-            if (_assets_dir / filename).exists():
-                audio = _flet_audio_cls(src=f"assets/{filename}", autoplay=False, release_mode=_release_mode_stop)
-                page.services.append(audio)
-                _sounds[name] = audio
-        if _sounds:
-            page.update()
-    except Exception:
-        pass  # flet_audio nicht verfügbar (Dev-Modus)
+    # Ein Service pro Session: Effekt-Player und ein Frage-Player bleiben gemountet.
+    audio = audio_service(page, Path(__file__).parent.parent / "assets")
+    audio.load_sounds()
+    _last_version = [None]        # zuletzt angewendete Lobby-Version (Client, Gap-Erkennung)
+    _ping_running = [False]       # RTT-Messung der Spieler-Session läuft
+    _screen_ctrl = [None]         # zuletzt gebauter Screen-Control (Ziel für data["apply"])
 
-    def play_sound(name: str):
-        audio = _sounds.get(name)
-        if not (audio and page.session and page.session.connection):
-            return
-        async def _play_safe():
-            try:
-                await audio.play()
-            except Exception:
-                pass
-        page.run_task(_play_safe)
+    play_sound = audio.play_sound
 
     def broadcast_sound(name: str):
         """Host sendet Sound-Event an alle Clients."""
         lobby_id = _get_lobby_id(page)
         if not lobby_id:
             return
-        page.pubsub.send_all(json.dumps({
-            "type": "play_sound",
-            "lobby_id": lobby_id,
-            "name": name,
-        }))
-
-    def set_question_audio_src(src: str):
-        """Merkt Audio-Src vor; _apply_pending_audio() führt die eigentliche Arbeit durch."""
-        _pending_audio_src[0] = src
-
-    def _apply_pending_audio():
-        """Muss nach page.views.append() aufgerufen werden, damit page.services erreichbar ist."""
-        src = _pending_audio_src[0]
-        _pending_audio_src[0] = None
-        if not src or not _flet_audio_available[0]:
-            return
-        if _q_audio[0] and _q_audio[0] in page.services:
-            page.services.remove(_q_audio[0])
-        fa = _flet_audio_cls(src=src, autoplay=False, release_mode=_release_mode_stop)
-
-        # Event-basierte Duration- und Positions-Aktualisierung (zuverlässiger als Polling)
-        def _on_duration_change(e):
-            try:
-                ms = e.duration.in_milliseconds
-                _q_audio_duration[0] = ms
-                _flet_audio_works[0] = True
-            except Exception as ex:
-                print(f"[AUDIO] on_duration_change error: {ex}")
-
-        def _on_position_change(e):
-            try:
-                _q_audio_position[0] = (e.position, time.monotonic())
-            except Exception:
-                pass
-
-        fa.on_duration_change = _on_duration_change
-        fa.on_position_change = _on_position_change
-
-        _q_audio_duration[0] = None
-        _q_audio_position[0] = None
-        page.services.append(fa)
-        _q_audio[0] = fa
-        _flet_audio_works[0] = None  # wird durch on_duration_change oder play()-Timeout gesetzt
-        # Lautstärke wird in play_question_audio() direkt vor fa.play() angewendet,
-        # wenn Flutter das Control bereits kennt (nach page.update()).
-
-    def play_question_audio():
-        """Spielt das geladene Frage-Audio ab."""
-        if not _q_audio[0]:
-            return
-        # Position auf (0, jetzt) setzen → Interpolation startet sofort ab 0ms
-        _q_audio_position[0] = (0, time.monotonic())
-        fa = _q_audio[0]
-
-        async def _do_play():
-            if not (page.session and page.session.connection):
-                return
-            # Lautstärke direkt vor play() setzen: Flutter kennt das Control bereits,
-            # da page.update() bei der Fragenanzeige schon gelaufen ist.
-            saved_vol = page.session.store.get("_audio_volume")
-            if saved_vol is not None:
-                try:
-                    fa.volume = max(0.0, min(1.0, float(saved_vol)))
-                    fa.update()
-                except (TypeError, ValueError):
-                    pass
-            try:
-                await fa.play()
-                if _flet_audio_works[0] is None:
-                    _flet_audio_works[0] = True
-            except Exception:
-                _flet_audio_works[0] = False
+        channel.send(PlaySound(name=name).to_message(lobby_id))
 
-        page.run_task(_do_play)
+    set_question_audio_src = audio.set_question_src
+    _apply_pending_audio = audio.apply_pending
+    play_question_audio = audio.play_question
 
     def broadcast_question_audio():
         """Sendet Play-Event für Frage-Audio an alle Clients."""
         lobby_id = _get_lobby_id(page)
         if not lobby_id:
             return
-        page.pubsub.send_all(json.dumps({
-            "type": "play_question_audio",
-            "lobby_id": lobby_id,
-        }))
-
-    def get_audio_position():
-        """Gibt die interpolierte Abspielposition zurück (int ms).
-        Interpoliert zwischen on_position_change-Events; gecappt auf 900ms um
-        Overshoot und Rücksprünge beim nächsten Event zu vermeiden."""
-        data = _q_audio_position[0]
-        if data is None:
-            return None
-        pos_ms, t = data
-        # Cap: nie mehr als 900ms über den letzten Event-Wert hinaus interpolieren
-        elapsed_ms = min(int((time.monotonic() - t) * 1000), 900)
-        return pos_ms + elapsed_ms
-
-    def set_audio_volume(value: float):
-        """Setzt die lokale Lautstärke (0.0–1.0)."""
-        clamped = max(0.0, min(1.0, value))
-        if _q_audio[0]:
-            _q_audio[0].volume = clamped
-            _q_audio[0].update()
-
-    def broadcast_state(include_board: bool = False):
-        role = _get_role(page)
-        if role != "host":
-            return
+        channel.send(PlayQuestionAudio().to_message(lobby_id))
 
-        lobby_id = _get_lobby_id(page)
-        # Lobby-Store bekommt immer den vollen Snapshot (Safety-Net für Reconnects)
-        full_snap = state.snapshot(include_board=True)
-        lobby = update_lobby(lobby_id, full_snap)
-
-        send_snap = full_snap if include_board else state.snapshot(include_board=False)
-        msg = {
-            "type": "lobby_state",
-            "lobby_id": lobby_id,
-            "version": lobby.version,
-            "data": send_snap,
-        }
-        page.pubsub.send_all(json.dumps(msg))
+    def submit(command, *args, include_board: bool = False):
+        """Host-Aktion: ``command(state, *args)`` läuft im Actor der Lobby-Engine;
+        Broadcast und Rebuild der Ansicht folgen, wenn die Engine sie gemeldet hat."""
+        if _get_role(page) != "host":
+            return
+        engine = get_engine(_get_lobby_id(page))
+        if engine is not None:
+            engine.submit(command, *args, include_board=include_board)
+
+    def _resync_from_store(lobby_id: str) -> bool:
+        """Voller Resync aus dem Lobby-Store (Join, Reconnect, verpasstes Delta)."""
+        lobby = get_lobby(lobby_id)
+        if not lobby.data:
+            return False
+        state.apply_snapshot(lobby.snapshot())
+        _last_version[0] = lobby.version
+        return True
 
     def rerender():
         push_route(page, _route_for_screen(page, state.screen))
 
-    def rebuild_current_view():
-        """Baut den aktuellen View direkt neu – ohne Route-Wechsel.
-        Nötig wenn die Route gleich bleibt (z.B. question_asset_index ändern)."""
-        async def _do():
-            page.views.clear()
-            page.views.append(
-                ft.View(route=page.route, controls=[_build_screen_control()], padding=LAYOUT.page_padding)
-            )
-            _apply_pending_audio()
+    def _show_screen(route: str):
+        """Baut den Screen komplett neu (Screen-/Routenwechsel)."""
+        ctrl = _build_screen_control()
+        state.take_view_delta()  # frisch gebaut: alles aktuell
+        _screen_ctrl[0] = ctrl
+        page.views.clear()
+        page.views.append(ft.View(route=route, controls=[ctrl], padding=LAYOUT.page_padding))
+        _apply_pending_audio()
+        page.update()
+
+    def _refresh_screen():
+        """Zieht den angezeigten Screen nach einer State-Änderung nach.
+
+        Statt page.views.clear() + Neuaufbau (Flet serialisiert dann den ganzen Baum)
+        bekommt der Screen das Delta über data["apply"] und ändert nur die
+        betroffenen Controls. Gibt apply False zurück (oder zeigt die Seite gerade
+        einen anderen Screen), wird wie bisher neu gebaut."""
+        delta = state.take_view_delta()
+        ctrl = _screen_ctrl[0]
+        shown = page.views[-1].controls if page.views else []
+        apply = (getattr(ctrl, "data", None) or {}).get("apply") if ctrl is not None else None
+        if shown and shown[0] is ctrl and callable(apply) and apply(delta):
             page.update()
-        if page.session and page.session.connection:
-            page.run_task(_do)
+            return
+        _show_screen(page.route)
 
     def _build_screen_control() -> ft.Control:
         page.on_keyboard_event = None  # Cleanup bei jedem Screen-Wechsel
+        page.on_resize = None
+        resize_coordinator(page).set_targets()
         role = _get_role(page)
         caps = compute_capabilities(state, role)
+        if state.screen != "question":
+            cancel_pending_estimate(page)  # Schätzung der verlassenen Frage nicht mehr senden
 
         if state.screen == "lobby":
-            return lobby_view(page, state, rerender, broadcast_state=broadcast_state)
+            return lobby_view(page, state, rerender, submit=submit)
 
         if state.screen == "board":
             return board_view(
                 page, state, rerender,
                 caps=caps,
-                broadcast_state=broadcast_state,
+                submit=submit,
             )
 
         if state.screen == "question":
             return question_view(
                 page, state, rerender,
                 caps=caps,
-                broadcast_state=broadcast_state,
+                submit=submit,
                 play_sound=play_sound,
                 broadcast_sound=broadcast_sound,
                 play_question_audio=play_question_audio,
                 broadcast_question_audio=broadcast_question_audio,
                 set_question_audio_src=set_question_audio_src,
-                flet_audio_available=_flet_audio_available[0],
-                flet_audio_works_ref=lambda: _flet_audio_works[0],
-                get_audio_duration_fn=lambda: _q_audio_duration[0],
-                get_audio_position_fn=get_audio_position,
-                set_audio_volume_fn=set_audio_volume,
-                rebuild_view=rebuild_current_view,
+                flet_audio_available=audio.available,
+                flet_audio_works_ref=lambda: audio.works,
+                get_audio_duration_fn=lambda: audio.duration_ms,
+                get_audio_position_fn=audio.position_ms,
+                set_audio_volume_fn=audio.set_volume,
             )
 
         return ft.Text(f"Unbekannter Screen: {state.screen}")
@@ -292,22 +198,26 @@ def setup_router(page: ft.Page, state: AppState):
 
         return menu_view(on_host=on_host, on_join=on_join, on_create=on_create)
 
-    def _build_host_setup_control() -> ft.Control:
+    def _build_host_setup_control(boards: list[tuple[str, str, bool]]) -> ft.Control:
         def on_create(settings: dict):
             s = _store(page)
+            prev = get_engine(s.get("lobby_id")) if _get_role(page) == "host" else None
+            if prev is not None:
+                # Alte Lobby sauber beenden: "menu" an ihre Spieler, danach stoppt die Engine.
+                # Vorher abmelden, sonst landet dieser Broadcast in der neuen Host-Ansicht.
+                prev.remove_listener(_on_engine_event)
+                prev.close()
             s.set("role", "host")
             s.set("lobby_id", secrets.token_hex(4).upper())
             s.set("board_id", settings.get("board_id", ""))
-            state.players.clear()
-            state.board = None
-            state.screen = "lobby"
-            state.max_players = settings.get("max_players", 4)
+            channel.join(s.get("lobby_id"))
+            _attach_engine(s.get("lobby_id"), AppState(max_players=settings.get("max_players", 4)))
             push_route(page, "/host/lobby")
 
         def on_back():
             push_route(page, "/menu")
 
-        return host_setup_view(on_create=on_create, on_back=on_back)
+        return host_setup_view(boards, on_create=on_create, on_back=on_back)
 
     def _build_join_control() -> ft.Control:
         def on_join(code: str, name: str):
@@ -315,23 +225,18 @@ def setup_router(page: ft.Page, state: AppState):
             s.set("role", "player")
             s.set("lobby_id", code)
             s.set("player_name", name)
+            channel.join(code)
 
             # Aktuellen Lobby-State laden, damit Player sofort synced ist
+            _last_version[0] = None
             try:
-                lobby = get_lobby(code)
-                if lobby.data:
-                    state.apply_snapshot(lobby.data)
+                _resync_from_store(code)
             except Exception:
                 pass
 
             # Host über Beitritt informieren
-            msg = json.dumps({
-                "type": "player_join",
-                "lobby_id": code,
-                "player_id": s.get("player_id"),
-                "name": name,
-            })
-            page.pubsub.send_all(msg)
+            channel.send_to_host(PlayerJoin(player_id=s.get("player_id"), name=name).to_message(code))
+            _start_ping()
 
             push_route(page, "/player/lobby")
 
@@ -340,8 +245,8 @@ def setup_router(page: ft.Page, state: AppState):
 
         return join_view(on_join=on_join, on_back=on_back)
 
-    def _build_board_overview() -> ft.Control:
-        boards = list_boards()  # [(board_id, title, wip), ...]
+    def _build_board_overview(boards: list[tuple[str, str, bool]]) -> ft.Control:
+        """``boards``: [(board_id, title, wip), ...] aus list_boards()."""
 
         def _edit_row(board_id: str, title: str, wip: bool) -> ft.Control:
             badge = ft.Container(
@@ -385,7 +290,7 @@ def setup_router(page: ft.Page, state: AppState):
             tight=True,
         )
 
-    def route_change(_):
+    async def route_change(_):
         route = page.route or "/"
 
         if route == "/":
@@ -398,6 +303,7 @@ def setup_router(page: ft.Page, state: AppState):
 
         # Flat routes ohne Rollen-Präfix
         if len(parts) == 1 and parts[0] == "menu":
+            _report_audio()  # zurück im Menü: Spiel ist vorbei
             page.views.clear()
             page.views.append(
                 ft.View(route=route, controls=[_build_menu_control()], padding=LAYOUT.page_padding)
@@ -406,9 +312,12 @@ def setup_router(page: ft.Page, state: AppState):
             return
 
         if len(parts) == 1 and parts[0] == "host-setup":
+            boards = await async_io.list_boards()
+            if page.route != route:
+                return  # während des Ladens weiternavigiert
             page.views.clear()
             page.views.append(
-                ft.View(route=route, controls=[_build_host_setup_control()], padding=LAYOUT.page_padding)
+                ft.View(route=route, controls=[_build_host_setup_control(boards)], padding=LAYOUT.page_padding)
             )
             page.update()
             return
@@ -419,7 +328,11 @@ def setup_router(page: ft.Page, state: AppState):
             is_new = bool(qd.get("new"))
             if board_id:
                 # Schritt 2: bestehendes Board bearbeiten
-                ctrl = board_editor_view(page, board_id=board_id, on_back=lambda: push_route(page, "/create"))
+                loaded = await load_editor_data(board_id)
+                if page.route != route:
+                    return
+                ctrl = board_editor_view(page, board_id=board_id, loaded=loaded,
+                                         on_back=lambda: push_route(page, "/create"))
             elif is_new:
                 # Schritt 1: neues Board anlegen
                 ctrl = board_setup_view(
@@ -429,7 +342,10 @@ def setup_router(page: ft.Page, state: AppState):
                 )
             else:
                 # Übersichtsseite
-                ctrl = _build_board_overview()
+                boards = await async_io.list_boards()
+                if page.route != route:
+                    return
+                ctrl = _build_board_overview(boards)
             page.views.clear()
             page.views.append(
                 ft.View(
@@ -465,12 +381,7 @@ def setup_router(page: ft.Page, state: AppState):
             push_route(page, _route_for_screen(page, "lobby"))
             return
 
-        page.views.clear()
-        page.views.append(
-            ft.View(route=route, controls=[_build_screen_control()], padding=LAYOUT.page_padding)
-        )
-        _apply_pending_audio()
-        page.update()
+        _show_screen(route)
 
     def view_pop(e: ft.ViewPopEvent):
         if page.views:
@@ -480,159 +391,172 @@ def setup_router(page: ft.Page, state: AppState):
         else:
             push_route(page, _route_for_screen(page, "lobby"))
 
-    def _on_pubsub(message: str):
-        try:
-            msg = json.loads(message)
-        except Exception:
-            return
-
-        msg_type = msg.get("type")
-        my_lobby = _get_lobby_id(page)
-
-        if msg.get("lobby_id") != my_lobby:
+    async def _apply_and_refresh(_=None):
+        # Host hat die Lobby geschlossen → Player ins Menü
+        if state.screen == "menu":
+            channel.leave()
+            await page.push_route("/menu")
             return
 
-        if msg_type == "play_sound":
-            play_sound(msg.get("name", ""))
-            return
+        target = _route_for_screen(page, state.screen)
 
-        if msg_type == "play_question_audio":
-            play_question_audio()
-            fn = page.session.store.get("_trigger_question_audio")
-            if callable(fn):
-                fn()
+        # Wenn Screen/Route gewechselt hat: normal navigieren (triggert route_change -> rebuild)
+        if page.route != target:
+            await page.push_route(target)
             return
 
-        if msg_type in ("player_join", "player_leave") and _get_role(page) == "host":
-            if msg_type == "player_join":
-                state.add_player(msg.get("player_id", ""), msg.get("name", "Spieler"))
-                broadcast_state(include_board=True)  # neuer Spieler braucht volles Board
-            else:
-                state.remove_player(msg.get("player_id", ""))
-                broadcast_state()
+        # Route ist gleich -> Screen in-place nachziehen, sonst sieht der Client nichts
+        _refresh_screen()
 
-            async def _refresh_lobby():
-                page.views.clear()
-                page.views.append(
-                    ft.View(route=page.route, controls=[_build_screen_control()], padding=LAYOUT.page_padding)
-                )
-                _apply_pending_audio()
-                page.update()
+    _client_refresh = Coalescer(page.run_task, _apply_and_refresh)
 
-            if page.session and page.session.connection:
-                page.run_task(_refresh_lobby)
+    async def _rebuild_view(_=None):
+        """Zieht den aktuellen Screen nach (Host nach Änderungen der Engine)."""
+        _estimate_refresh.cancel()  # der Refresh enthält bereits alle Schätzungen
+        target = _route_for_screen(page, state.screen)
+        if page.route != target:
+            # Host-Kommando hat den Screen gewechselt (z.B. Tile gewählt)
+            await page.push_route(target)
             return
+        _refresh_screen()
 
-        if msg_type == "player_buzz" and _get_role(page) == "host":
-            with _buzz_lock:
-                if state.buzzer_open:
-                    player_id = msg.get("player_id", "")
-                    idx = next((i for i, p in enumerate(state.players) if p.player_id == player_id), -1)
-                    if idx >= 0 and idx not in state.buzzed_queue:
-                        state.buzzed_queue.append(idx)
-                    if state.buzzed_queue:
-                        state.set_answerer(state.buzzed_queue[0])
-                        state.buzzer_open = False
-                    broadcast_state()
-
-                async def _refresh_question():
-                    play_sound("buzz")
-                    page.views.clear()
-                    page.views.append(
-                        ft.View(route=page.route, controls=[_build_screen_control()], padding=LAYOUT.page_padding)
-                    )
-                    _apply_pending_audio()
-                    page.update()
-
-                if page.session and page.session.connection:
-                    page.run_task(_refresh_question)
-            return
+    _host_refresh = Coalescer(page.run_task, _rebuild_view)
+    _estimate_refresh = Coalescer(page.run_task, _rebuild_view, _ESTIMATE_RENDER_WINDOW_S)
 
-        if msg_type == "player_estimate" and _get_role(page) == "host":
-            player_id = msg.get("player_id", "")
-            answer = msg.get("answer", "")
-            # Nur updaten wenn noch nicht eingeloggt (Lock bleibt erhalten)
-            if player_id and player_id not in state.estimates_locked:
-                state.estimates[player_id] = answer
-
-            async def _refresh_live():
-                page.views.clear()
-                page.views.append(
-                    ft.View(route=page.route, controls=[_build_screen_control()], padding=LAYOUT.page_padding)
-                )
-                _apply_pending_audio()
-                page.update()
+    def _request_host_refresh():
+        if page.session and page.session.connection:
+            _host_refresh.request()
 
-            if page.session and page.session.connection:
-                page.run_task(_refresh_live)
+    def _on_engine_event(event: str, snap: dict):
+        """Engine hat ihren State geändert → Kopie der Host-Session nachführen, Ansicht nachziehen."""
+        if not (page.session and page.session.connection):
             return
-
-        if msg_type == "player_estimate_lock" and _get_role(page) == "host":
-            player_id = msg.get("player_id", "")
-            answer = msg.get("answer", "")
-            if player_id:
-                state.estimates[player_id] = answer
-                if player_id not in state.estimates_locked:
-                    state.estimates_locked.append(player_id)
-            broadcast_state()
-
-            async def _refresh_lock():
-                page.views.clear()
-                page.views.append(
-                    ft.View(route=page.route, controls=[_build_screen_control()], padding=LAYOUT.page_padding)
-                )
-                _apply_pending_audio()
-                page.update()
-
-            if page.session and page.session.connection:
-                page.run_task(_refresh_lock)
+        if not state.apply_snapshot(snap):
+            # Neues Board: board_progress passt nicht zur lokalen Kopie → voller Snapshot
+            engine = get_engine(_get_lobby_id(page))
+            if engine is not None:
+                state.apply_snapshot(engine.state.snapshot(include_board=True))
+        if event == ESTIMATE:
+            # Tippen mehrerer Spieler → ein Rebuild pro Fenster statt einer pro Tastendruck
+            _estimate_refresh.request()
             return
+        # BUZZ: den Sound schickt die Engine lobbyweit (PlaySound), hier nur die Ansicht
+        _host_refresh.request()
+
+    def _attach_engine(lobby_id: str, initial: AppState | None = None) -> GameEngine:
+        """Startet (oder übernimmt) die Engine der Lobby. Die Engine besitzt ihren
+        eigenen State (``initial``, sonst aus dem Lobby-Store wiederhergestellt);
+        die Host-Session rendert eine Kopie, die sie über den Listener nachführt."""
+        if initial is None and get_engine(lobby_id) is None:
+            initial = AppState()
+            lobby = get_lobby(lobby_id)
+            if lobby.data:
+                initial.apply_snapshot(lobby.snapshot())
+        conn = page.session.connection
+        engine = start_engine(lobby_id, initial or AppState(),
+                              PubSubClient(conn.pubsubhub, f"engine:{lobby_id}"), loop_runner(conn.loop))
+        state.apply_snapshot(engine.state.snapshot(include_board=True))
+        engine.add_listener(_on_engine_event)
+        return engine
+
+    # Dispatch-Tabelle (type, Rolle) -> Handler
+    dispatcher = Dispatcher()
+
+    @dispatcher.on(PlaySound)
+    def _on_play_sound(msg: PlaySound):
+        play_sound(msg.name)
+
+    @dispatcher.on(PlayQuestionAudio)
+    def _on_play_question_audio(_msg: PlayQuestionAudio):
+        play_question_audio()
+        fn = page.session.store.get("_trigger_question_audio")
+        if callable(fn):
+            fn()
+
+    @dispatcher.on(LobbyStateMessage, roles=("player",))
+    def _on_lobby_state(msg: LobbyStateMessage):
+        my_lobby = _get_lobby_id(page)
+        version = msg.version
+        last = _last_version[0]
+        if last is not None and isinstance(version, int) and version == last:
+            return  # bereits im Store-Snapshot enthalten
+
+        if last is None or version != last + 1:
+            # Delta verpasst, Version zurückgesetzt (Lobby neu angelegt, siehe
+            # lobby_store._cleanup_old_lobbies) oder noch nie synchronisiert → voller Resync
+            _resync_from_store(my_lobby)
+        elif state.apply_snapshot(msg.data or {}):
+            _last_version[0] = version
+        else:
+            # Board-Fortschritt passt nicht zum lokalen Board → volles Board aus dem Lobby-Store
+            _resync_from_store(my_lobby)
 
-        if msg_type != "lobby_state":
-            return
+        # Mehrere State-Nachrichten pro Loop-Iteration → nur ein Rebuild
+        if page.session and page.session.connection:
+            _client_refresh.request()
 
-        if _get_role(page) == "host":
+    def _on_pubsub(message):
+        # Envelope ist bereits dekodiert und wird von allen Sessions geteilt (read-only)
+        env = decode(message)
+        if env is None or env.lobby_id != _get_lobby_id(page):
             return
+        dispatcher.dispatch(env.type, env.payload, _get_role(page))
 
-        data = msg.get("data") or {}
-        state.apply_snapshot(data)
-
-        async def _apply_and_refresh():
-            # Host hat die Lobby geschlossen → Player ins Menü
-            if state.screen == "menu":
-                await page.push_route("/menu")
-                return
-
-            target = _route_for_screen(page, state.screen)
-
-            # Wenn Screen/Route gewechselt hat: normal navigieren (triggert route_change -> rebuild)
-            if page.route != target:
-                await page.push_route(target)
-                return
-
-            # Route ist gleich -> trotzdem UI neu bauen, sonst sieht der Client nichts
-            page.views.clear()
-            page.views.append(
-                ft.View(route=page.route, controls=[_build_screen_control()], padding=LAYOUT.page_padding)
-            )
-            _apply_pending_audio()
-            page.update()
-
-        if page.session and page.session.connection:
-            page.run_task(_apply_and_refresh)
-
-    page.pubsub.subscribe(_on_pubsub)
+    async def _ping_loop():
+        """Spieler-Session: misst regelmäßig die RTT zum Client für die Buzz-Korrektur,
+        solange die Session in einer Lobby ist (Lobby verlassen, Session zu → Ende)."""
+        try:
+            while page.session and page.session.connection and _get_role(page) == "player" \
+                    and channel.lobby_id:
+                lobby_id = channel.lobby_id
+                try:
+                    rtt = await measure_rtt(page.get_device_info)
+                    if channel.lobby_id == lobby_id:  # während der Messung verlassen → verwerfen
+                        record_rtt(_store(page).get("player_id") or "", rtt, lobby_id)
+                except Exception:
+                    pass  # Timeout/Verbindungsabbruch: Sample verwerfen
+                await asyncio.sleep(PING_INTERVAL_S)
+        finally:
+            _ping_running[0] = False
+
+    def _start_ping():
+        if not _ping_running[0] and page.session and page.session.connection:
+            _ping_running[0] = True
+            page.run_task(_ping_loop)
+
+    # Nur das Topic der eigenen Lobby abonnieren (statt send_all an alle Sessions)
+    channel = LobbyChannel(page.pubsub, _on_pubsub)
+    _store(page).set(SESSION_KEY, channel)
+
+    def _report_audio():
+        """Audio-Controls pro Spiel ins Debug-Log (einmal, wenn das Spiel endet)."""
+        report = audio.end_game()
+        if report:
+            _log.debug("Audio, Session %s: %s", _store(page).get("player_id"), report)
+
+    def _on_close(_):
+        engine = get_engine(_get_lobby_id(page))
+        if engine is not None:
+            engine.remove_listener(_on_engine_event)
+        channel.leave()
+        _report_audio()
 
     page.on_route_change = route_change
     page.on_view_pop = view_pop
+    page.on_close = _on_close
 
     # Beim Join direkt aktuellen Lobby-State ziehen (nur wenn lobby_id bereits gesetzt)
     lobby_id = _get_lobby_id(page)
     if lobby_id:
-        try:
-            lobby = get_lobby(lobby_id)
-            if lobby.data:
-                state.apply_snapshot(lobby.data)
-                push_route(page, _route_for_screen(page, state.screen))
-        except Exception:
-            pass
+        channel.join(lobby_id)
+        if _get_role(page) == "host":
+            # Host-Kopie kommt von der Engine (aktueller als der Lobby-Store)
+            _attach_engine(lobby_id)
+            push_route(page, _route_for_screen(page, state.screen))
+        else:
+            _start_ping()
+            try:
+                if _resync_from_store(lobby_id):
+                    push_route(page, _route_for_screen(page, state.screen))
+            except Exception:
+                pass
@@ -0,0 +1,191 @@
+"""Waveform-Peaks für Audio-Fragen, offline vorberechnet.
+
+Pro MP3 entsteht eine Hüllkurve aus ``PEAK_BARS`` Werten (0.0–1.0), ohne zu
+dekodieren: Die Lautstärke eines Granules wird aus dessen ``global_gain``
+(Seiteninformation von Layer III, 1,5 dB pro Schritt) geschätzt, Granules ohne
+Huffman-Daten gelten als Stille. Pro Balken zählt das lauteste Granule, relativ
+zum lautesten der Datei.
+
+Die Peaks liegen pro Board in ``boards/<id>/.peaks.json``, nach SHA-256 des
+Inhalts (aus dem Asset-Sidecar) — umbenannte oder mehrfach genutzte Dateien
+werden nicht neu berechnet. Berechnet wird als Batch über alle Boards mit einem
+Prozess-Pool; ``attach_peaks`` hängt sie beim Laden eines Boards (im I/O-Pool) an
+``Board.asset_meta``, die Frage-Ansicht liest nur noch dort.
+
+Verwendung:
+    python -m waveform_peaks [board_id ...]
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import board_loader
+from asset_meta import AUDIO_SUFFIXES, Mp3Frame, iter_mp3_frames
+from models.models import Board
+
+PEAKS_FILE = ".peaks.json"
+PEAK_BARS = 24
+_PEAKS_VERSION = 1
+_FLOOR_DB = 36.0   # Dynamikumfang der Anzeige unterhalb des lautesten Granules
+
+# Gelesene Peak-Dateien: Pfad -> (mtime_ns, {sha256: peaks})
+_PEAKS_CACHE: dict[str, tuple[int, dict]] = {}
+_peaks_lock = threading.Lock()
+
+
+# -- Analyse ------------------------------------------------------------------
+
+def _granule_gains(data: bytes, frame: Mp3Frame) -> list[int]:
+    """``global_gain`` aller Granules/Kanäle mit Audiodaten (part2_3_length > 0)."""
+    start = frame.offset + 4 + (0 if data[frame.offset + 1] & 0x01 else 2)  # + CRC
+    bits = int.from_bytes(data[start:start + 32], "big")
+    total = 32 * 8
+    nch = frame.channels
+    if frame.mpeg1:
+        base, block, granules = 9 + (5 if nch == 1 else 3) + 4 * nch, 59, 2
+    else:
+        base, block, granules = 8 + (1 if nch == 1 else 2), 63, 1
+
+    def read(pos: int, n: int) -> int:
+        return (bits >> (total - pos - n)) & ((1 << n) - 1)
+
+    gains = []
+    for i in range(granules * nch):
+        pos = base + i * block
+        if read(pos, 12):
+            gains.append(read(pos + 21, 8))
+    return gains
+
+
+def mp3_peaks(data: bytes, bars: int = PEAK_BARS) -> Optional[list[float]]:
+    """Hüllkurve mit ``bars`` Werten (0.0–1.0); None ohne Layer-III-Frames."""
+    levels = []
+    for frame in iter_mp3_frames(data):
+        if frame.layer != 3:
+            continue
+        gains = _granule_gains(data, frame)
+        levels.append(max(gains) if gains else None)
+    if not levels:
+        return None
+    loudest = max((g for g in levels if g is not None), default=None)
+    if loudest is None:
+        return [0.0] * bars
+
+    peaks = []
+    n = len(levels)
+    for b in range(bars):
+        lo = b * n // bars
+        chunk = levels[lo:max((b + 1) * n // bars, lo + 1)]
+        gain = max((g for g in chunk if g is not None), default=None)
+        if gain is None:
+            peaks.append(0.0)
+            continue
+        db = 1.5 * (gain - loudest)
+        peaks.append(round(max(0.0, 1.0 + db / _FLOOR_DB), 3))
+    return peaks
+
+
+def file_peaks(path: str) -> Optional[list[float]]:
+    """Prozess-Pool-Worker: Peaks einer Datei."""
+    try:
+        return mp3_peaks(Path(path).read_bytes())
+    except OSError:
+        return None
+
+
+# -- Speicher / Nachschlagen --------------------------------------------------
+
+def board_peaks(board_dir: Path) -> dict[str, list[float]]:
+    """Peaks eines Boards nach Content-Hash (leer, wenn noch nichts berechnet)."""
+    path = board_dir / PEAKS_FILE
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return {}
+    with _peaks_lock:
+        cached = _PEAKS_CACHE.get(str(path))
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        peaks = {}
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            if raw.get("version") == _PEAKS_VERSION and raw.get("bars") == PEAK_BARS:
+                peaks = raw.get("peaks") or {}
+        except Exception:
+            pass
+        _PEAKS_CACHE[str(path)] = (mtime, peaks)
+        return peaks
+
+
+def peaks_for(asset_path: str) -> Optional[list[float]]:
+    """Vorberechnete Peaks eines aufgelösten Asset-Pfads (wie in Question.assets)."""
+    meta = board_loader.asset_meta(asset_path)
+    if not meta or "sha256" not in meta:
+        return None
+    try:
+        rel = Path(asset_path).relative_to(board_loader.BOARDS_DIR.resolve())
+    except ValueError:
+        return None
+    return board_peaks(board_loader.BOARDS_DIR.resolve() / rel.parts[0]).get(meta["sha256"])
+
+
+def attach_peaks(board: Board) -> None:
+    """Ergänzt ``board.asset_meta`` der Audio-Assets um ihre Peaks, soweit schon
+    berechnet. Liest Dateien — gehört in den I/O-Pool (``async_io.load_board``)."""
+    metas = {}
+    for path, meta in board.asset_meta.items():
+        peaks = peaks_for(path) if Path(path).suffix.lower() in AUDIO_SUFFIXES else None
+        metas[path] = {**meta, "peaks": peaks} if peaks else meta
+    board.asset_meta = metas
+
+
+# -- Batch --------------------------------------------------------------------
+
+def compute_all(board_ids: Optional[list[str]] = None, workers: Optional[int] = None) -> int:
+    """Berechnet fehlende Peaks für alle (bzw. die angegebenen) Boards; gibt die
+    Anzahl neu berechneter Dateien zurück. Bekannte Hashes werden übersprungen."""
+    if board_ids is None:
+        board_ids = list(board_loader.board_catalog())
+    root = board_loader.BOARDS_DIR.resolve()
+
+    # board_dir -> (vorhandene Peaks, {sha256: Pfad} der fehlenden)
+    todo: dict[Path, tuple[dict, dict[str, str]]] = {}
+    for board_id in board_ids:
+        board_dir = root / board_id
+        known = board_peaks(board_dir)
+        audio = {meta["sha256"]: str(board_dir / rel)
+                 for rel, meta in board_loader.board_asset_meta(board_id).items()
+                 if Path(rel).suffix.lower() in AUDIO_SUFFIXES}
+        missing = {sha: path for sha, path in audio.items() if sha not in known}
+        # Hashes, deren Datei es nicht mehr gibt, fliegen raus
+        if missing or known.keys() - audio.keys():
+            todo[board_dir] = ({h: p for h, p in known.items() if h in audio}, missing)
+    jobs = [(board_dir, sha, path) for board_dir, (_, missing) in todo.items() for sha, path in missing.items()]
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(file_peaks, [path for _, _, path in jobs], chunksize=4)
+            for (board_dir, sha, _), peaks in zip(jobs, results):
+                if peaks is not None:
+                    todo[board_dir][0][sha] = peaks
+
+    for board_dir, (peaks, _) in todo.items():
+        board_loader.write_json_atomic(board_dir / PEAKS_FILE,
+                                       {"version": _PEAKS_VERSION, "bars": PEAK_BARS, "peaks": peaks})
+    return len(jobs)
+
+
+def main():
+    board_ids = sys.argv[1:] or None
+    n = compute_all(board_ids, workers=os.cpu_count())
+    print(f"[peaks] {n} Audio-Dateien analysiert")
+
+
+if __name__ == "__main__":
+    main()